@@ -176,6 +176,19 @@ class ChannelPlugin:
             channel.published = True
             channel.save()
 
+    @hookimpl
+    def bulk_resources_upserted(self, resource_ids, resource_type, generate_embeddings):  # noqa: ARG002
+        """
+        Publish channels for the topics of multiple resources
+        """
+        channels = Channel.objects.filter(
+            topic_detail__topic__learningresource__id__in=resource_ids,
+            published=False,
+        ).distinct()
+        for channel in channels:
+            channel.published = True
+            channel.save()
+
     @hookimpl
     def resource_before_delete(self, resource):
         """
@@ -226,3 +226,32 @@ def test_resource_upserted():
     assert channel1.published is True
     assert channel2.published is True
     assert channel3.published is False
+
+
+@pytest.mark.django_db
+def test_bulk_resources_upserted():
+    """
+    Test that channels are published for the topics of every upserted resource
+    """
+    channel1 = ChannelFactory.create(is_topic=True, published=False)
+    channel2 = ChannelFactory.create(is_topic=True, published=False)
+    channel3 = ChannelFactory.create(is_topic=True, published=False)
+
+    resources = [
+        LearningResourceFactory.create(topics=[channel1.topic_detail.topic]),
+        LearningResourceFactory.create(
+            topics=[channel1.topic_detail.topic, channel2.topic_detail.topic]
+        ),
+    ]
+    ChannelPlugin().bulk_resources_upserted(
+        [resource.id for resource in resources],
+        resources[0].resource_type,
+        generate_embeddings=False,
+    )
+    channel1.refresh_from_db()
+    channel2.refresh_from_db()
+    channel3.refresh_from_db()
+
+    assert channel1.published is True
+    assert channel2.published is True
+    assert channel3.published is False
@@ -43,6 +43,16 @@ def _use_dummy_redis_cache_backend(settings):
     new_cache_settings["redis"] = {
         "BACKEND": "django.core.cache.backends.dummy.DummyCache",
     }
+    new_cache_settings["embeddings"] = {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
+    new_cache_settings["search_documents"] = {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
+    # the in-process tier would otherwise carry responses across tests
+    new_cache_settings["views_local"] = {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
     settings.CACHES = new_cache_settings
 
 
@@ -1,4 +1,6 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Annotated
 
 import litellm
@@ -18,12 +20,27 @@ from learning_resources.models import (
     ContentSummarizerConfiguration,
 )
 from learning_resources.utils import sanitize_llm_text, truncate_to_tokens
+from main.utils import now_in_utc
 
 logger = logging.getLogger(__name__)
 
 # drop unsupported model params
 litellm.drop_params = True
 
+# Per-model caps on in-flight LLM requests, shared by every summarizer in the process
+_model_request_slots: dict[str, threading.BoundedSemaphore] = {}
+_model_request_slots_lock = threading.Lock()
+
+
+def _model_request_slot(llm_model: str) -> threading.BoundedSemaphore:
+    """Return the semaphore limiting concurrent requests to llm_model"""
+    with _model_request_slots_lock:
+        if llm_model not in _model_request_slots:
+            _model_request_slots[llm_model] = threading.BoundedSemaphore(
+                settings.CONTENT_SUMMARIZER_MAX_REQUESTS_PER_MODEL
+            )
+        return _model_request_slots[llm_model]
+
 
 class Flashcard(TypedDict):
     """Flashcard structure model"""
@@ -43,6 +60,17 @@ class ContentSummarizer:
     A service class to generate summaries and flashcards for the ContentFiles.
     """
 
+    def _get_summarizer_config(
+        self, content_file: ContentFile
+    ) -> ContentSummarizerConfiguration | None:
+        """Get the summarizer configuration of the content file's platform"""
+        platform = (
+            content_file.run.learning_resource.platform
+            if content_file.run
+            else content_file.learning_resource.platform
+        )
+        return getattr(platform, "summarizer_config", None)
+
     def _can_process_content_file(self, content_file: ContentFile) -> bool:
         """Check if a content file can be processed
         Args:
@@ -55,12 +83,7 @@ class ContentSummarizer:
             # Summarizer needs content to process, if there is no content then skip
             return False
 
-        platform = (
-            content_file.run.learning_resource.platform
-            if content_file.run
-            else content_file.learning_resource.platform
-        )
-        summarizer_config = getattr(platform, "summarizer_config", None)
+        summarizer_config = self._get_summarizer_config(content_file)
 
         if not summarizer_config or not summarizer_config.is_active:
             return False
@@ -137,6 +160,12 @@ class ContentSummarizer:
     ) -> list[str]:
         """Process multiple content files by id.
 
+        The content is read without locking, and the summary and flashcards
+        requests for every file run concurrently on a thread pool, capped per
+        model by CONTENT_SUMMARIZER_MAX_REQUESTS_PER_MODEL. Results are written
+        back in short batched transactions, only to files whose content checksum
+        has not changed in the meantime.
+
         Args:
             - ids (list[int]): List of content file ids to process
             - overwrite (bool): Whether to overwrite existing summary and flashcards
@@ -144,13 +173,73 @@ class ContentSummarizer:
         Returns:
             - list[str]: List of status messages for each content file
         """
-        status_messages = []
-        for content_file_id in content_file_ids:
-            status_msg = self.summarize_single_content_file(
-                content_file_id, overwrite=overwrite
-            )
-            status_messages.append(status_msg)
-        return status_messages
+        content_files = ContentFile.objects.select_related(
+            "run__learning_resource__platform__summarizer_config",
+            "learning_resource__platform__summarizer_config",
+        ).in_bulk(content_file_ids)
+        status_messages = {}
+        pending = {}
+        generated = {}
+        with ThreadPoolExecutor(
+            max_workers=settings.CONTENT_SUMMARIZER_MAX_WORKERS
+        ) as executor:
+            for content_file_id in content_file_ids:
+                content_file = content_files.get(content_file_id)
+                if content_file is None or not self._can_process_content_file(
+                    content_file
+                ):
+                    status_messages[content_file_id] = (
+                        f"Summarization skipped for CONTENT_FILE_ID: {content_file_id}"
+                    )
+                    continue
+                llm_model = self._get_summarizer_config(content_file).llm_model
+                requests = {}
+                if overwrite or not content_file.summary:
+                    requests["summary"] = executor.submit(
+                        self._generate_with_model_limit,
+                        self._generate_summary,
+                        content_file.content,
+                        llm_model,
+                    )
+                if overwrite or not content_file.flashcards:
+                    requests["flashcards"] = executor.submit(
+                        self._generate_with_model_limit,
+                        self._generate_flashcards,
+                        content_file.content,
+                        llm_model,
+                    )
+                if not requests:
+                    status_messages[content_file_id] = (
+                        f"Summarization succeeded for CONTENT_FILE_ID: {content_file_id}"  # noqa: E501
+                    )
+                    continue
+                pending[content_file_id] = (content_file.checksum, requests)
+
+            futures = {
+                future: content_file_id
+                for content_file_id, (_, requests) in pending.items()
+                for future in requests.values()
+            }
+            for future in as_completed(futures):
+                content_file_id = futures[future]
+                if content_file_id not in pending or not all(
+                    request.done() for request in pending[content_file_id][1].values()
+                ):
+                    # Already collected, or still waiting on its other request
+                    continue
+                checksum, requests = pending.pop(content_file_id)
+                fields, status_messages[content_file_id] = self._collect_results(
+                    content_file_id, requests
+                )
+                if fields:
+                    generated[content_file_id] = (checksum, fields)
+                if len(generated) >= settings.CONTENT_SUMMARIZER_SAVE_BATCH_SIZE:
+                    self._save_generated_content(generated, status_messages)
+                    generated = {}
+        self._save_generated_content(generated, status_messages)
+        return [
+            status_messages[content_file_id] for content_file_id in content_file_ids
+        ]
 
     def summarize_single_content_file(
         self,
@@ -165,49 +254,85 @@ class ContentSummarizer:
         Returns:
             - str: A string message indicating the status of the summarization
         """
-        try:
-            with transaction.atomic():
-                # Generate summary and flashcards using platform specified LLM model
-                content_file = ContentFile.objects.select_for_update().get(
-                    id=content_file_id
-                )
-                # Process only if the content file passes the summarizer config filter
-                updated = False
-                if self._can_process_content_file(content_file):
-                    llm_model = content_file.run.learning_resource.platform.summarizer_config.llm_model  # noqa: E501
-                    if overwrite or not content_file.summary:
-                        summary = self._generate_summary(
-                            content_file.content, llm_model
-                        )
-                        content_file.summary = summary
-                        updated = True
-                    if overwrite or not content_file.flashcards:
-                        flashcards = self._generate_flashcards(
-                            content_file.content, llm_model
-                        )
-                        content_file.flashcards = flashcards
-                        updated = True
-
-                    if updated:
-                        content_file.save()
-                    return f"Summarization succeeded for CONTENT_FILE_ID: {content_file_id}"  # noqa: E501
-                return f"Summarization skipped for CONTENT_FILE_ID: {content_file_id}"
-        except SummaryGenerationError as exc:
+        return self.summarize_content_files_by_ids(
+            [content_file_id], overwrite=overwrite
+        )[0]
+
+    def _generate_with_model_limit(self, generate, content: str, llm_model: str):
+        """Call a generate method once a request slot for llm_model is free"""
+        with _model_request_slot(llm_model):
+            return generate(content, llm_model)
+
+    def _collect_results(self, content_file_id: int, requests: dict) -> tuple:
+        """Gather the finished summary/flashcards requests of a content file
+        Args:
+            - content_file_id (int): Id of the content file
+            - requests (dict): Futures of the summary and/or flashcards requests
+        Returns:
+            - tuple(dict, str): The fields to save and the status message
+        """
+        fields = {
+            field: request.result()
+            for field, request in requests.items()
+            if request.exception() is None
+        }
+        summary_error = (
+            requests["summary"].exception() if "summary" in requests else None
+        )
+        flashcards_error = (
+            requests["flashcards"].exception() if "flashcards" in requests else None
+        )
+        if isinstance(summary_error, SummaryGenerationError):
             # Log and return a specific readable error message when summary
             # generation fails.
-            logger.exception("Error processing content: %d", content_file.id)
-            return f"Summary generation failed for CONTENT_FILE_ID: {content_file_id}\nError: {exc.args[0]}\n\n"  # noqa: E501
-        except FlashcardsGenerationError as exc:
-            # Log and return a specific readable error message when flashcards
+            logger.exception(
+                "Error processing content: %d",
+                content_file_id,
+                exc_info=summary_error,
+            )
+            status = f"Summary generation failed for CONTENT_FILE_ID: {content_file_id}\nError: {summary_error.args[0]}\n\n"  # noqa: E501
+        elif isinstance(flashcards_error, FlashcardsGenerationError):
+            # Return a specific readable error message when flashcards
             # generation fails.
-            return f"Flashcards generation failed for CONTENT_FILE_ID: {content_file_id}\nError: {exc.args[0]}\n\n"  # noqa: E501
-        except Exception as exc:
-            # Log and return a specific readable error message when an  unknown
+            status = f"Flashcards generation failed for CONTENT_FILE_ID: {content_file_id}\nError: {flashcards_error.args[0]}\n\n"  # noqa: E501
+        elif summary_error or flashcards_error:
+            # Log and return a specific readable error message when an unknown
             # error occurs.
-            logger.exception("Error processing content: %d", content_file.id)
-            return (
-                f"Summarization failed for CONTENT_FILE_ID: {content_file_id}\nError: {exc.args[0]}\n\n",  # noqa: E501
+            error = summary_error or flashcards_error
+            logger.exception(
+                "Error processing content: %d", content_file_id, exc_info=error
             )
+            status = f"Summarization failed for CONTENT_FILE_ID: {content_file_id}\nError: {error}\n\n"  # noqa: E501
+        else:
+            status = f"Summarization succeeded for CONTENT_FILE_ID: {content_file_id}"
+        return fields, status
+
+    def _save_generated_content(
+        self, generated: dict[int, tuple[str | None, dict]], status_messages: dict
+    ):
+        """Save generated summaries and flashcards in one short transaction
+        Args:
+            - generated (dict): (checksum, fields) to save by content file id
+            - status_messages (dict): Status messages by content file id, updated
+            for files whose content changed while they were being summarized.
+            Those are reported as failed, so callers retry them.
+        """
+        if not generated:
+            return
+        updated_on = now_in_utc()
+        with transaction.atomic():
+            for content_file_id, (checksum, fields) in generated.items():
+                if not ContentFile.objects.filter(
+                    id=content_file_id, checksum=checksum
+                ).update(**fields, updated_on=updated_on):
+                    logger.info(
+                        "Content changed during summarization, not saving: %d",
+                        content_file_id,
+                    )
+                    status_messages[content_file_id] = (
+                        f"Summarization failed for CONTENT_FILE_ID: {content_file_id}\n"
+                        "Error: content changed during summarization\n\n"
+                    )
 
     def _get_llm(self, model=None, temperature=0.0, max_tokens=1000) -> ChatLiteLLM:
         """Get the ChatLiteLLM instance"""
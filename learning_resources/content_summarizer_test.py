@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from learning_resources.constants import (
@@ -17,6 +19,7 @@ from learning_resources.factories import (
     LearningResourceRunFactory,
 )
 from learning_resources.models import ContentFile
+from main.test_utils import ConcurrencyProbe
 
 pytestmark = pytest.mark.django_db
 
@@ -26,14 +29,6 @@ def setup_settings(settings):
     settings.LITELLM_API_BASE = "https://test/api/"
 
 
-@pytest.fixture
-def mock_summarize_single_content_file(mocker):
-    """Fixture for mocking the process single file method"""
-    return mocker.patch(
-        "learning_resources.content_summarizer.ContentSummarizer.summarize_single_content_file"
-    )
-
-
 @pytest.mark.parametrize(
     (
         "content",
@@ -301,22 +296,125 @@ def test_get_unprocessed_content_file_ids_with_multiple_configs():
     assert file2.id in unprocessed_file_ids
 
 
-def test_summarize_content_files_by_ids(
-    processable_content_files, mock_summarize_single_content_file
-):
+def test_summarize_content_files_by_ids(mocker, processable_content_files):
     """The summarizer should process content files that are processable and return the status results"""
+    mocker.patch.object(
+        ContentSummarizer, "_generate_summary", return_value="This is a test summary"
+    )
+    mocker.patch.object(
+        ContentSummarizer,
+        "_generate_flashcards",
+        return_value=[{"question": "question", "answer": "answer"}],
+    )
+    unprocessable_file = ContentFileFactory.create(content="")
+    content_file_ids = [
+        content_file.id for content_file in processable_content_files
+    ] + [unprocessable_file.id]
+
     summarizer = ContentSummarizer()
     results = summarizer.summarize_content_files_by_ids(
+        overwrite=False, content_file_ids=content_file_ids
+    )
+
+    assert results == [
+        f"Summarization succeeded for CONTENT_FILE_ID: {content_file.id}"
+        for content_file in processable_content_files
+    ] + [f"Summarization skipped for CONTENT_FILE_ID: {unprocessable_file.id}"]
+    for content_file in processable_content_files:
+        content_file.refresh_from_db()
+        assert content_file.summary == "This is a test summary"
+        assert content_file.flashcards == [{"question": "question", "answer": "answer"}]
+
+
+def test_summarize_content_files_by_ids_concurrent_requests(
+    mocker, settings, processable_content_files
+):
+    """Summary and flashcards requests for different files should overlap"""
+    settings.CONTENT_SUMMARIZER_MAX_WORKERS = 6
+    settings.CONTENT_SUMMARIZER_MAX_REQUESTS_PER_MODEL = 6
+    mocker.patch.dict(
+        "learning_resources.content_summarizer._model_request_slots", clear=True
+    )
+    # Every request waits for all the others, so they must all be in flight at once
+    barrier = threading.Barrier(2 * len(processable_content_files), timeout=5)
+
+    def generate(*_args):
+        barrier.wait()
+        return "generated"
+
+    mocker.patch.object(ContentSummarizer, "_generate_summary", side_effect=generate)
+    mocker.patch.object(ContentSummarizer, "_generate_flashcards", side_effect=generate)
+
+    results = ContentSummarizer().summarize_content_files_by_ids(
+        [content_file.id for content_file in processable_content_files],
         overwrite=False,
-        content_file_ids=[
-            content_file.id for content_file in processable_content_files
-        ],
     )
-    assert mock_summarize_single_content_file.call_count == len(
-        processable_content_files
+
+    assert all("succeeded" in result for result in results)
+
+
+def test_summarize_content_files_by_ids_model_request_limit(
+    mocker, settings, processable_content_files
+):
+    """Concurrent requests to one model should be capped"""
+    settings.CONTENT_SUMMARIZER_MAX_WORKERS = 6
+    settings.CONTENT_SUMMARIZER_MAX_REQUESTS_PER_MODEL = 2
+    mocker.patch.dict(
+        "learning_resources.content_summarizer._model_request_slots", clear=True
+    )
+    probe = ConcurrencyProbe(2)
+    generate = probe(lambda *_args: "generated")
+
+    mocker.patch.object(ContentSummarizer, "_generate_summary", side_effect=generate)
+    mocker.patch.object(ContentSummarizer, "_generate_flashcards", side_effect=generate)
+
+    ContentSummarizer().summarize_content_files_by_ids(
+        [content_file.id for content_file in processable_content_files],
+        overwrite=False,
+    )
+
+    assert probe.peak == 2
+
+
+def test_summarize_content_files_by_ids_content_changed(
+    mocker, processable_content_files
+):
+    """Results should not be saved over content that changed while summarizing"""
+    changed_file, unchanged_file = processable_content_files[:2]
+
+    def can_process(content_file):
+        if content_file.id == changed_file.id:
+            # The content is updated after the summarizer has read it
+            ContentFile.objects.filter(id=changed_file.id).update(
+                content="New content", checksum="new checksum"
+            )
+        return True
+
+    mocker.patch.object(
+        ContentSummarizer, "_can_process_content_file", side_effect=can_process
+    )
+    mocker.patch.object(
+        ContentSummarizer, "_generate_summary", return_value="This is a test summary"
+    )
+    mocker.patch.object(ContentSummarizer, "_generate_flashcards", return_value=[])
+
+    results = ContentSummarizer().summarize_content_files_by_ids(
+        [changed_file.id, unchanged_file.id], overwrite=False
     )
-    assert isinstance(results, list)
-    assert len(results) == len(processable_content_files)
+
+    assert results == [
+        (
+            f"Summarization failed for CONTENT_FILE_ID: {changed_file.id}\n"
+            "Error: content changed during summarization\n\n"
+        ),
+        f"Summarization succeeded for CONTENT_FILE_ID: {unchanged_file.id}",
+    ]
+    updated_on = unchanged_file.updated_on
+    changed_file.refresh_from_db()
+    unchanged_file.refresh_from_db()
+    assert changed_file.summary == ""
+    assert unchanged_file.summary == "This is a test summary"
+    assert unchanged_file.updated_on > updated_on
 
 
 def test_summarize_single_content_file(mocker, processable_content_files):
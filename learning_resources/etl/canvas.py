@@ -1,5 +1,4 @@
 import logging
-import zipfile
 from collections.abc import Generator
 from datetime import datetime
 from pathlib import Path
@@ -15,11 +14,13 @@ from learning_resources.constants import (
     PlatformType,
 )
 from learning_resources.etl.canvas_utils import (
+    CanvasArchive,
     canvas_course_checksum,
     canvas_course_folder,
     canvas_course_url,
     canvas_url_config,
     get_published_items,
+    open_canvas_archive,
     parse_canvas_settings,
 )
 from learning_resources.etl.constants import ETLSource
@@ -56,71 +57,74 @@ def sync_canvas_archive(bucket, key: str, overwrite):
         course_archive_path = Path(export_tempdir, key.rsplit("/", maxsplit=1)[-1])
         bucket.download_file(key, course_archive_path)
         url_config = canvas_url_config(bucket, export_tempdir, url_config_file)
-        checksum = canvas_course_checksum(course_archive_path, url_config)
-        resource_readable_id, run = run_for_canvas_archive(
-            course_archive_path,
-            course_folder=course_folder,
-            checksum=checksum,
-            overwrite=overwrite,
-        )
-        if run:
-            failed_content_keys = []
-            canvas_content_files = list(
-                transform_canvas_content_files(
-                    course_archive_path,
+        # one archive shared by every parser, so the zip is opened and its
+        # manifest, settings and published items are parsed once per sync
+        with CanvasArchive(course_archive_path) as course_archive:
+            checksum = canvas_course_checksum(course_archive, url_config)
+            resource_readable_id, run = run_for_canvas_archive(
+                course_archive,
+                course_folder=course_folder,
+                checksum=checksum,
+                overwrite=overwrite,
+            )
+            if run:
+                failed_content_keys = []
+                canvas_content_files = list(
+                    transform_canvas_content_files(
+                        course_archive,
+                        run,
+                        url_config=url_config,
+                        overwrite=overwrite,
+                        failed_keys=failed_content_keys,
+                    )
+                )
+                content_files_ids = load_content_files(
                     run,
-                    url_config=url_config,
-                    overwrite=overwrite,
+                    canvas_content_files,
                     failed_keys=failed_content_keys,
                 )
-            )
-            content_files_ids = load_content_files(
-                run,
-                canvas_content_files,
-                failed_keys=failed_content_keys,
-            )
 
-            failed_problem_paths = []
-            canvas_problem_files = list(
-                transform_canvas_problem_files(
-                    course_archive_path,
+                failed_problem_paths = []
+                canvas_problem_files = list(
+                    transform_canvas_problem_files(
+                        course_archive,
+                        run,
+                        overwrite=overwrite,
+                        failed_source_paths=failed_problem_paths,
+                    )
+                )
+                problem_files_ids = load_problem_files(
                     run,
-                    overwrite=overwrite,
+                    canvas_problem_files,
                     failed_source_paths=failed_problem_paths,
                 )
-            )
-            problem_files_ids = load_problem_files(
-                run,
-                canvas_problem_files,
-                failed_source_paths=failed_problem_paths,
-            )
-            content_loaded = content_files_ids or not canvas_content_files
-            # load_problem_file swallows per-file errors and returns None
-            problems_loaded = any(problem_files_ids) or not canvas_problem_files
-            # extraction failures are judged course-wide: a partial failure
-            # (anything loaded) still stamps, but if every file failed the
-            # course must not masquerade as legitimately empty
-            anything_loaded = bool(content_files_ids) or any(problem_files_ids)
-            all_extractions_failed = (
-                bool(failed_content_keys or failed_problem_paths)
-                and not anything_loaded
-            )
-            if content_loaded and problems_loaded and not all_extractions_failed:
-                # a failed or empty load must be retried on the next sync, so
-                # only mark processed once everything loaded (or was unpublished)
-                run.checksum = checksum
-                run.save(update_fields=["checksum"])
+                content_loaded = content_files_ids or not canvas_content_files
+                # load_problem_file swallows per-file errors and returns None
+                problems_loaded = any(problem_files_ids) or not canvas_problem_files
+                # extraction failures are judged course-wide: a partial failure
+                # (anything loaded) still stamps, but if every file failed the
+                # course must not masquerade as legitimately empty
+                anything_loaded = bool(content_files_ids) or any(problem_files_ids)
+                all_extractions_failed = (
+                    bool(failed_content_keys or failed_problem_paths)
+                    and not anything_loaded
+                )
+                if content_loaded and problems_loaded and not all_extractions_failed:
+                    # a failed or empty load must be retried on the next sync, so
+                    # only mark processed once everything loaded (or was unpublished)
+                    run.checksum = checksum
+                    run.save(update_fields=["checksum"])
 
     return resource_readable_id
 
 
-def run_for_canvas_archive(course_archive_path, course_folder, checksum, overwrite):
+def run_for_canvas_archive(course_archive, course_folder, checksum, overwrite):
     """
     Generate and return a LearningResourceRun for a Canvas course
     """
-    course_info = parse_canvas_settings(course_archive_path)
+    course_info = parse_canvas_settings(course_archive)
     course_title = course_info.get("title", f"canvas course {course_folder}")
-    url = canvas_course_url(course_archive_path)
+    url = canvas_course_url(course_archive)
     start_at = course_info.get("start_at")
     end_at = course_info.get("conclude_at")
     if start_at:
@@ -191,7 +195,7 @@ def run_for_canvas_archive(course_archive_path, course_folder, checksum, overwri
 
 
 def transform_canvas_content_files(
-    course_zipfile: Path,
+    course_zipfile: Path | CanvasArchive,
     run: LearningResourceRun,
     url_config: dict,
     *,
@@ -204,22 +208,39 @@ def transform_canvas_content_files(
     Files whose extraction fails are skipped and their existing records
     are retained (not deleted/unpublished).
     """
-    basedir = course_zipfile.name.split(".")[0]
-    zipfile_path = course_zipfile.absolute()
-    published_items = get_published_items(zipfile_path, url_config)
+    with open_canvas_archive(course_zipfile) as course_archive:
+        yield from _transform_canvas_content_files(
+            course_archive,
+            run,
+            url_config,
+            overwrite=overwrite,
+            failed_keys=failed_keys,
+        )
+
+
+def _transform_canvas_content_files(
+    course_archive: CanvasArchive,
+    run: LearningResourceRun,
+    url_config: dict,
+    *,
+    overwrite,
+    failed_keys: list | None,
+) -> Generator[dict, None, None]:
+    """
+    Transform published content files from an open Canvas course archive
+    """
+    basedir = course_archive.path.name.split(".")[0]
+    published_items = get_published_items(course_archive, url_config)
 
     failed_source_paths = []
 
     def _generate_content():
         """Inner generator for yielding content data"""
-        with (
-            TemporaryDirectory(prefix=basedir) as olx_path,
-            zipfile.ZipFile(zipfile_path, "r") as course_archive,
-        ):
-            for member in course_archive.infolist():
+        with TemporaryDirectory(prefix=basedir) as olx_path:
+            for member in course_archive.zipfile.infolist():
                 member_path = Path(member.filename).resolve()
                 if member_path in published_items:
-                    course_archive.extract(member, path=olx_path)
+                    course_archive.zipfile.extract(member, path=olx_path)
                     log.debug("processing active file %s", member.filename)
                 else:
                     log.debug("skipping unpublished file %s", member.filename)
@@ -268,7 +289,7 @@ def transform_canvas_content_files(
 
 
 def transform_canvas_problem_files(
-    course_zipfile: Path,
+    course_zipfile: Path | CanvasArchive,
     run: LearningResourceRun,
     *,
     overwrite,
@@ -280,14 +301,13 @@ def transform_canvas_problem_files(
     Files whose extraction fails are skipped and their existing records
     are retained (not deleted/unpublished).
     """
-    basedir = course_zipfile.name.split(".")[0]
     with (
-        TemporaryDirectory(prefix=basedir) as olx_path,
-        zipfile.ZipFile(course_zipfile.absolute(), "r") as course_archive,
+        open_canvas_archive(course_zipfile) as course_archive,
+        TemporaryDirectory(prefix=course_archive.path.name.split(".")[0]) as olx_path,
     ):
-        for member in course_archive.infolist():
+        for member in course_archive.zipfile.infolist():
             if member.filename.startswith(settings.CANVAS_TUTORBOT_FOLDER):
-                course_archive.extract(member, path=olx_path)
+                course_archive.zipfile.extract(member, path=olx_path)
                 log.debug("processing active problem set file %s", member.filename)
         for file_data in process_olx_path(
             olx_path,
@@ -11,6 +11,7 @@ from defusedxml import ElementTree
 from freezegun import freeze_time
 
 from learning_resources.constants import LearningResourceType, PlatformType
+from learning_resources.etl import canvas_utils
 from learning_resources.etl.canvas import (
     run_for_canvas_archive,
     sync_canvas_archive,
@@ -18,6 +19,7 @@ from learning_resources.etl.canvas import (
     transform_canvas_problem_files,
 )
 from learning_resources.etl.canvas_utils import (
+    CanvasArchive,
     _compact_element,
     canvas_course_checksum,
     canvas_course_folder,
@@ -2664,3 +2666,37 @@ def test_sync_canvas_archive_partial_problem_failure_still_stamps(mocker, sync_m
     )
 
     assert _canvas_run(readable_id).checksum
+
+
+def test_sync_canvas_archive_opens_and_parses_archive_once(mocker, sync_mocks):
+    """A sync opens the archive and parses its manifest and settings once"""
+    open_spy = mocker.spy(CanvasArchive, "__init__")
+    read_spy = mocker.spy(CanvasArchive, "read")
+    manifest_spy = mocker.spy(canvas_utils, "extract_resources_by_identifier")
+
+    sync_canvas_archive(
+        sync_mocks.bucket, "canvas/course_content/1/abc.imscc", overwrite=False
+    )
+
+    assert open_spy.call_count == 1
+    assert manifest_spy.call_count == 1
+    read_files = [call.args[1] for call in read_spy.call_args_list]
+    assert read_files.count("imsmanifest.xml") == 1
+    assert read_files.count("course_settings/course_settings.xml") == 1
+
+
+def test_canvas_archive_matches_archive_path(tmp_path):
+    """Parsing through a CanvasArchive gives the same results as by path"""
+    zip_path = make_timed_lock_zip(tmp_path, UNLOCKED)
+
+    with CanvasArchive(zip_path) as course_archive:
+        assert parse_canvas_settings(course_archive) == parse_canvas_settings(zip_path)
+        assert get_published_items(course_archive, {}) == get_published_items(
+            zip_path, {}
+        )
+        assert get_published_items(course_archive, {}) is get_published_items(
+            course_archive, {}
+        )
+        assert canvas_course_checksum(course_archive, {}) == canvas_course_checksum(
+            zip_path, {}
+        )
@@ -4,7 +4,9 @@ import os
 import sys
 import zipfile
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import UTC
+from functools import cached_property, wraps
 from hashlib import md5
 from pathlib import Path
 from urllib.parse import unquote, unquote_plus
@@ -36,6 +38,101 @@ NAMESPACES = {
     "lomimscc": "http://ltsc.ieee.org/xsd/imsccv1p1/LOM/manifest",
 }
 
+MANIFEST_PATH = "imsmanifest.xml"
+
+
+class CanvasArchive:
+    """
+    A Canvas course archive opened once for a sync
+
+    The zip member table and the imsmanifest.xml resource maps are read on
+    first use, and the parse_* functions and get_published_items memoize their
+    results here, so passing one CanvasArchive to all of them reads and parses
+    each file in the archive at most once. Memoized results are shared and
+    must not be mutated.
+    """
+
+    def __init__(self, course_archive_path):
+        """Open the archive at course_archive_path"""
+        self.path = Path(course_archive_path)
+        self.zipfile = zipfile.ZipFile(course_archive_path, "r")
+        self.parsed = {}
+
+    def __enter__(self):
+        """Use the archive as a context manager that closes it on exit"""
+        return self
+
+    def __exit__(self, *args):
+        """Close the archive"""
+        self.close()
+
+    def close(self):
+        """Close the underlying zip file"""
+        self.zipfile.close()
+
+    @cached_property
+    def members(self) -> dict[str, zipfile.ZipInfo]:
+        """Zip members by filename"""
+        return {info.filename: info for info in self.zipfile.infolist()}
+
+    def read(self, filename: str) -> bytes:
+        """Read a member of the archive"""
+        return self.zipfile.read(filename)
+
+    @cached_property
+    def manifest_xml(self) -> bytes | None:
+        """The imsmanifest.xml contents, or None if the archive has none"""
+        if MANIFEST_PATH not in self.members:
+            return None
+        return self.read(MANIFEST_PATH)
+
+    @cached_property
+    def resources_by_identifier(self) -> dict:
+        """Manifest resources keyed by identifier"""
+        if self.manifest_xml is None:
+            return {}
+        return extract_resources_by_identifier(self.manifest_xml)
+
+    @cached_property
+    def resources_by_identifierref(self) -> dict:
+        """Manifest resources keyed by the identifierref of their items"""
+        if self.manifest_xml is None:
+            return {}
+        return extract_resources_by_identifierref(self.manifest_xml)
+
+
+@contextmanager
+def open_canvas_archive(course_archive):
+    """
+    Yield course_archive if it is already a CanvasArchive, otherwise open the
+    archive at that path for the duration of the block
+    """
+    if isinstance(course_archive, CanvasArchive):
+        yield course_archive
+    else:
+        with CanvasArchive(course_archive) as archive:
+            yield archive
+
+
+def canvas_archive_parser(func):
+    """
+    Let a parser take a CanvasArchive or an archive path as its first argument,
+    memoizing its result on the CanvasArchive by the remaining arguments
+    """
+
+    @wraps(func)
+    def wrapper(course_archive, *args, **kwargs):
+        with open_canvas_archive(course_archive) as archive:
+            key = (
+                func.__name__,
+                json.dumps([args, kwargs], sort_keys=True, default=str),
+            )
+            if key not in archive.parsed:
+                archive.parsed[key] = func(archive, *args, **kwargs)
+            return archive.parsed[key]
+
+    return wrapper
+
 
 def is_file_published(file_meta: dict) -> bool:
     """
@@ -66,18 +163,17 @@ def is_file_published(file_meta: dict) -> bool:
     return False
 
 
-def parse_files_meta(course_archive_path: str) -> dict:
+@canvas_archive_parser
+def parse_files_meta(course_archive: CanvasArchive) -> dict:
     """
     Parse course_settings/files_meta.xml and return publish/active status of resources.
     """
     publish_status = {"active": [], "unpublished": []}
-    with zipfile.ZipFile(course_archive_path, "r") as course_archive:
-        files_meta_path = "course_settings/files_meta.xml"
-        if files_meta_path not in course_archive.namelist():
-            return publish_status
-        files_xml = course_archive.read(files_meta_path)
-        manifest_xml = course_archive.read("imsmanifest.xml")
-    resource_map = extract_resources_by_identifier(manifest_xml)
+    files_meta_path = "course_settings/files_meta.xml"
+    if files_meta_path not in course_archive.members:
+        return publish_status
+    files_xml = course_archive.read(files_meta_path)
+    resource_map = course_archive.resources_by_identifier
     root = ElementTree.fromstring(files_xml)
     try:
         for file_elem in root.findall(".//cccv1p0:file", NAMESPACES):
@@ -112,17 +208,16 @@ def parse_files_meta(course_archive_path: str) -> dict:
     return publish_status
 
 
-def parse_module_meta(course_archive_path: str) -> dict:
+@canvas_archive_parser
+def parse_module_meta(course_archive: CanvasArchive) -> dict:
     """
     Parse module_meta.xml and return publish/active status of resources.
     """
 
-    with zipfile.ZipFile(course_archive_path, "r") as course_archive:
-        if "course_settings/module_meta.xml" not in course_archive.namelist():
-            return {"active": [], "unpublished": []}
-        module_xml = course_archive.read("course_settings/module_meta.xml")
-        manifest_xml = course_archive.read("imsmanifest.xml")
-    resource_map = extract_resources_by_identifierref(manifest_xml)
+    if "course_settings/module_meta.xml" not in course_archive.members:
+        return {"active": [], "unpublished": []}
+    module_xml = course_archive.read("course_settings/module_meta.xml")
+    resource_map = course_archive.resources_by_identifierref
     publish_status = {"active": [], "unpublished": []}
     try:
         root = ElementTree.fromstring(module_xml)
@@ -260,13 +355,14 @@ def _title_from_assignment_settings(xml_string: str) -> str:
     return title_elem.text.strip() if title_elem is not None and title_elem.text else ""
 
 
-def parse_web_content(course_archive_path: str) -> dict:
+@canvas_archive_parser
+def parse_web_content(course_archive: CanvasArchive) -> dict:
     """
     Parse html pages and assignments and return publish/active status of resources
     """
 
     publish_status = {"active": [], "unpublished": []}
-    course_settings = parse_canvas_settings(course_archive_path)
+    course_settings = parse_canvas_settings(course_archive)
     public_syllabus_setting = course_settings.get("public_syllabus", "true").lower()
     public_syllabus_to_auth_setting = course_settings.get(
         "public_syllabus_to_auth", "true"
@@ -277,65 +373,62 @@ def parse_web_content(course_archive_path: str) -> dict:
         and public_syllabus_to_auth_setting == "false"
     ):
         ingest_syllabus = False
-    with zipfile.ZipFile(course_archive_path, "r") as course_archive:
-        manifest_path = "imsmanifest.xml"
-        if manifest_path not in course_archive.namelist():
-            return publish_status
-        manifest_xml = course_archive.read(manifest_path)
-        resource_map = extract_resources_by_identifier(manifest_xml)
-
-        for item in resource_map:
-            resource_map_item = resource_map[item]
-            item_link = resource_map_item.get("href")
-            assignment_settings = None
-            for file in resource_map_item.get("files", []):
-                if file.endswith("assignment_settings.xml"):
-                    assignment_settings = file
-            if item_link and item_link.endswith(".html"):
-                file_path = resource_map_item["href"]
-                html_content = course_archive.read(file_path)
-                embedded_files = _embedded_files_from_html(html_content)
-                if assignment_settings:
-                    xml_content = course_archive.read(assignment_settings)
-                    workflow_state = _workflow_state_from_xml(xml_content)
-                    title = _title_from_assignment_settings(xml_content)
-                    canvas_type = "assignment"
-                else:
-                    workflow_state = _workflow_state_from_html(html_content)
-                    title = _title_from_html(html_content)
-                    canvas_type = "page"
-
-                lom_elem = (
-                    resource_map_item.get("metadata", {})
-                    .get("lom", {})
-                    .get("educational", {})
+    if course_archive.manifest_xml is None:
+        return publish_status
+    resource_map = course_archive.resources_by_identifier
+
+    for item in resource_map:
+        resource_map_item = resource_map[item]
+        item_link = resource_map_item.get("href")
+        assignment_settings = None
+        for file in resource_map_item.get("files", []):
+            if file.endswith("assignment_settings.xml"):
+                assignment_settings = file
+        if item_link and item_link.endswith(".html"):
+            file_path = resource_map_item["href"]
+            html_content = course_archive.read(file_path)
+            embedded_files = _embedded_files_from_html(html_content)
+            if assignment_settings:
+                xml_content = course_archive.read(assignment_settings)
+                workflow_state = _workflow_state_from_xml(xml_content)
+                title = _title_from_assignment_settings(xml_content)
+                canvas_type = "assignment"
+            else:
+                workflow_state = _workflow_state_from_html(html_content)
+                title = _title_from_html(html_content)
+                canvas_type = "page"
+
+            lom_elem = (
+                resource_map_item.get("metadata", {})
+                .get("lom", {})
+                .get("educational", {})
+            )
+            # Determine if the content is intended for authors or instructors only
+            intended_role = lom_elem.get("intendedEndUserRole", {}).get("value")
+            authors_only = intended_role and intended_role.lower() != "student"
+            intended_use = resource_map_item.get("intendeduse", "")
+            if (
+                workflow_state in ["active", "published"]
+                and not authors_only
+                and intended_use != "syllabus"
+            ) or (ingest_syllabus and intended_use == "syllabus"):
+                publish_status["active"].append(
+                    {
+                        "title": title,
+                        "path": file_path,
+                        "canvas_type": canvas_type,
+                        "embedded_files": embedded_files,
+                    }
+                )
+            else:
+                publish_status["unpublished"].append(
+                    {
+                        "title": title,
+                        "path": file_path,
+                        "canvas_type": canvas_type,
+                        "embedded_files": embedded_files,
+                    }
                 )
-                # Determine if the content is intended for authors or instructors only
-                intended_role = lom_elem.get("intendedEndUserRole", {}).get("value")
-                authors_only = intended_role and intended_role.lower() != "student"
-                intended_use = resource_map_item.get("intendeduse", "")
-                if (
-                    workflow_state in ["active", "published"]
-                    and not authors_only
-                    and intended_use != "syllabus"
-                ) or (ingest_syllabus and intended_use == "syllabus"):
-                    publish_status["active"].append(
-                        {
-                            "title": title,
-                            "path": file_path,
-                            "canvas_type": canvas_type,
-                            "embedded_files": embedded_files,
-                        }
-                    )
-                else:
-                    publish_status["unpublished"].append(
-                        {
-                            "title": title,
-                            "path": file_path,
-                            "canvas_type": canvas_type,
-                            "embedded_files": embedded_files,
-                        }
-                    )
     return publish_status
 
 
@@ -412,14 +505,14 @@ def extract_resources_by_identifier(manifest_xml: str) -> dict:
     return resources_dict
 
 
-def parse_context_xml(course_archive_path: str) -> dict:
+@canvas_archive_parser
+def parse_context_xml(course_archive: CanvasArchive) -> dict:
     """
     Parse course_settings/context.xml and return context info
     """
-    with zipfile.ZipFile(course_archive_path, "r") as course_archive:
-        if "course_settings/context.xml" not in course_archive.namelist():
-            return {}
-        context = course_archive.read("course_settings/context.xml")
+    if "course_settings/context.xml" not in course_archive.members:
+        return {}
+    context = course_archive.read("course_settings/context.xml")
     root = ElementTree.fromstring(context)
     context_info = {}
     item_keys = ["course_id", "root_account_id", "canvas_domain", "root_account_name"]
@@ -469,15 +562,15 @@ def is_date_locked(lock_at: str, unlock_at: str) -> bool:
     return False
 
 
-def parse_canvas_settings(course_archive_path):
+@canvas_archive_parser
+def parse_canvas_settings(course_archive: CanvasArchive):
     """
     Get course attributes from a Canvas course archive
     """
-    with zipfile.ZipFile(course_archive_path, "r") as course_archive:
-        settings_path = "course_settings/course_settings.xml"
-        if settings_path not in course_archive.namelist():
-            return {}
-        xml_string = course_archive.read(settings_path)
+    settings_path = "course_settings/course_settings.xml"
+    if settings_path not in course_archive.members:
+        return {}
+    xml_string = course_archive.read(settings_path)
     tree = ElementTree.fromstring(xml_string)
     attributes = {}
     for node in tree.iter():
@@ -513,8 +606,8 @@ def canvas_url_config(bucket, export_tempdir: str, url_config_file: str) -> dict
     return url_config
 
 
-def canvas_course_url(course_archive_path) -> str:
-    context_info = parse_context_xml(course_archive_path)
+def canvas_course_url(course_archive) -> str:
+    context_info = parse_context_xml(course_archive)
     return f"https://{context_info.get('canvas_domain')}/courses/{context_info.get('course_id')}/"
 
 
@@ -575,18 +668,18 @@ def _url_config_item_visible(item_configuration, *, allow_hidden=False):
     return True
 
 
-def parse_canvas_folders(course_archive_path: str) -> set[str]:
+@canvas_archive_parser
+def parse_canvas_folders(course_archive: CanvasArchive) -> set[str]:
     """
     Return the set of folder paths (relative to the course files root) that are
     hidden or locked according to course_settings/files_meta.xml. Any file in
     one of these folders (or a descendant of one) is not visible to students.
     """
     restricted: set[str] = set()
-    with zipfile.ZipFile(course_archive_path, "r") as course_archive:
-        files_meta_path = "course_settings/files_meta.xml"
-        if files_meta_path not in course_archive.namelist():
-            return restricted
-        files_xml = course_archive.read(files_meta_path)
+    files_meta_path = "course_settings/files_meta.xml"
+    if files_meta_path not in course_archive.members:
+        return restricted
+    files_xml = course_archive.read(files_meta_path)
     try:
         root = ElementTree.fromstring(files_xml)
     except Exception:
@@ -607,7 +700,8 @@ def parse_canvas_folders(course_archive_path: str) -> set[str]:
     return restricted
 
 
-def parse_canvas_files(course_archive_path: str) -> dict:
+@canvas_archive_parser
+def parse_canvas_files(course_archive: CanvasArchive) -> dict:
     """
     Resolve publish/visibility status for course files present in the archive.
 
@@ -623,17 +717,14 @@ def parse_canvas_files(course_archive_path: str) -> dict:
     files are skipped because they are ingested separately as problem files.
     """
     publish_status = {"active": [], "unpublished": []}
-    with zipfile.ZipFile(course_archive_path, "r") as course_archive:
-        manifest_path = "imsmanifest.xml"
-        if manifest_path not in course_archive.namelist():
-            return publish_status
-        manifest_xml = course_archive.read(manifest_path)
-    resource_map = extract_resources_by_identifier(manifest_xml)
-    restricted_folders = parse_canvas_folders(course_archive_path)
+    if course_archive.manifest_xml is None:
+        return publish_status
+    resource_map = course_archive.resources_by_identifier
+    restricted_folders = parse_canvas_folders(course_archive)
     # files that files_meta.xml explicitly marks unpublished (hidden/locked/dated)
     files_meta_unpublished = {
         str(item["path"])
-        for item in (parse_files_meta(course_archive_path) or {}).get("unpublished", [])
+        for item in (parse_files_meta(course_archive) or {}).get("unpublished", [])
     }
     seen = set()
     for resource in resource_map.values():
@@ -663,12 +754,13 @@ def parse_canvas_files(course_archive_path: str) -> dict:
     return publish_status
 
 
-def get_published_items(zipfile_path, url_config):
+@canvas_archive_parser
+def get_published_items(course_archive: CanvasArchive, url_config):
     """
     Get all published items from a Canvas course archive
     """
     published_items = {}
-    course_settings = parse_canvas_settings(zipfile_path)
+    course_settings = parse_canvas_settings(course_archive)
     tab_configuration = course_settings.get("tab_configuration", {})
     """
     mappings for ids:
@@ -679,10 +771,10 @@ def get_published_items(zipfile_path, url_config):
     # (modules, files_meta, web content) override its generic entries with their
     # richer metadata (Canvas display_name, module membership) for shared paths.
     all_published_items = (
-        parse_canvas_files(zipfile_path)["active"]
-        + parse_module_meta(zipfile_path)["active"]
-        + parse_files_meta(zipfile_path)["active"]
-        + parse_web_content(zipfile_path)["active"]
+        parse_canvas_files(course_archive)["active"]
+        + parse_module_meta(course_archive)["active"]
+        + parse_files_meta(course_archive)["active"]
+        + parse_web_content(course_archive)["active"]
     )
     all_embedded_items = []
     for item in all_published_items:
@@ -733,7 +825,7 @@ def get_published_items(zipfile_path, url_config):
 CHECKSUM_EXCLUDED = ("imsmanifest.xml", "course_settings/")
 
 
-def canvas_course_checksum(course_archive_path, url_config: dict) -> str:
+def canvas_course_checksum(course_archive, url_config: dict) -> str:
     """
     Digest of archive content + effective publish state + url metadata.
 
@@ -744,12 +836,12 @@ def canvas_course_checksum(course_archive_path, url_config: dict) -> str:
     content can change. Stable across Canvas's no-op scheduled exports.
     """
     hasher = md5()  # noqa: S324 - non-cryptographic change detection
-    with zipfile.ZipFile(course_archive_path, "r") as course_archive:
-        for info in sorted(course_archive.infolist(), key=lambda i: i.filename):
+    with open_canvas_archive(course_archive) as archive:
+        for info in sorted(archive.zipfile.infolist(), key=lambda i: i.filename):
             if info.filename.startswith(CHECKSUM_EXCLUDED):
                 continue
             hasher.update(f"{info.filename}\0{info.file_size}\0{info.CRC}\0".encode())
-    published = get_published_items(course_archive_path, url_config)
+        published = get_published_items(archive, url_config)
     # relpath: get_published_items keys are resolve()'d against the process
     # cwd, which must not leak into the digest
     for path, title in sorted(
@@ -1,6 +1,7 @@
 """learning_resources data loaders"""
 
 import logging
+from collections import defaultdict
 from collections.abc import Iterable
 from typing import NamedTuple
 
@@ -60,6 +61,7 @@ from learning_resources.models import (
 from learning_resources.utils import (
     add_parent_topics_to_learning_resource,
     bulk_resources_unpublished_actions,
+    bulk_resources_upserted_actions,
     content_files_loaded_actions,
     load_course_blocklist,
     resource_delete_actions,
@@ -68,6 +70,7 @@ from learning_resources.utils import (
     resource_upserted_actions,
     similar_topics_action,
 )
+from main.utils import checksum_for_content, now_in_utc
 
 log = logging.getLogger()
 
@@ -76,6 +79,86 @@ User = get_user_model()
 CONTENT_TASKS_CACHE_TIMEOUT = 300
 
 
+class BulkLoadContext:
+    """
+    Per-run state for loading many courses or programs at once.
+
+    Topics, departments, platforms and offerors are fetched once and resolved
+    from memory, and search/embedding updates are collected so they can be
+    dispatched in bulk after every resource has been written.
+    """
+
+    def __init__(self):
+        """Fetch the lookup maps for this run"""
+        # Iterate newest first so the lowest pk wins on duplicate names, as
+        # with an unordered .first()
+        self.topics = {
+            topic.name: topic for topic in LearningResourceTopic.objects.order_by("-pk")
+        }
+        self.topics_by_id = {topic.id: topic for topic in self.topics.values()}
+        self.departments = {
+            department.department_id: department
+            for department in LearningResourceDepartment.objects.all()
+        }
+        self.platforms = {
+            platform.code: platform
+            for platform in LearningResourcePlatform.objects.all()
+        }
+        offerors = list(LearningResourceOfferor.objects.all())
+        self.offerors = {
+            "code": {offeror.code: offeror for offeror in offerors},
+            "name": {offeror.name: offeror for offeror in offerors},
+        }
+        self.index_updates: list[tuple[LearningResource, bool]] = []
+
+    def topic_with_parents(self, name: str) -> list[LearningResourceTopic]:
+        """Return the named topic followed by its ancestors, or [] if unknown"""
+        topic = self.topics.get(name)
+        topics = []
+        while topic is not None:
+            topics.append(topic)
+            topic = self.topics_by_id.get(topic.parent_id)
+        return topics
+
+    def department(self, department_id: str) -> LearningResourceDepartment:
+        """Return the department, raising DoesNotExist like objects.get()"""
+        try:
+            return self.departments[department_id]
+        except KeyError as err:
+            msg = f"LearningResourceDepartment {department_id} does not exist"
+            raise LearningResourceDepartment.DoesNotExist(msg) from err
+
+    def offeror(self, offered_by_data: dict) -> LearningResourceOfferor | None:
+        """Return the offeror matching every code/name in offered_by_data"""
+        if not offered_by_data or not set(offered_by_data) <= set(self.offerors):
+            return LearningResourceOfferor.objects.filter(**offered_by_data).first()
+        matches = {
+            self.offerors[field].get(value) for field, value in offered_by_data.items()
+        }
+        return matches.pop() if len(matches) == 1 else None
+
+    def dispatch_index_updates(self):
+        """Send the collected search/embedding updates, one bulk call per type"""
+        upserted_ids = defaultdict(list)
+        for learning_resource, newly_created in self.index_updates:
+            if learning_resource.published:
+                upserted_ids[learning_resource.resource_type].append(
+                    learning_resource.id
+                )
+            else:
+                update_index(learning_resource, newly_created)
+        for resource_type, resource_ids in upserted_ids.items():
+            bulk_resources_upserted_actions(
+                resource_ids, resource_type, generate_embeddings=True
+            )
+        self.index_updates = []
+
+
+def _bulk_load_context() -> BulkLoadContext | None:
+    """Return a fresh BulkLoadContext if bulk loading is enabled"""
+    return BulkLoadContext() if settings.ETL_BULK_LOAD_RESOURCES else None
+
+
 def update_index(learning_resource, newly_created):
     """
     Upsert or remove the learning resource from the search index
@@ -92,14 +175,27 @@ def update_index(learning_resource, newly_created):
         )
 
 
-def load_topics(resource, topics_data):
+def load_topics(resource, topics_data, *, bulk: BulkLoadContext | None = None):
     """
     Load the topics for a resource into the database.
 
     Topics must exist; if they don't, then we skip them.
     """
 
-    if topics_data is not None:
+    if topics_data is not None and bulk is not None:
+        topics = {}
+        for topic_data in topics_data:
+            topic_with_parents = bulk.topic_with_parents(topic_data["name"])
+            if not topic_with_parents:
+                log.warning(
+                    "Skipped adding topic %s to resource %s",
+                    topic_data["name"],
+                    resource,
+                )
+            topics.update((topic.id, topic) for topic in topic_with_parents)
+        # set() only writes the difference from the current topics
+        resource.topics.set(topics.values())
+    elif topics_data is not None:
         topics = []
 
         for topic_data in topics_data:
@@ -118,15 +214,20 @@ def load_topics(resource, topics_data):
 
 
 def load_departments(
-    resource: LearningResource, department_data: list[str]
+    resource: LearningResource,
+    department_data: list[str],
+    *,
+    bulk: BulkLoadContext | None = None,
 ) -> list[LearningResourceDepartment]:
     """Load the departments for a resource into the database"""
     departments = []
 
     if department_data:
         for department_id in department_data:
-            department = LearningResourceDepartment.objects.get(
-                department_id=department_id
+            department = (
+                bulk.department(department_id)
+                if bulk is not None
+                else LearningResourceDepartment.objects.get(department_id=department_id)
             )
             departments.append(department)
 
@@ -260,7 +361,10 @@ def load_image(resource: LearningResource, image_data: dict) -> LearningResource
 
 
 def load_offered_by(
-    resource: LearningResource, offered_by_data: dict
+    resource: LearningResource,
+    offered_by_data: dict,
+    *,
+    bulk: BulkLoadContext | None = None,
 ) -> LearningResourceOfferor:
     """# noqa: D401
     Saves an offered_by to the resource.
@@ -268,16 +372,21 @@ def load_offered_by(
     Args:
         resource (LearningResource): learning resource
         offered_by_data (dict): the offered by data for the resource
+        bulk (BulkLoadContext): lookups for a bulk load, if any
 
     Returns:
         offered_by (LearningResourceOfferor): Created or updated offered_by
     """
+    previous_offered_by_id = resource.offered_by_id
     if offered_by_data is None:
         resource.offered_by = None
+    elif bulk is not None:
+        resource.offered_by = bulk.offeror(offered_by_data)
     else:
         offered_by = LearningResourceOfferor.objects.filter(**offered_by_data).first()
         resource.offered_by = offered_by
-    resource.save()
+    if bulk is None or resource.offered_by_id != previous_offered_by_id:
+        resource.save()
     return resource.offered_by
 
 
@@ -410,6 +519,7 @@ def upsert_course_or_program(  # noqa: C901
     resource_type: str,
     *,
     config: CourseLoaderConfig = None,
+    bulk: BulkLoadContext | None = None,
 ) -> tuple[LearningResource, bool]:
     """
     Return a resource object and whether it was created or not
@@ -423,6 +533,8 @@ def upsert_course_or_program(  # noqa: C901
             the type of resource to load (course or program)
         config (CourseLoaderConfig):
             configuration on how to load a course
+        bulk (BulkLoadContext):
+            lookups for a bulk load, if any
 
     Returns:
         tuple(LearningResource, bool):
@@ -444,7 +556,11 @@ def upsert_course_or_program(  # noqa: C901
         else:
             resource_category = LearningResourceType.program.value
         resource_data["resource_category"] = resource_category
-    platform = LearningResourcePlatform.objects.filter(code=platform_name).first()
+    platform = (
+        bulk.platforms.get(platform_name)
+        if bulk is not None
+        else LearningResourcePlatform.objects.filter(code=platform_name).first()
+    )
     if not platform:
         log.exception(
             "Platform %s is null or not in database: %s",
@@ -512,6 +628,7 @@ def load_course(
     blocklist: list[str],
     *,
     config=CourseLoaderConfig(),
+    bulk: BulkLoadContext | None = None,
 ) -> LearningResource:
     """
     Load the course into the database
@@ -523,6 +640,8 @@ def load_course(
             list of course ids not to load
         config (CourseLoaderConfig):
             configuration on how to load this program
+        bulk (BulkLoadContext):
+            lookups for a bulk load, and where to defer the index update to
 
     Returns:
         Course:
@@ -545,6 +664,7 @@ def load_course(
             blocklist,
             LearningResourceType.course.name,
             config=config,
+            bulk=bulk,
         )
         if config.fetch_only or not learning_resource:
             return learning_resource
@@ -581,13 +701,16 @@ def load_course(
                 resource_run_unpublished_actions(run)
 
         load_run_dependent_values(learning_resource)
-        load_topics(learning_resource, topics_data)
-        load_offered_by(learning_resource, offered_bys_data)
+        load_topics(learning_resource, topics_data, bulk=bulk)
+        load_offered_by(learning_resource, offered_bys_data, bulk=bulk)
         load_image(learning_resource, image_data)
-        load_departments(learning_resource, department_data)
+        load_departments(learning_resource, department_data, bulk=bulk)
         load_content_tags(learning_resource, content_tags_data, is_content_file=False)
 
-    update_index(learning_resource, created)
+    if bulk is not None:
+        bulk.index_updates.append((learning_resource, created))
+    else:
+        update_index(learning_resource, created)
     return learning_resource
 
 
@@ -608,16 +731,20 @@ def load_courses(
         A list of course LearningResources
     """
     blocklist = load_course_blocklist()
+    bulk = _bulk_load_context()
 
     courses_list = list(courses_data or [])
 
     courses = [
         course
         for course in [
-            load_course(course, blocklist, config=config) for course in courses_list
+            load_course(course, blocklist, config=config, bulk=bulk)
+            for course in courses_list
         ]
         if course is not None
     ]
+    if bulk is not None:
+        bulk.dispatch_index_updates()
 
     if courses and config.prune:
         for learning_resource in LearningResource.objects.filter(
@@ -655,6 +782,7 @@ def load_program(
     blocklist: list[str],
     *,
     config=ProgramLoaderConfig(),
+    bulk: BulkLoadContext | None = None,
 ) -> ProgramLoadResult:
     """
     Load the program into the database
@@ -666,6 +794,8 @@ def load_program(
             list of course ids not to load
         config (ProgramLoaderConfig):
             configuration on how to load this program
+        bulk (BulkLoadContext):
+            lookups for a bulk load, and where to defer course index updates to
 
     Returns:
         ProgramLoadResult with the loaded resource (or None), whether it was
@@ -687,17 +817,17 @@ def load_program(
 
     with transaction.atomic():
         learning_resource, created = upsert_course_or_program(
-            program_data, [], LearningResourceType.program.name
+            program_data, [], LearningResourceType.program.name, bulk=bulk
         )
         if not learning_resource:
             return ProgramLoadResult(
                 resource=None, created=False, child_programs_data=[]
             )
 
-        load_topics(learning_resource, topics_data)
+        load_topics(learning_resource, topics_data, bulk=bulk)
         load_image(learning_resource, image_data)
-        load_offered_by(learning_resource, offered_by_data)
-        load_departments(learning_resource, departments_data)
+        load_offered_by(learning_resource, offered_by_data, bulk=bulk)
+        load_departments(learning_resource, departments_data, bulk=bulk)
 
         Program.objects.get_or_create(learning_resource=learning_resource)
 
@@ -724,7 +854,9 @@ def load_program(
                 continue
 
             explicit_position = course_data.pop("position", None)
-            course_resource = load_course(course_data, blocklist, config=config.courses)
+            course_resource = load_course(
+                course_data, blocklist, config=config.courses, bulk=bulk
+            )
             if course_resource:
                 loaded_courses.append(
                     LoadedProgramCourse(
@@ -856,12 +988,13 @@ def load_programs(
     PROGRAM_PROGRAMS or PROGRAM_COURSES based on child `display_mode`.
     """
     blocklist = load_course_blocklist()
+    bulk = _bulk_load_context()
 
     # Pass 1: load all programs and their course children
     results: list[ProgramLoadResult] = []
     deferred_child_programs = []
     for program_data in programs_data:
-        result = load_program(program_data, blocklist, config=config)
+        result = load_program(program_data, blocklist, config=config, bulk=bulk)
         results.append(result)
         if result.resource and result.child_programs_data:
             deferred_child_programs.append(
@@ -873,8 +1006,12 @@ def load_programs(
 
     # Update search index after all relationships (including pass 2) are created
     for result in results:
-        if result.resource:
+        if result.resource and bulk is not None:
+            bulk.index_updates.append((result.resource, result.created))
+        elif result.resource:
             update_index(result.resource, result.created)
+    if bulk is not None:
+        bulk.dispatch_index_updates()
 
     programs = [r.resource for r in results if r.resource is not None]
     if programs and config.prune:
@@ -915,6 +1052,145 @@ def load_content_file(
         )
 
 
+def _bulk_load_content_tags(content_files_tags: list[tuple[ContentFile, list[str]]]):
+    """
+    Replace the content tags of several content files, like load_content_tags
+    does for one, with a fixed number of queries
+
+    Args:
+        content_files_tags (list of tuple): (ContentFile, tag names) pairs
+    """
+    if not content_files_tags:
+        return
+    names = {name for _, tag_names in content_files_tags for name in tag_names}
+    tags = {
+        tag.name: tag
+        for tag in LearningResourceContentTag.objects.filter(name__in=names)
+    }
+    missing_names = names - tags.keys()
+    if missing_names:
+        LearningResourceContentTag.objects.bulk_create(
+            [LearningResourceContentTag(name=name) for name in sorted(missing_names)],
+            ignore_conflicts=True,
+        )
+        tags.update(
+            {
+                tag.name: tag
+                for tag in LearningResourceContentTag.objects.filter(
+                    name__in=missing_names
+                )
+            }
+        )
+
+    ContentFileTag = ContentFile.content_tags.through
+    ContentFileTag.objects.filter(
+        contentfile_id__in=[content_file.id for content_file, _ in content_files_tags]
+    ).delete()
+    ContentFileTag.objects.bulk_create(
+        [
+            ContentFileTag(
+                contentfile_id=content_file.id,
+                learningresourcecontenttag_id=tags[name].id,
+            )
+            for content_file, tag_names in content_files_tags
+            for name in dict.fromkeys(tag_names)
+        ]
+    )
+
+
+def _bulk_load_content_files(
+    course_run: LearningResourceRun, content_files_data: list[dict]
+) -> list[int | None]:
+    """
+    Upsert a batch of content files for a run, with the same result as calling
+    load_content_file on each one but a fixed number of queries.
+
+    Each key must appear at most once in the batch. Files are matched to
+    existing records on (run, key) like update_or_create does; a key shared by
+    several existing records is logged and skipped.
+
+    Returns:
+        list of int: the id of each file (None if skipped), in batch order
+    """
+    existing = defaultdict(list)
+    for content_file in ContentFile.objects.filter(
+        run=course_run, key__in=[data["key"] for data in content_files_data]
+    ):
+        existing[content_file.key].append(content_file)
+
+    now = now_in_utc()
+    loaded = []
+    created = []
+    updated = []
+    update_fields = {"checksum", "updated_on"}
+    content_files_tags = []
+    for data in content_files_data:
+        fields = {key: value for key, value in data.items() if key != "content_tags"}
+        matches = existing[data["key"]]
+        if len(matches) > 1:
+            log.error(
+                "ERROR syncing course file %s for run %d: %d records share key %s",
+                data.get("uid", ""),
+                course_run.id,
+                len(matches),
+                data["key"],
+            )
+            loaded.append(None)
+            continue
+        if matches:
+            content_file = matches[0]
+            for key, value in fields.items():
+                setattr(content_file, key, value)
+            content_file.updated_on = now
+            update_fields.update(fields)
+            updated.append(content_file)
+        else:
+            content_file = ContentFile(run=course_run, **fields)
+            created.append(content_file)
+        # bulk writes skip ContentFile.save, which sets the checksum
+        content_file.checksum = checksum_for_content(content_file.content)
+        tag_names = data.get("content_tags", [])
+        if tag_names is not None:
+            content_files_tags.append((content_file, tag_names))
+        loaded.append(content_file)
+
+    ContentFile.objects.bulk_create(created)
+    if updated:
+        ContentFile.objects.bulk_update(updated, fields=sorted(update_fields))
+    _bulk_load_content_tags(content_files_tags)
+    return [content_file and content_file.id for content_file in loaded]
+
+
+def _load_content_file_batch(
+    course_run: LearningResourceRun, content_files_data: list[dict]
+) -> list[int | None]:
+    """
+    Load a batch of content files, in bulk where possible.
+
+    Files without a key go through load_content_file. If the bulk write fails,
+    the batch is rolled back and loaded one file at a time, so a bad file only
+    costs its own row as before.
+    """
+    keyed = [data for data in content_files_data if data.get("key") is not None]
+    try:
+        with transaction.atomic():
+            keyed_ids = _bulk_load_content_files(course_run, keyed) if keyed else []
+    except:  # noqa: E722
+        log.exception(
+            "ERROR bulk syncing %d course files for run %d, loading them one at a time",
+            len(keyed),
+            course_run.id,
+        )
+        return [load_content_file(course_run, data) for data in content_files_data]
+    keyed_ids = iter(keyed_ids)
+    return [
+        next(keyed_ids)
+        if data.get("key") is not None
+        else load_content_file(course_run, data)
+        for data in content_files_data
+    ]
+
+
 def calculate_completeness(
     run: LearningResourceRun, content_tags: list[list[str]] | None = None
 ):
@@ -984,6 +1260,8 @@ def load_content_files(
     """
     Sync all content files for a course run to database and S3 if not present in DB
 
+    Files are upserted in batches of settings.CONTENT_FILE_LOAD_BATCH_SIZE.
+
     Args:
         course_run (LearningResourceRun): a course run
         content_files_data (list or generator): Details about the content files
@@ -997,13 +1275,23 @@ def load_content_files(
 
     """
     if course_run.learning_resource.resource_type == LearningResourceType.course.name:
-        content_files_ids = []
+        loaded_ids = []
         content_tags = []
+        batch = []
+        batch_keys = set()
         for content_file in content_files_data:
             content_tags.append(content_file.get("content_tags") or [])
-            file_id = load_content_file(course_run, content_file)
-            if file_id is not None:
-                content_files_ids.append(file_id)
+            key = content_file.get("key")
+            # a repeated key starts a new batch so it is upserted in order
+            repeated_key = key is not None and key in batch_keys
+            if repeated_key or len(batch) >= settings.CONTENT_FILE_LOAD_BATCH_SIZE:
+                loaded_ids.extend(_load_content_file_batch(course_run, batch))
+                batch = []
+                batch_keys = set()
+            batch.append(content_file)
+            batch_keys.add(key)
+        loaded_ids.extend(_load_content_file_batch(course_run, batch))
+        content_files_ids = [file_id for file_id in loaded_ids if file_id is not None]
 
         if not content_files_ids:
             log.error(
@@ -9,7 +9,9 @@ from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
+from django.db import connection
 from django.forms.models import model_to_dict
+from django.test.utils import CaptureQueriesContext
 
 from learning_resources.constants import (
     CONTENT_TYPE_FILE,
@@ -91,6 +93,7 @@ from learning_resources.models import (
     ContentFile,
     Course,
     LearningResource,
+    LearningResourceDepartment,
     LearningResourceImage,
     LearningResourceOfferor,
     LearningResourcePlatform,
@@ -102,7 +105,7 @@ from learning_resources.models import (
     Video,
 )
 from learning_resources.test_utils import set_up_topics
-from main.utils import now_in_utc
+from main.utils import checksum_for_content, now_in_utc
 
 pytestmark = pytest.mark.django_db
 
@@ -1436,12 +1439,79 @@ def test_load_courses(mocker, mock_blocklist, prune):
             course_data,
             mock_blocklist.return_value,
             config=config,
+            bulk=None,
         )
     mock_blocklist.assert_called_once_with()
     course_to_unpublish.refresh_from_db()
     assert course_to_unpublish.learning_resource.published is not prune
 
 
+def test_load_courses_bulk(mocker, mock_blocklist, settings):
+    """load_courses should resolve lookups from memory and index in bulk"""
+    settings.ETL_BULK_LOAD_RESOURCES = True
+    platform = LearningResourcePlatformFactory.create()
+    parent_topic = LearningResourceTopicFactory.create()
+    topic = LearningResourceTopicFactory.create(parent=parent_topic)
+    department = LearningResourceDepartmentFactory.create()
+    offeror = LearningResourceOfferorFactory.create(is_ocw=True)
+    mock_update_index = mocker.patch("learning_resources.etl.loaders.update_index")
+    mock_bulk_upserted = mocker.patch(
+        "learning_resources.etl.loaders.bulk_resources_upserted_actions"
+    )
+
+    courses_data = [
+        {
+            "readable_id": f"bulk-course-{idx}",
+            "platform": platform.code,
+            "title": f"Bulk course {idx}",
+            "url": f"https://example.com/{idx}",
+            "published": True,
+            "topics": [{"name": topic.name}, {"name": "Not a topic"}],
+            "departments": [department.department_id],
+            "offered_by": {"code": offeror.code},
+            "runs": [{"run_id": f"bulk-course-{idx}-run", "published": True}],
+        }
+        for idx in range(2)
+    ]
+    courses = load_courses(
+        ETLSource.xpro.name, courses_data, config=CourseLoaderConfig(prune=False)
+    )
+
+    assert len(courses) == len(courses_data)
+    for course in courses:
+        course.refresh_from_db()
+        assert set(course.topics.all()) == {topic, parent_topic}
+        assert list(course.departments.all()) == [department]
+        assert course.offered_by == offeror
+    mock_update_index.assert_not_called()
+    mock_bulk_upserted.assert_called_once_with(
+        [course.id for course in courses],
+        LearningResourceType.course.name,
+        generate_embeddings=True,
+    )
+
+
+def test_bulk_load_context_lookups(django_assert_num_queries):
+    """BulkLoadContext should resolve lookups without querying"""
+    parent_topic = LearningResourceTopicFactory.create()
+    topic = LearningResourceTopicFactory.create(parent=parent_topic)
+    department = LearningResourceDepartmentFactory.create()
+    ocw = LearningResourceOfferorFactory.create(is_ocw=True)
+    mitx = LearningResourceOfferorFactory.create(is_mitx=True)
+    bulk = loaders.BulkLoadContext()
+
+    with django_assert_num_queries(0):
+        assert bulk.topic_with_parents(topic.name) == [topic, parent_topic]
+        assert bulk.topic_with_parents("Not a topic") == []
+        assert bulk.department(department.department_id) == department
+        assert bulk.offeror({"code": ocw.code}) == ocw
+        assert bulk.offeror({"name": mitx.name}) == mitx
+        assert bulk.offeror({"code": ocw.code, "name": mitx.name}) is None
+        assert bulk.offeror({"code": "missing"}) is None
+    with pytest.raises(LearningResourceDepartment.DoesNotExist):
+        bulk.department("missing")
+
+
 def test_load_programs(mocker, mock_blocklist):
     """Test that load_programs calls the expected functions"""
     program_data = [{"courses": [{"platform": "a"}, {}], "id": 5}]
@@ -1927,6 +1997,114 @@ def test_load_content_files_failed_keys_stay_published(mocker):
     assert stale_cf.published is False
 
 
+def test_load_content_files_bulk_upsert(mocker):
+    """
+    load_content_files should create and update keyed files in bulk, replacing
+    their content tags and returning ids in input order
+    """
+    course = LearningResourceFactory.create(is_course=True, create_runs=False)
+    course_run = LearningResourceRunFactory.create(
+        published=True, learning_resource=course
+    )
+    existing_cf = ContentFileFactory.create(
+        run=course_run, key="existing-key", content="old content"
+    )
+    existing_cf.content_tags.set([LearningResourceContentTagFactory.create()])
+    untouched_tag_cf = ContentFileFactory.create(run=course_run, key="untagged-key")
+    untouched_tags = list(untouched_tag_cf.content_tags.all())
+    mocker.patch(
+        "learning_resources.etl.loaders.content_files_loaded_actions",
+        autospec=True,
+    )
+    mock_load_content_file = mocker.patch(
+        "learning_resources.etl.loaders.load_content_file", autospec=True
+    )
+
+    result = load_content_files(
+        course_run,
+        [
+            {
+                "key": "new-key",
+                "content": "new content",
+                "content_tags": ["Lecture Videos", "Lecture Notes"],
+            },
+            {
+                "key": "existing-key",
+                "content": "updated content",
+                "content_tags": ["Lecture Notes"],
+            },
+            {"key": "untagged-key", "title": "untagged", "content_tags": None},
+        ],
+    )
+
+    mock_load_content_file.assert_not_called()
+    new_cf = ContentFile.objects.get(run=course_run, key="new-key")
+    assert result == [new_cf.id, existing_cf.id, untouched_tag_cf.id]
+    existing_cf.refresh_from_db()
+    untouched_tag_cf.refresh_from_db()
+    assert existing_cf.content == "updated content"
+    assert existing_cf.checksum == checksum_for_content("updated content")
+    assert new_cf.checksum == checksum_for_content("new content")
+    assert untouched_tag_cf.title == "untagged"
+    assert sorted(tag.name for tag in new_cf.content_tags.all()) == [
+        "Lecture Notes",
+        "Lecture Videos",
+    ]
+    assert [tag.name for tag in existing_cf.content_tags.all()] == ["Lecture Notes"]
+    assert list(untouched_tag_cf.content_tags.all()) == untouched_tags
+
+
+def test_load_content_files_bulk_query_count(mocker):
+    """The number of queries per batch should not grow with the batch size"""
+    course = LearningResourceFactory.create(is_course=True, create_runs=False)
+    mocker.patch(
+        "learning_resources.etl.loaders.content_files_loaded_actions",
+        autospec=True,
+    )
+
+    def count_queries(num_files):
+        course_run = LearningResourceRunFactory.create(
+            published=True, learning_resource=course
+        )
+        ContentFileFactory.create(run=course_run, key="existing-key")
+        content_data = [
+            {
+                "key": f"key-{idx}",
+                "content": f"content {idx}",
+                "content_tags": [f"tag {idx}", "Lecture Notes"],
+            }
+            for idx in range(num_files)
+        ]
+        content_data.append({"key": "existing-key", "content": "updated"})
+        with CaptureQueriesContext(connection) as context:
+            load_content_files(course_run, content_data)
+        return len(context.captured_queries)
+
+    assert count_queries(2) == count_queries(20)
+
+
+def test_load_content_files_bulk_failure_falls_back(mocker):
+    """A batch that fails to write in bulk should be loaded one file at a time"""
+    course = LearningResourceFactory.create(is_course=True, create_runs=False)
+    course_run = LearningResourceRunFactory.create(
+        published=True, learning_resource=course
+    )
+    mocker.patch(
+        "learning_resources.etl.loaders.content_files_loaded_actions",
+        autospec=True,
+    )
+    mock_log = mocker.patch("learning_resources.etl.loaders.log.exception")
+
+    result = load_content_files(
+        course_run,
+        [{"key": "bad-key", "bad": "data"}, {"key": "good-key", "title": "good"}],
+    )
+
+    assert result == [ContentFile.objects.get(run=course_run, key="good-key").id]
+    assert not ContentFile.objects.filter(run=course_run, key="bad-key").exists()
+    assert mock_log.call_count == 2
+
+
 @pytest.mark.parametrize("test_mode", [True, False])
 def test_load_test_mode_resource_content_files(
     mocker, mock_course_archive_bucket, test_mode
@@ -3,7 +3,9 @@
 import copy
 import logging
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from json import JSONDecodeError
 from pathlib import Path
 from urllib.parse import unquote, urljoin, urlparse
@@ -46,13 +48,15 @@ from learning_resources.utils import (
     parse_instructors,
     safe_load_json,
 )
-from main.utils import clean_data
+from main.utils import chunks, clean_data
 
 log = logging.getLogger(__name__)
 
 OFFERED_BY = {"code": OfferedBy.ocw.name}
 PRIMARY_COURSE_ID = "primary_course_number"
 UNIQUE_FIELD = "url"
+# Error code botocore reports when an If-Modified-Since get is answered with 304
+NOT_MODIFIED_CODE = "304"
 
 
 def parse_delivery(course_data: dict) -> list[str]:
@@ -113,6 +117,9 @@ def transform_content_files(
     """
     Transform page and resource data from the s3 bucket into content_file data
 
+    The data.json files and the files they point to are read from S3 by a
+    bounded pool of threads, in chunks so results are yielded in bucket order.
+
     Args:
         s3_resource (boto3.resource): The S3 resource
         course_prefix (str):String used to query S3 bucket for course data JSONs
@@ -123,38 +130,77 @@ def transform_content_files(
 
     """
     bucket = s3_resource.Bucket(name=settings.OCW_LIVE_BUCKET)
+    # Lowest id first wins, the same record ContentFile.objects.first() would pick
+    content_file_timestamps = dict(
+        reversed(
+            ContentFile.objects.filter(key__startswith=course_prefix.lstrip("/"))
+            .order_by("id")
+            .values_list("key", "updated_on")
+        )
+    )
+    data_objects = (
+        obj
+        for folder in ("pages/", "resources/")
+        for obj in bucket.objects.filter(Prefix=course_prefix + folder)
+        if obj.key.endswith("data.json")
+    )
+    transform = partial(
+        _transform_content_file_object,
+        s3_resource=s3_resource,
+        course_prefix=course_prefix,
+        force_overwrite=force_overwrite,
+        content_file_timestamps=content_file_timestamps,
+    )
+    workers = settings.OCW_CONTENT_FILE_FETCH_WORKERS
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunks(data_objects, chunk_size=workers * 4):
+            for transformed in executor.map(transform, chunk):
+                if transformed:
+                    yield transformed
 
-    for obj in bucket.objects.filter(Prefix=course_prefix + "pages/"):
-        if obj.key.endswith("data.json"):
-            try:
-                course_page_json = safe_load_json(get_s3_object_and_read(obj), obj.key)
-                yield transform_page(obj.key, course_page_json)
-
-            except:  # noqa: E722
-                log.exception(
-                    "ERROR syncing course file %s for course %s", obj.key, course_prefix
-                )
 
-    for obj in bucket.objects.filter(Prefix=course_prefix + "resources/"):
-        if obj.key.endswith("data.json"):
-            try:
-                resource_json = safe_load_json(get_s3_object_and_read(obj), obj.key)
+def _transform_content_file_object(
+    obj,
+    *,
+    s3_resource: boto3.resource,
+    course_prefix: str,
+    force_overwrite: bool,
+    content_file_timestamps: dict,
+) -> dict | None:
+    """
+    Read and transform a single page or resource data.json file
 
-                if resource_json.get("resourcetype"):
-                    transformed_resource = transform_contentfile(
-                        obj.key, resource_json, s3_resource, force_overwrite
-                    )
-                else:
-                    transformed_resource = transform_contentfile_legacy(
-                        obj.key, resource_json, s3_resource, force_overwrite
-                    )
-                if transformed_resource:
-                    yield transformed_resource
+    Args:
+        obj (s3.ObjectSummary): The data.json object
+        s3_resource (boto3.resource): The S3 resource
+        course_prefix (str): String used to query S3 bucket for course data JSONs
+        force_overwrite (bool): Overwrite document text if true
+        content_file_timestamps (dict): updated_on of existing content files by key
 
-            except:  # noqa: E722
-                log.exception(
-                    "ERROR syncing course file %s for course %s", obj.key, course_prefix
-                )
+    Returns:
+        dict: transformed content file data, or None if there is nothing to load
+    """
+    try:
+        data = safe_load_json(get_s3_object_and_read(obj), obj.key)
+        if obj.key.startswith(course_prefix + "pages/"):
+            return transform_page(obj.key, data)
+        transform = (
+            transform_contentfile
+            if data.get("resourcetype")
+            else transform_contentfile_legacy
+        )
+        return transform(
+            obj.key,
+            data,
+            s3_resource,
+            force_overwrite,
+            content_file_timestamps=content_file_timestamps,
+        )
+    except:  # noqa: E722
+        log.exception(
+            "ERROR syncing course file %s for course %s", obj.key, course_prefix
+        )
+        return None
 
 
 def transform_page(s3_key: str, page_data: dict) -> dict:
@@ -190,34 +236,49 @@ def get_file_content(
     file_s3_path: str,
     s3_resource: boto3.resource,
     force_overwrite: bool,  # noqa: FBT001
+    content_file_timestamps: dict | None = None,
 ) -> dict:
     """
     Return the text content of the file if it is a valid text file
 
+    Files that have not changed since the existing content file was saved are
+    requested with If-Modified-Since, so S3 answers without sending the body.
+
     Args:
         s3_path (str): S3 path for the data.json file for the page
         file_s3_path (str): S3 path for the file
         s3_resource (boto3.resource): The S3 resource
         force_overwrite (bool): Overwrite document text if true
+        content_file_timestamps (dict): updated_on of existing content files by
+            key, preloaded by transform_content_files. Queried if not provided.
     """
     ext_lower = Path(file_s3_path).suffix.lower()
     mime_type = mimetypes.types_map.get(file_s3_path)
     content_json = None
 
     if ext_lower in VALID_FILE_TYPES:
-        s3_obj = s3_resource.Object(
-            settings.OCW_LIVE_BUCKET, unquote(file_s3_path)
-        ).get()
-
-        course_file_obj = ContentFile.objects.filter(key=s3_path).first()
+        if content_file_timestamps is None:
+            course_file_obj = ContentFile.objects.filter(key=s3_path).first()
+            updated_on = course_file_obj.updated_on if course_file_obj else None
+        else:
+            updated_on = content_file_timestamps.get(s3_path)
+
+        get_kwargs = {}
+        if not force_overwrite and updated_on is not None:
+            get_kwargs["IfModifiedSince"] = updated_on
+        try:
+            s3_obj = s3_resource.Object(
+                settings.OCW_LIVE_BUCKET, unquote(file_s3_path)
+            ).get(**get_kwargs)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") == NOT_MODIFIED_CODE:
+                return None
+            raise
 
         needs_text_update = (
             force_overwrite
-            or course_file_obj is None
-            or (
-                s3_obj is not None
-                and s3_obj["LastModified"] >= course_file_obj.updated_on
-            )
+            or updated_on is None
+            or (s3_obj is not None and s3_obj["LastModified"] >= updated_on)
         )
 
         if needs_text_update:
@@ -239,6 +300,7 @@ def transform_contentfile(
     contentfile_data: dict,
     s3_resource: boto3.resource,
     force_overwrite: bool,  # noqa: FBT001
+    content_file_timestamps: dict | None = None,
 ) -> dict:
     """
     Transform the data from data.json (new format) for a content file
@@ -248,6 +310,7 @@ def transform_contentfile(
         contentfile_data (dict): JSON data from data.json
         s3_resource (boto3.resource): The S3 resource
         force_overwrite (bool): Overwrite document text if true
+        content_file_timestamps (dict): updated_on of existing content files by key
 
     Returns:
         dict: transformed content file data
@@ -297,7 +360,13 @@ def transform_contentfile(
     if not file_s3_path.startswith("courses"):
         file_s3_path = "courses" + file_s3_path.split("courses")[1]
 
-    content_json = get_file_content(s3_path, file_s3_path, s3_resource, force_overwrite)
+    content_json = get_file_content(
+        s3_path,
+        file_s3_path,
+        s3_resource,
+        force_overwrite,
+        content_file_timestamps=content_file_timestamps,
+    )
     if content_json:
         contentfile_data["content"] = content_json.get("content")
 
@@ -315,6 +384,7 @@ def transform_contentfile_legacy(
     contentfile_data: dict,
     s3_resource: boto3.resource,
     force_overwrite: bool,  # noqa: FBT001
+    content_file_timestamps: dict | None = None,
 ) -> dict:
     """
     Transform the data from data.json for a content file
@@ -324,7 +394,7 @@ def transform_contentfile_legacy(
         contentfile_data (dict): JSON data from the data.json file for the page
         s3_resource (str): The S3 file
         force_overwrite (bool): Overwrite document text if true
-
+        content_file_timestamps (dict): updated_on of existing content files by key
 
     Returns:
         dict: transformed content file data
@@ -373,7 +443,13 @@ def transform_contentfile_legacy(
     if not file_s3_path.startswith("courses"):
         file_s3_path = "courses" + file_s3_path.split("courses")[1]
 
-    content_json = get_file_content(s3_path, file_s3_path, s3_resource, force_overwrite)
+    content_json = get_file_content(
+        s3_path,
+        file_s3_path,
+        s3_resource,
+        force_overwrite,
+        content_file_timestamps=content_file_timestamps,
+    )
     if content_json:
         contentfile_data["content"] = content_json.get("content")
 
@@ -6,6 +6,7 @@ from pathlib import Path
 
 import boto3
 import pytest
+from botocore.exceptions import ClientError
 from moto import mock_aws
 
 from learning_resources.conftest import OCW_TEST_PREFIX, setup_s3_ocw
@@ -19,6 +20,7 @@ from learning_resources.constants import (
 )
 from learning_resources.etl.constants import CourseNumberType, ETLSource
 from learning_resources.etl.ocw import (
+    get_file_content,
     parse_learn_topics,
     transform_content_files,
     transform_contentfile,
@@ -153,6 +155,68 @@ def test_transform_content_files_exceptions(settings, mocker):
     assert mock_log.call_count == 6
 
 
+@mock_aws
+def test_transform_content_files_skips_unchanged_files(
+    settings, mocker, django_assert_num_queries
+):
+    """
+    Test that transform_content_files looks up existing content files in one
+    query and does not extract text from files unchanged since they were saved
+    """
+    setup_s3_ocw(settings)
+    s3_resource = boto3.resource("s3")
+    mock_tika = mocker.patch(
+        "learning_resources.etl.ocw.extract_text_metadata",
+        return_value={"content": "TEXT"},
+    )
+    content_data = list(
+        transform_content_files(s3_resource, OCW_TEST_PREFIX, False)  # noqa: FBT003
+    )
+    assert mock_tika.call_count > 0
+    for item in content_data:
+        ContentFileFactory.create(key=item["key"])
+    ContentFile.objects.update(updated_on=datetime(2100, 1, 1, tzinfo=UTC))
+    mock_tika.reset_mock()
+
+    with django_assert_num_queries(1):
+        content_data = list(
+            transform_content_files(s3_resource, OCW_TEST_PREFIX, False)  # noqa: FBT003
+        )
+
+    assert len(content_data) == 5
+    mock_tika.assert_not_called()
+    assert all(
+        "content" not in item for item in content_data if item["content_type"] != "page"
+    )
+
+
+def test_get_file_content_not_modified(mocker):
+    """
+    Test that get_file_content asks S3 for the file only if it changed since the
+    content file was saved, and skips it when S3 answers 304
+    """
+    updated_on = datetime(2020, 12, 1, tzinfo=UTC)
+    s3_resource = mocker.Mock()
+    s3_object = s3_resource.Object.return_value
+    s3_object.get.side_effect = ClientError(
+        {"Error": {"Code": "304", "Message": "Not Modified"}}, "GetObject"
+    )
+    mock_tika = mocker.patch("learning_resources.etl.ocw.extract_text_metadata")
+
+    assert (
+        get_file_content(
+            "courses/course/resources/file/",
+            "courses/course/file.pdf",
+            s3_resource,
+            False,  # noqa: FBT003
+            content_file_timestamps={"courses/course/resources/file/": updated_on},
+        )
+        is None
+    )
+    s3_object.get.assert_called_once_with(IfModifiedSince=updated_on)
+    mock_tika.assert_not_called()
+
+
 @mock_aws
 @pytest.mark.parametrize("overwrite", [True, False])
 @pytest.mark.parametrize("modified_after_last_import", [True, False])
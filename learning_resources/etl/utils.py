@@ -12,11 +12,18 @@ import tarfile
 import uuid
 from collections import Counter
 from collections.abc import Generator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from datetime import UTC, datetime
 from decimal import Decimal
 from hashlib import md5
 from io import BytesIO
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from subprocess import check_call
 from tempfile import TemporaryDirectory
 
@@ -341,21 +348,122 @@ def documents_from_olx(
                 with Path.open(Path(root, filename), "rb") as f:
                     filebytes = f.read()
 
-                mimetype = mimetypes.types_map.get(extension_lower)
-                archive_checksum = md5(filebytes).hexdigest()  # noqa: S324
-
                 yield (
                     filebytes,
-                    {
-                        "content_type": CONTENT_TYPE_FILE,
-                        "mime_type": mimetype,
-                        "archive_checksum": archive_checksum,
-                        "file_extension": extension_lower,
-                        "source_path": f"{path}/{filename}",
-                    },
+                    _olx_document_metadata(
+                        filebytes, extension_lower, f"{path}/{filename}"
+                    ),
                 )
 
 
+def _olx_document_metadata(filebytes: bytes, extension: str, source_path: str):
+    """Return the metadata for an OLX file"""
+    return {
+        "content_type": CONTENT_TYPE_FILE,
+        "mime_type": mimetypes.types_map.get(extension),
+        "archive_checksum": md5(filebytes).hexdigest(),  # noqa: S324
+        "file_extension": extension,
+        "source_path": source_path,
+    }
+
+
+def _olx_archive_files(course_tarpath: Path) -> Generator[tuple, None, None]:
+    """
+    Stream the regular files of a course archive without extracting it
+
+    Yields:
+        tuple: (PurePosixPath of the member, file object to read it from)
+    """
+    with tarfile.open(course_tarpath, mode="r|*") as archive:
+        for member in archive:
+            if member.isfile():
+                yield PurePosixPath(member.name), archive.extractfile(member)
+
+
+def _write_archive_member(scratch_root: Path, member_path: PurePosixPath, data: bytes):
+    """
+    Write an archive member under scratch_root at its archive path, the same
+    place tar xf would put it. Members that would land outside it are skipped.
+    """
+    file_path = (scratch_root / member_path).resolve()
+    if not file_path.is_relative_to(scratch_root):
+        log.warning("Skipping archive member outside the OLX: %s", member_path)
+        return False
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(data)
+    return True
+
+
+def extract_olx_archive_metadata_files(course_tarpath: Path, scratch_path: str) -> str:
+    """
+    Write the XML files that OLX metadata is read from to scratch_path
+
+    Video XML (for transcript metadata) and html/*.xml (for HTML titles) are
+    written where extracting the archive would put them, so the returned OLX
+    path means the same as the extracted one and get_video_metadata and
+    get_title_for_content find the same files. This is a separate pass because
+    a stream can reach a document before the XML describing it.
+
+    Args:
+        course_tarpath (Path): The path to the course archive
+        scratch_path (str): Directory to write the files to
+
+    Returns:
+        str: The OLX path, i.e. the archive's top-level directory in scratch_path
+    """
+    scratch_root = Path(scratch_path).resolve()
+    olx_path = None
+    for member_path, member_file in _olx_archive_files(course_tarpath):
+        parts = member_path.parts
+        if olx_path is None:
+            olx_path = str(Path(scratch_path, parts[0]))
+        if (
+            len(parts) > 2  # noqa: PLR2004
+            and parts[1] in ("html", "video")
+            and member_path.suffix.lower() == ".xml"
+        ):
+            _write_archive_member(scratch_root, member_path, member_file.read())
+    return olx_path or scratch_path
+
+
+def documents_from_olx_archive(
+    course_tarpath: Path,
+    scratch_path: str,
+    valid_file_types: list[str] = VALID_TEXT_FILE_TYPES,
+) -> Generator[tuple, None, None]:
+    """
+    Stream text documents straight from a course archive
+
+    Members are filtered and hashed as they are read, like documents_from_olx
+    does for an extracted archive. PDFs are also written to scratch_path at
+    their archive path (which is their source_path), since PDF validation and
+    OCR read them from disk; look them up under scratch_path, not the OLX path.
+
+    Args:
+        course_tarpath (Path): The path to the course archive
+        scratch_path (str): Directory the archive would be extracted into
+        valid_file_types (list of str): File extensions to yield
+
+    Yields:
+        tuple: A list of (bytes of content, metadata)
+    """
+    scratch_root = Path(scratch_path).resolve()
+    for member_path, member_file in _olx_archive_files(course_tarpath):
+        extension_lower = member_path.suffix.lower()
+        if extension_lower not in valid_file_types or "draft" in str(
+            member_path.parent
+        ):
+            continue
+        source_path = str(member_path)
+        filebytes = member_file.read()
+        if extension_lower == ".pdf" and not _write_archive_member(
+            scratch_root, member_path, filebytes
+        ):
+            continue
+
+        yield filebytes, _olx_document_metadata(filebytes, extension_lower, source_path)
+
+
 def get_edx_module_id(path: str, run: LearningResourceRun) -> str:
     """
     Return the XBlock ID from a path
@@ -557,14 +665,26 @@ def _should_reprocess(existing_record, metadata: dict, overwrite) -> bool:
         return True
     if overwrite:
         return True
-    return existing_record.archive_checksum != metadata.get("archive_checksum")
+    return existing_record["archive_checksum"] != metadata.get("archive_checksum")
 
 
-def _get_existing_record(source_path: str, key: str, run, is_tutor_problem):
-    """Fetch existing record based on import type."""
+def _get_existing_records(run, is_tutor_problem) -> dict:
+    """
+    Fetch the checksum and cached content of the run's existing records in one
+    query, keyed by source_path for tutor problem files and by key otherwise.
+    """
     if is_tutor_problem:
-        return TutorProblemFile.objects.filter(source_path=source_path, run=run).first()
-    return ContentFile.objects.filter(key=key, run=run).first()
+        lookup_field = "source_path"
+        records = TutorProblemFile.objects.filter(run=run).values(
+            "source_path", "archive_checksum", "content"
+        )
+    else:
+        lookup_field = "key"
+        records = ContentFile.objects.filter(run=run).values(
+            "key", "archive_checksum", "content", "content_title"
+        )
+    # Reverse pk order so that for duplicate keys the lowest pk wins, as .first() did
+    return {record[lookup_field]: record for record in records.order_by("-pk")}
 
 
 def _should_use_ocr(file_extension: str, file_path: Path, use_ocr) -> bool:
@@ -681,8 +801,8 @@ def _extract_content(  # noqa: PLR0913
 def _get_cached_content(existing_record, is_tutor_problem) -> dict:
     """Get content from existing record."""
     return {
-        "content": existing_record.content,
-        "content_title": "" if is_tutor_problem else existing_record.content_title,
+        "content": existing_record["content"],
+        "content_title": "" if is_tutor_problem else existing_record["content_title"],
     }
 
 
@@ -800,51 +920,97 @@ def _build_result(  # noqa: PLR0913
     return data
 
 
-def process_olx_path(  # noqa: PLR0913
+def _extract_olx_documents(  # noqa: PLR0913
     olx_path: str,
     run: LearningResourceRun,
+    documents,
+    *,
+    overwrite: bool,
+    use_ocr: bool,
+    is_tutor_problem: bool,
+    documents_root: str | None = None,
+) -> Generator[tuple[dict, str, Future], None, None]:
+    """
+    Yield (metadata, key, future) for each OLX document, where the future
+    resolves to the document's content dict (or None if it has none).
+
+    Files that are read from disk (PDFs) are looked up at their source_path
+    under documents_root, which defaults to olx_path.
+
+    Documents whose archive checksum is unchanged reuse the content of their
+    existing record. The rest are extracted with Tika/OCR on a thread pool of
+    settings.CONTENT_FILE_EXTRACTION_WORKERS, and are yielded as their
+    extractions complete rather than in archive order.
+    """
+    existing_records = _get_existing_records(run, is_tutor_problem)
+    max_workers = max(1, settings.CONTENT_FILE_EXTRACTION_WORKERS)
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="olx-extraction"
+    )
+    in_flight = {}
+
+    def completed(futures):
+        for future in futures:
+            metadata, key = in_flight.pop(future)
+            yield metadata, key, future
+
+    try:
+        for document, metadata in documents:
+            source_path = metadata.get("source_path")
+            key = get_edx_module_id(source_path, run)
+            existing_record = existing_records.get(
+                source_path if is_tutor_problem else key
+            )
+            if not _should_reprocess(existing_record, metadata, overwrite):
+                future = Future()
+                future.set_result(
+                    _get_cached_content(existing_record, is_tutor_problem)
+                )
+                yield metadata, key, future
+                continue
+            if len(in_flight) >= max_workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield from completed(done)
+            future = executor.submit(
+                _extract_content,
+                document,
+                metadata,
+                documents_root or olx_path,
+                key,
+                use_ocr=use_ocr,
+                is_tutor_problem=is_tutor_problem,
+            )
+            in_flight[future] = (metadata, key)
+        yield from completed(as_completed(list(in_flight)))
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _process_olx_documents(  # noqa: PLR0913
+    olx_path: str,
+    run: LearningResourceRun,
+    documents,
+    video_srt_metadata: dict,
     *,
     overwrite: bool,
-    valid_file_types=VALID_TEXT_FILE_TYPES,
     is_tutor_problem_file_import=False,
     use_ocr=False,
     failed_source_paths: list | None = None,
+    documents_root: str | None = None,
 ) -> Generator[dict, None, None]:
-    """
-    Process OLX path and yield content dictionaries.
-
-    failed_source_paths is a caller-owned list appended to in place with the
-    source_path of each file whose processing raises; it is only complete once
-    the generator is fully exhausted.
-    """
-    video_srt_metadata = get_video_metadata(olx_path, run)
-
-    for document, metadata in documents_from_olx(
-        olx_path, valid_file_types=valid_file_types
+    """Extract (bytes, metadata) OLX documents and yield content dictionaries."""
+    for metadata, key, extraction in _extract_olx_documents(
+        olx_path,
+        run,
+        documents,
+        overwrite=overwrite,
+        use_ocr=use_ocr,
+        is_tutor_problem=is_tutor_problem_file_import,
+        documents_root=documents_root,
     ):
         source_path = metadata.get("source_path")
-        key = get_edx_module_id(source_path, run)
-
         try:
-            existing_record = _get_existing_record(
-                source_path, key, run, is_tutor_problem_file_import
-            )
-
-            if _should_reprocess(existing_record, metadata, overwrite):
-                content_dict = _extract_content(
-                    document,
-                    metadata,
-                    olx_path,
-                    key,
-                    use_ocr=use_ocr,
-                    is_tutor_problem=is_tutor_problem_file_import,
-                )
-                if content_dict is None:
-                    continue
-            else:
-                content_dict = _get_cached_content(
-                    existing_record, is_tutor_problem_file_import
-                )
+            content_dict = extraction.result()
         except Exception:
             log.exception(
                 "Extraction failed for %s in run %s, skipping file",
@@ -854,12 +1020,46 @@ def process_olx_path(  # noqa: PLR0913
             if failed_source_paths is not None:
                 failed_source_paths.append(source_path)
             continue
+        if content_dict is None:
+            continue
 
         yield _build_result(
             olx_path, metadata, key, run, video_srt_metadata, content_dict
         )
 
 
+def process_olx_path(  # noqa: PLR0913
+    olx_path: str,
+    run: LearningResourceRun,
+    *,
+    overwrite: bool,
+    valid_file_types=VALID_TEXT_FILE_TYPES,
+    is_tutor_problem_file_import=False,
+    use_ocr=False,
+    failed_source_paths: list | None = None,
+) -> Generator[dict, None, None]:
+    """
+    Process OLX path and yield content dictionaries.
+
+    Files are extracted concurrently (see _extract_olx_documents), so results
+    are yielded in completion order rather than archive order.
+
+    failed_source_paths is a caller-owned list appended to in place with the
+    source_path of each file whose processing raises; it is only complete once
+    the generator is fully exhausted.
+    """
+    yield from _process_olx_documents(
+        olx_path,
+        run,
+        documents_from_olx(olx_path, valid_file_types=valid_file_types),
+        get_video_metadata(olx_path, run),
+        overwrite=overwrite,
+        is_tutor_problem_file_import=is_tutor_problem_file_import,
+        use_ocr=use_ocr,
+        failed_source_paths=failed_source_paths,
+    )
+
+
 def transform_content_files(
     course_tarpath: Path,
     run: LearningResourceRun,
@@ -870,6 +1070,10 @@ def transform_content_files(
     """
     Pass content to tika, then return JSON document with transformed content inside it
 
+    With settings.CONTENT_FILE_STREAM_ARCHIVES the archive is read as a stream
+    instead of being extracted first; only PDFs and the XML files metadata is
+    read from are written to disk.
+
     Args:
         course_tarpath (str): The path to the tarball which contains the OLX
         run (LearningResourceRun): The run associated witb the content files
@@ -883,11 +1087,28 @@ def transform_content_files(
     basedir = course_tarpath.name.split(".")[0]
     failed_source_paths = []
     with TemporaryDirectory(prefix=basedir) as inner_tempdir:
-        check_call(["tar", "xf", course_tarpath], cwd=inner_tempdir)  # noqa: S603,S607
-        olx_path = glob.glob(inner_tempdir + "/*")[0]  # noqa: PTH207
-        yield from process_olx_path(
-            olx_path, run, overwrite=overwrite, failed_source_paths=failed_source_paths
-        )
+        if settings.CONTENT_FILE_STREAM_ARCHIVES:
+            olx_path = extract_olx_archive_metadata_files(course_tarpath, inner_tempdir)
+            yield from _process_olx_documents(
+                olx_path,
+                run,
+                documents_from_olx_archive(course_tarpath, inner_tempdir),
+                get_video_metadata(olx_path, run),
+                overwrite=overwrite,
+                failed_source_paths=failed_source_paths,
+                # PDFs are written under the scratch dir at their archive path,
+                # which is also their source_path
+                documents_root=inner_tempdir,
+            )
+        else:
+            check_call(["tar", "xf", course_tarpath], cwd=inner_tempdir)  # noqa: S603,S607
+            olx_path = glob.glob(inner_tempdir + "/*")[0]  # noqa: PTH207
+            yield from process_olx_path(
+                olx_path,
+                run,
+                overwrite=overwrite,
+                failed_source_paths=failed_source_paths,
+            )
     if failed_keys is not None:
         failed_keys.extend(
             get_edx_module_id(source_path, run) for source_path in failed_source_paths
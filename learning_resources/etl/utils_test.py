@@ -2,7 +2,10 @@
 
 import datetime
 import pathlib
+import tarfile
 from decimal import Decimal
+from hashlib import md5
+from io import BytesIO
 from subprocess import check_call
 from tempfile import TemporaryDirectory
 
@@ -32,6 +35,7 @@ from learning_resources.factories import (
     LearningResourceRunFactory,
     LearningResourceTopicFactory,
 )
+from main.test_utils import ConcurrencyProbe
 
 pytestmark = pytest.mark.django_db
 
@@ -284,6 +288,55 @@ def test_transform_content_files(  # noqa: PLR0913
     assert documents_mock.called is True
 
 
+def test_process_olx_path_existing_records_single_query(
+    mocker, django_assert_num_queries
+):
+    """
+    Unchanged files should be served from their existing records, which are
+    all looked up in a single query
+    """
+    run = LearningResourceRunFactory.create(published=True)
+    archive_checksum = "7s35721d1647f962d59b8120a52210a7"
+    course_id = run.run_id.replace("course-v1:", "")
+    documents = []
+    for idx in range(5):
+        ContentFileFactory.create(
+            content=f"existing content {idx}",
+            content_title=f"title {idx}",
+            run=run,
+            archive_checksum=archive_checksum,
+            key=f"block-v1:{course_id}+type@html+block@uuid{idx}",
+        )
+        documents.append(
+            (
+                "some text in the document",
+                {
+                    "content_type": "course",
+                    "archive_checksum": archive_checksum,
+                    "file_extension": ".html",
+                    "source_path": f"root/html/uuid{idx}.html",
+                },
+            )
+        )
+    mocker.patch(
+        "learning_resources.etl.utils.documents_from_olx", return_value=documents
+    )
+    mocker.patch("learning_resources.etl.utils.get_video_metadata", return_value={})
+    mocker.patch(
+        "learning_resources.etl.utils.get_url_from_module_id",
+        return_value="https://example.com/test",
+    )
+    extract_mock = mocker.patch("learning_resources.etl.utils.extract_text_metadata")
+
+    with django_assert_num_queries(1):
+        content = list(utils.process_olx_path("/tmp/olx", run, overwrite=False))  # noqa: S108
+
+    extract_mock.assert_not_called()
+    assert [(item["content"], item["content_title"]) for item in content] == [
+        (f"existing content {idx}", f"title {idx}") for idx in range(5)
+    ]
+
+
 def test_documents_from_olx():
     """Test for documents_from_olx"""
     parsed_documents = get_olx_test_docs()
@@ -300,6 +353,121 @@ def test_documents_from_olx():
     assert formula2do[1]["mime_type"].endswith("/xml")
 
 
+def test_documents_from_olx_archive_matches_extracted(tmp_path):
+    """Streaming an archive should yield the same documents as extracting it"""
+    script_dir = pathlib.Path(__file__).parent.absolute().parent.parent
+    check_call(  # noqa: S603
+        [  # noqa: S607
+            "tar",
+            "xf",
+            pathlib.Path(script_dir, "test_json", "exported_courses_12345.tar.gz"),
+        ],
+        cwd=tmp_path,
+    )
+    scratch_path = tmp_path / "scratch"
+    scratch_path.mkdir()
+
+    streamed = list(
+        utils.documents_from_olx_archive(
+            tmp_path / "content-devops-0001.tar.gz", str(scratch_path)
+        )
+    )
+
+    def by_source_path(documents):
+        return sorted(documents, key=lambda doc: doc[1]["source_path"])
+
+    assert by_source_path(streamed) == by_source_path(get_olx_test_docs())
+
+
+def test_documents_from_olx_archive_filters_and_writes_pdfs(tmp_path):
+    """
+    Drafts and unsupported file types should be skipped, and only PDFs written
+    to the scratch directory
+    """
+    members = {
+        "course/html/page.html": b"<p>page</p>",
+        "course/drafts/html/draft.html": b"<p>draft</p>",
+        "course/static/handout.pdf": b"%PDF- handout",
+        "course/static/logo.png": b"png",
+    }
+    archive_path = tmp_path / "course.tar.gz"
+    with tarfile.open(archive_path, "w:gz") as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, BytesIO(data))
+    scratch_path = tmp_path / "scratch"
+    scratch_path.mkdir()
+
+    documents = list(
+        utils.documents_from_olx_archive(
+            archive_path, str(scratch_path), valid_file_types=[".html", ".pdf"]
+        )
+    )
+
+    assert [(data, metadata["source_path"]) for data, metadata in documents] == [
+        (b"<p>page</p>", "course/html/page.html"),
+        (b"%PDF- handout", "course/static/handout.pdf"),
+    ]
+    assert documents[1][1]["archive_checksum"] == md5(b"%PDF- handout").hexdigest()  # noqa: S324
+    assert [
+        path.relative_to(scratch_path).as_posix()
+        for path in scratch_path.rglob("*")
+        if path.is_file()
+    ] == ["course/static/handout.pdf"]
+
+
+@pytest.mark.django_db
+def test_transform_content_files_streaming_matches_extracted(
+    mocker, settings, tmp_path
+):
+    """
+    Streaming an archive should give the same results as extracting it,
+    including HTML titles read from the sibling html/*.xml, and streamed PDFs
+    should be validated from disk
+    """
+    settings.SKIP_TIKA = False
+    run = LearningResourceRunFactory.create(published=True)
+    members = {
+        "course/html/page.html": b"<p>no title here</p>",
+        "course/html/page.xml": b'<html filename="page" display_name="Page Title"/>',
+        "course/static/handout.pdf": b"%PDF- handout",
+    }
+    archive_path = tmp_path / "course.tar.gz"
+    with tarfile.open(archive_path, "w:gz") as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, BytesIO(data))
+    mocker.patch(
+        "learning_resources.etl.utils.extract_text_metadata",
+        return_value={"content": "extracted text", "metadata": {}},
+    )
+    validated_pdfs = []
+    mocker.patch(
+        "learning_resources.etl.utils.pdf_is_valid",
+        side_effect=lambda pdf_path: (
+            validated_pdfs.append(pdf_path.read_bytes()) or True
+        ),
+    )
+
+    results = {}
+    for stream in (False, True):
+        settings.CONTENT_FILE_STREAM_ARCHIVES = stream
+        results[stream] = sorted(
+            utils.transform_content_files(archive_path, run, overwrite=True),
+            key=lambda result: result["key"],
+        )
+        if stream:
+            # the streamed PDF is validated from the file written for it
+            assert validated_pdfs == [members["course/static/handout.pdf"]]
+        validated_pdfs.clear()
+
+    assert results[True] == results[False]
+    titles = {result["source_path"]: result["title"] for result in results[True]}
+    assert titles["course/html/page.html"] == "Page Title"
+
+
 @pytest.mark.parametrize(
     ("etl_source", "expected_setting"),
     [
@@ -1218,6 +1386,45 @@ def test_process_olx_path_skips_failed_files(mocker, tmp_path):
     assert "bad.html" in failed[0]
 
 
+@pytest.mark.django_db
+def test_process_olx_path_concurrent_extraction(mocker, settings, tmp_path):
+    """
+    Files should be extracted concurrently up to CONTENT_FILE_EXTRACTION_WORKERS,
+    with failures still recorded
+    """
+    settings.CONTENT_FILE_EXTRACTION_WORKERS = 3
+    run = LearningResourceRunFactory.create()
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    for idx in range(6):
+        (static_dir / f"file{idx}.html").write_text(f"<p>{idx}</p>")
+    (static_dir / "bad.html").write_text("<p>bad</p>")
+    probe = ConcurrencyProbe(3)
+
+    @probe
+    def fake_extract(document, metadata, olx_path, key, **kwargs):
+        if "bad.html" in metadata["source_path"]:
+            msg = "converter output missing"
+            raise FileNotFoundError(msg)
+        return {"content": document.decode(), "content_title": ""}
+
+    mocker.patch(
+        "learning_resources.etl.utils._extract_content", side_effect=fake_extract
+    )
+    failed = []
+    results = list(
+        utils.process_olx_path(
+            str(tmp_path), run, overwrite=True, failed_source_paths=failed
+        )
+    )
+    assert sorted(result["content"] for result in results) == [
+        f"<p>{idx}</p>" for idx in range(6)
+    ]
+    assert len(failed) == 1
+    assert "bad.html" in failed[0]
+    assert probe.peak == 3
+
+
 def test_extract_content_invalid_pdf_raises(mocker, settings, tmp_path):
     """A PDF failing pdf_is_valid raises, so process_olx_path records a failure
     instead of the old silent drop
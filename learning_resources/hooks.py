@@ -32,6 +32,10 @@ class LearningResourceHooks:
     def resource_upserted(self, resource, percolate, generate_embeddings):
         """Trigger actions after a learning resource is created or updated"""
 
+    @hookspec
+    def bulk_resources_upserted(self, resource_ids, resource_type, generate_embeddings):
+        """Trigger actions after multiple learning resources are created or updated"""
+
     @hookspec
     def resource_unpublished(self, resource):
         """Trigger actions after a learning resource is unpublished"""
@@ -0,0 +1,126 @@
+"""Management command to benchmark parsing of a Canvas course archive"""
+
+import tracemalloc
+import zipfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from learning_resources.etl.canvas_utils import (
+    CanvasArchive,
+    canvas_course_checksum,
+    canvas_course_url,
+    get_published_items,
+    parse_canvas_settings,
+)
+
+SETTINGS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<course xmlns="http://canvas.instructure.com/xsd/cccv1p0">
+  <title>Benchmark Course</title>
+  <course_code>BENCH-101</course_code>
+</course>
+"""
+
+
+def _manifest_xml(resources: int) -> str:
+    """Return an imsmanifest.xml with a module item and a file per resource"""
+    items = "".join(
+        f'<item identifier="I{idx}" identifierref="R{idx}">'
+        f"<title>Item {idx}</title></item>"
+        for idx in range(resources)
+    )
+    webcontent = "".join(
+        f'<resource identifier="R{idx}" type="webcontent" '
+        f'href="web_resources/file{idx}.pdf">'
+        f'<file href="web_resources/file{idx}.pdf"/></resource>'
+        for idx in range(resources)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<manifest xmlns="http://www.imsglobal.org/xsd/imsccv1p1/imscp_v1p1">'
+        f"<organizations><organization><item>{items}</item></organization>"
+        f"</organizations><resources>{webcontent}</resources></manifest>"
+    )
+
+
+def _module_xml(resources: int) -> str:
+    """Return a module_meta.xml with every resource in one active module"""
+    items = "".join(
+        "<item><workflow_state>active</workflow_state>"
+        f"<title>Item {idx}</title><identifierref>R{idx}</identifierref>"
+        "<content_type>Attachment</content_type></item>"
+        for idx in range(resources)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<modules xmlns="http://canvas.instructure.com/xsd/cccv1p0">'
+        f"<module><title>Module</title><items>{items}</items></module></modules>"
+    )
+
+
+def _parse_archive(course_archive, url_config: dict):
+    """Make the archive parsing calls of a Canvas course sync"""
+    canvas_course_checksum(course_archive, url_config)
+    parse_canvas_settings(course_archive)
+    canvas_course_url(course_archive)
+    get_published_items(course_archive, url_config)
+
+
+def _parse_shared(archive_path: Path):
+    """Make the sync's parsing calls against one CanvasArchive"""
+    with CanvasArchive(archive_path) as course_archive:
+        _parse_archive(course_archive, {})
+
+
+class Command(BaseCommand):
+    """
+    Time the archive parsing of a Canvas sync over a generated archive, once
+    with every parser opening the archive path itself and once sharing a
+    single CanvasArchive, and report the peak memory allocated by each.
+    """
+
+    help = "Benchmark per-call vs shared parsing of a Canvas course archive"
+
+    def add_arguments(self, parser):
+        """Configure arguments for this command"""
+        parser.add_argument(
+            "--resources",
+            dest="resources",
+            type=int,
+            default=5000,
+            help="Number of files in the generated archive",
+        )
+        super().add_arguments(parser)
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Parse the generated archive per call and with a shared archive"""
+        resources = options["resources"]
+        with TemporaryDirectory() as tempdir:
+            archive_path = Path(tempdir, "course.imscc")
+            with zipfile.ZipFile(archive_path, "w") as archive:
+                archive.writestr("imsmanifest.xml", _manifest_xml(resources))
+                archive.writestr("course_settings/course_settings.xml", SETTINGS_XML)
+                archive.writestr(
+                    "course_settings/module_meta.xml", _module_xml(resources)
+                )
+                for idx in range(resources):
+                    archive.writestr(
+                        f"web_resources/file{idx}.pdf", f"Benchmark file {idx}"
+                    )
+
+            for label, parse in (
+                ("per call", lambda: _parse_archive(archive_path, {})),
+                ("shared", lambda: _parse_shared(archive_path)),
+            ):
+                tracemalloc.start()
+                start = perf_counter()
+                parse()
+                elapsed = perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                self.stdout.write(
+                    f"{label}: {resources} files in {elapsed:.2f}s, "
+                    f"peak {peak / 1024 / 1024:.1f} MiB"
+                )
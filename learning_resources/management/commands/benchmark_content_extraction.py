@@ -0,0 +1,127 @@
+"""Management command to benchmark course archive content extraction throughput"""
+
+import json
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter, sleep
+from unittest import mock
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from learning_resources.etl import utils
+from learning_resources.models import LearningResourceRun
+
+
+class StubTikaHandler(BaseHTTPRequestHandler):
+    """Answer Tika rmeta requests after a fixed delay"""
+
+    latency = 0
+
+    def do_PUT(self):
+        """Return the request body as the extracted text"""
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        sleep(self.latency)
+        payload = json.dumps(
+            [{"X-TIKA:content": body.decode("utf-8", "replace"), "title": ""}]
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Keep request logging out of the benchmark output"""
+
+
+class Command(BaseCommand):
+    """
+    Time process_olx_path over a generated archive, sequentially and with the
+    extraction thread pool, against a local stub Tika server.
+
+    The stub answers every file after --latency-ms, so the numbers show how
+    much of a real server's latency the thread pool hides.
+    """
+
+    help = "Benchmark sequential vs concurrent Tika extraction of course files"
+
+    def add_arguments(self, parser):
+        """Configure arguments for this command"""
+        parser.add_argument(
+            "--files",
+            dest="files",
+            type=int,
+            default=200,
+            help="Number of files in the generated archive",
+        )
+        parser.add_argument(
+            "--latency-ms",
+            dest="latency_ms",
+            type=int,
+            default=50,
+            help="Delay of the stub Tika server per file",
+        )
+        parser.add_argument(
+            "--workers",
+            dest="workers",
+            type=int,
+            default=settings.CONTENT_FILE_EXTRACTION_WORKERS,
+            help="Number of extraction workers to compare against one",
+        )
+        super().add_arguments(parser)
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Run the extraction with one worker and with --workers"""
+        run = LearningResourceRun.objects.order_by("id").first()
+        if run is None:
+            msg = "At least one learning resource run is needed to benchmark"
+            raise CommandError(msg)
+
+        handler = type(
+            "Handler", (StubTikaHandler,), {"latency": options["latency_ms"] / 1000}
+        )
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        Thread(target=server.serve_forever, daemon=True).start()
+        endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+
+        try:
+            with (
+                TemporaryDirectory() as tempdir,
+                mock.patch.object(
+                    utils.tika_parser,
+                    "from_buffer",
+                    partial(utils.tika_parser.from_buffer, serverEndpoint=endpoint),
+                ),
+            ):
+                olx_path = Path(tempdir, "course")
+                html_path = olx_path / "html"
+                html_path.mkdir(parents=True)
+                for idx in range(options["files"]):
+                    (html_path / f"file{idx}.html").write_text(
+                        f"<p>Benchmark file {idx}</p>"
+                    )
+
+                for workers in sorted({1, options["workers"]}):
+                    with override_settings(
+                        SKIP_TIKA=False, CONTENT_FILE_EXTRACTION_WORKERS=workers
+                    ):
+                        start = perf_counter()
+                        extracted = sum(
+                            1
+                            for _ in utils.process_olx_path(
+                                str(olx_path), run, overwrite=True
+                            )
+                        )
+                        elapsed = perf_counter() - start
+                    self.stdout.write(
+                        f"{workers} worker(s): {extracted} files in {elapsed:.2f}s "
+                        f"({extracted / elapsed:.1f} files/s)"
+                    )
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -16,8 +16,9 @@ from django.db.models import (
     OuterRef,
     Prefetch,
     Q,
+    Subquery,
 )
-from django.db.models.functions import Lower
+from django.db.models.functions import Coalesce, JSONObject, Lower
 from django.utils import timezone
 
 from learning_resources import constants
@@ -342,6 +343,23 @@ class LearningResourceInstructor(TimestampedModel):
         return self.full_name or f"{self.first_name} {self.last_name}"
 
 
+def _view_event_count():
+    """
+    Return the number of view events of each resource, which is its views count
+    when it has no view_count
+    """
+    return Coalesce(
+        Subquery(
+            LearningResourceViewEvent.objects.filter(learning_resource=OuterRef("pk"))
+            .order_by()
+            .values("learning_resource")
+            .annotate(count=Count("id"))
+            .values("count")
+        ),
+        0,
+    )
+
+
 class LearningResourceQuerySet(TimestampedModelQuerySet):
     """QuerySet for LearningResource"""
 
@@ -364,6 +382,127 @@ class LearningResourceQuerySet(TimestampedModelQuerySet):
             )
         )
 
+    def search_fingerprints(self):
+        """
+        Return a fingerprint of everything each resource's search document is
+        built from: its own fields, the updated_on of its runs, content files,
+        relationships and detail model, the instructors and prices of its runs,
+        and the rows of its many-to-many relations and related objects,
+        including their names.
+
+        Fields written with bulk_update or update_fields (e.g. view_count) do
+        not bump updated_on, so they are fingerprinted directly, and so are the
+        names of related rows, since renaming one does not touch the resource,
+        and the number of view events.
+
+        Fields that change with time alone (best_run_id, featured_rank) are not
+        covered; serialize_bulk_learning_resources recomputes them on cache hits.
+
+        Each related set is a correlated subquery, so this is a single query.
+
+        Returns:
+            dict: resource id -> fingerprint (str)
+        """
+
+        def stamps(queryset):
+            return ArraySubquery(queryset.order_by("id").values("updated_on"))
+
+        def rows(queryset, **fields):
+            return ArraySubquery(
+                queryset.order_by("pk").values(row=JSONObject(**fields))
+            )
+
+        detail_fields = [
+            f"{subclass.get_learning_resource_related_name()}__updated_on"
+            for subclass in LearningResourceDetailModel.__subclasses__()
+        ]
+        rows_by_resource = self.annotate(
+            run_stamps=stamps(
+                LearningResourceRun.objects.filter(learning_resource=OuterRef("pk"))
+            ),
+            run_instructor_rows=rows(
+                RunInstructorRelationship.objects.filter(
+                    run__learning_resource=OuterRef("pk")
+                ),
+                run="run_id",
+                position="position",
+                instructor="instructor_id",
+                first_name="instructor__first_name",
+                last_name="instructor__last_name",
+                full_name="instructor__full_name",
+            ),
+            run_price_rows=rows(
+                LearningResourceRun.resource_prices.through.objects.filter(
+                    learningresourcerun__learning_resource=OuterRef("pk")
+                ),
+                run="learningresourcerun_id",
+                amount="learningresourceprice__amount",
+                currency="learningresourceprice__currency",
+            ),
+            content_file_stamps=stamps(
+                ContentFile.objects.filter(direct_learning_resource=OuterRef("pk"))
+            ),
+            child_stamps=stamps(
+                LearningResourceRelationship.objects.filter(parent=OuterRef("pk"))
+            ),
+            parent_stamps=stamps(
+                LearningResourceRelationship.objects.filter(child=OuterRef("pk"))
+            ),
+            topic_rows=rows(
+                LearningResourceTopic.objects.filter(learningresource=OuterRef("pk")),
+                id="pk",
+                name="name",
+                parent="parent_id",
+                updated_on="updated_on",
+            ),
+            department_rows=rows(
+                LearningResourceDepartment.objects.filter(
+                    learningresource=OuterRef("pk")
+                ),
+                id="pk",
+                name="name",
+                school="school__name",
+                updated_on="updated_on",
+            ),
+            tag_rows=rows(
+                LearningResourceContentTag.objects.filter(
+                    learningresource=OuterRef("pk")
+                ),
+                id="pk",
+                name="name",
+            ),
+            price_rows=rows(
+                LearningResourcePrice.objects.filter(learningresource=OuterRef("pk")),
+                amount="amount",
+                currency="currency",
+            ),
+            view_event_count=_view_event_count(),
+        ).values(
+            "id",
+            "updated_on",
+            "view_count",
+            "view_event_count",
+            "image__updated_on",
+            "platform__updated_on",
+            "offered_by__name",
+            "offered_by__updated_on",
+            "run_stamps",
+            "run_instructor_rows",
+            "run_price_rows",
+            "content_file_stamps",
+            "child_stamps",
+            "parent_stamps",
+            "topic_rows",
+            "department_rows",
+            "tag_rows",
+            "price_rows",
+            *detail_fields,
+        )
+        return {
+            row["id"]: checksum_for_content(repr(sorted(row.items())))
+            for row in rows_by_resource
+        }
+
     def for_serialization(self):
         """Return the list of prefetches"""
         return self.prefetch_related(
@@ -470,18 +609,42 @@ class LearningResourceQuerySet(TimestampedModelQuerySet):
             *LearningResourceDetailModel.get_subclass_prefetches(),
         ).select_related("image", "platform")
 
-    def for_search_serialization(self):
-        return self.for_serialization().prefetch_related(
+    def with_featured_learning_path_parents(self):
+        """Prefetch the channel featured lists each resource is in"""
+        return self.prefetch_related(
             Prefetch(
                 "parents",
                 queryset=LearningResourceRelationship.objects.filter(
                     relation_type=LearningResourceRelationTypes.LEARNING_PATH_ITEMS.value,
                     parent__channel__isnull=False,
-                ),
+                ).order_by("position"),
                 to_attr="_featured_learning_path_parents",
             )
         )
 
+    def for_search_serialization(self):
+        return (
+            self.for_serialization()
+            .with_featured_learning_path_parents()
+            .annotate(view_event_count=_view_event_count())
+        )
+
+    def for_search_document_refresh(self):
+        """
+        Return the prefetches needed to recompute the search document fields
+        that change without any of the resource's rows changing (its best run
+        and featured rank)
+        """
+        return self.with_featured_learning_path_parents().prefetch_related(
+            Prefetch(
+                "runs",
+                queryset=LearningResourceRun.objects.public().order_by(
+                    "start_date", "enrollment_start", "id"
+                ),
+                to_attr="_published_runs",
+            )
+        )
+
 
 class LearningResource(TimestampedModel):
     """Core model for all learning resources"""
@@ -717,6 +880,8 @@ class LearningResource(TimestampedModel):
         """Return the number of views for the resource."""
         if self.view_count is not None:
             return self.view_count
+        if hasattr(self, "view_event_count"):
+            return self.view_event_count
 
         return LearningResourceViewEvent.objects.filter(learning_resource=self).count()
 
@@ -731,6 +896,25 @@ class LearningResource(TimestampedModel):
             parent__channel__isnull=False,
         ).count()
 
+    def featured_list_position_for_serialization(self) -> int | None:
+        """Return the resource's lowest position in a channel's featured list."""
+        if hasattr(self, "_featured_learning_path_parents"):
+            return min(
+                (
+                    relationship.position
+                    for relationship in self._featured_learning_path_parents
+                ),
+                default=None,
+            )
+        relationship = (
+            LearningResourceRelationship.objects.filter(
+                child=self, parent__channel__isnull=False
+            )
+            .order_by("position")
+            .first()
+        )
+        return relationship.position if relationship else None
+
     @cached_property
     def podcasts(self) -> list["LearningResourceRelationship"]:
         """Return a list of podcasts that the resource is in"""
@@ -369,6 +369,21 @@ def resource_upserted_actions(
     )
 
 
+def bulk_resources_upserted_actions(
+    resource_ids: list[int], resource_type: str, *, generate_embeddings: bool
+):
+    """
+    Trigger plugins when multiple LearningResources are created or updated
+    """
+    pm = get_plugin_manager()
+    hook = pm.hook
+    hook.bulk_resources_upserted(
+        resource_ids=resource_ids,
+        resource_type=resource_type,
+        generate_embeddings=generate_embeddings,
+    )
+
+
 def resource_unpublished_actions(resource: LearningResource):
     """
     Unpublish a resource's direct content files (e.g. marketing pages) and
@@ -979,7 +979,10 @@ class TopicViewSet(viewsets.ReadOnlyModelViewSet):
 
     @method_decorator(
         cache_page_for_all_users(
-            settings.REDIS_VIEW_CACHE_DURATION, cache="redis", key_prefix="topics"
+            settings.REDIS_VIEW_CACHE_DURATION,
+            cache="views",
+            key_prefix="topics",
+            soft_timeout=settings.REDIS_VIEW_CACHE_SOFT_DURATION,
         )
     )
     def list(self, request, *args, **kwargs):
@@ -1347,7 +1350,7 @@ class DepartmentViewSet(viewsets.ReadOnlyModelViewSet):
 
     @method_decorator(
         cache_page_for_all_users(
-            settings.REDIS_VIEW_CACHE_DURATION, cache="redis", key_prefix="departments"
+            settings.REDIS_VIEW_CACHE_DURATION, cache="views", key_prefix="departments"
         )
     )
     def list(self, *args, **kwargs):
@@ -1370,7 +1373,7 @@ class SchoolViewSet(viewsets.ReadOnlyModelViewSet):
 
     @method_decorator(
         cache_page_for_all_users(
-            settings.REDIS_VIEW_CACHE_DURATION, cache="redis", key_prefix="schools"
+            settings.REDIS_VIEW_CACHE_DURATION, cache="views", key_prefix="schools"
         )
     )
     def list(self, *args, **kwargs):
@@ -1393,7 +1396,7 @@ class PlatformViewSet(viewsets.ReadOnlyModelViewSet):
 
     @method_decorator(
         cache_page_for_all_users(
-            settings.REDIS_VIEW_CACHE_DURATION, cache="redis", key_prefix="platforms"
+            settings.REDIS_VIEW_CACHE_DURATION, cache="views", key_prefix="platforms"
         )
     )
     def list(self, *args, **kwargs):
@@ -1524,6 +1527,7 @@ class FeaturedViewSet(
             settings.REDIS_VIEW_CACHE_DURATION,
             cache="redis",
             key_prefix="featured_resources",
+            soft_timeout=settings.REDIS_VIEW_CACHE_SOFT_DURATION,
         )
     )
     @extend_schema(
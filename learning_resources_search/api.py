@@ -2,7 +2,7 @@
 
 import logging
 import re
-from collections import Counter
+from collections import Counter, defaultdict
 from datetime import UTC, datetime
 
 from django.conf import settings
@@ -17,6 +17,7 @@ from learning_resources.serializers import (
     LearningResourceSerializer,
 )
 from learning_resources_search.connection import (
+    get_conn,
     get_default_alias_name,
     get_vector_model_id,
 )
@@ -49,6 +50,7 @@ from learning_resources_search.utils import (
     adjust_search_for_percolator,
     document_percolated_actions,
 )
+from main.utils import chunks
 from vector_search.constants import (
     RESOURCES_COLLECTION_NAME,
     TOPICS_COLLECTION_NAME,
@@ -684,6 +686,79 @@ def percolate_matches_for_document(document_id):
     return percolated_queries
 
 
+def _percolate_documents(conn, resource_type, resource_ids):
+    """
+    Percolate the indexed documents of resources in one multi-document search
+
+    Returns:
+        dict: sets of matching percolate query ids by resource id
+    """
+    documents = []
+    for doc in conn.mget(
+        index=get_default_alias_name(resource_type),
+        body={"ids": [str(resource_id) for resource_id in resource_ids]},
+    )["docs"]:
+        if doc.get("found"):
+            documents.append(doc)
+        else:
+            log.info("document %s not found in index", doc["_id"])
+    percolate_ids = defaultdict(set)
+    if not documents:
+        return percolate_ids
+    search = Search(index=get_default_alias_name(PERCOLATE_INDEX_TYPE))
+    results = search.query(
+        Percolate(field="query", documents=[doc["_source"] for doc in documents])
+    ).scan()
+    for result in results:
+        # Each hit lists the positions of the documents it matched
+        for slot in result.to_dict().get("_percolator_document_slot", []):
+            percolate_ids[int(documents[slot]["_id"])].add(int(result.meta.id))
+    return percolate_ids
+
+
+def percolate_matches_for_documents(resources):
+    """
+    Percolate matching queries for many learning resources at once
+    and call signal handler with matches
+
+    Args:
+        resources (list of LearningResource): the resources to percolate
+
+    Returns:
+        dict: lists of matching PercolateQuery objects by resource id
+    """
+    resource_ids_by_type = defaultdict(list)
+    for resource in resources:
+        resource_ids_by_type[resource.resource_type].append(resource.id)
+    conn = get_conn()
+    percolate_ids_by_resource = {}
+    for resource_type, resource_ids in resource_ids_by_type.items():
+        try:
+            for resource_ids_chunk in chunks(
+                resource_ids, chunk_size=settings.OPENSEARCH_PERCOLATE_CHUNK_SIZE
+            ):
+                percolate_ids_by_resource.update(
+                    _percolate_documents(conn, resource_type, resource_ids_chunk)
+                )
+        except NotFoundError:
+            # A missing index only skips the resources of its type
+            log.info("index for %s not found, skipping percolation", resource_type)
+
+    percolated_queries = PercolateQuery.objects.in_bulk(
+        set().union(*percolate_ids_by_resource.values())
+    )
+    matches = {}
+    for resource in resources:
+        matches[resource.id] = [
+            percolated_queries[percolate_id]
+            for percolate_id in sorted(percolate_ids_by_resource.get(resource.id, []))
+            if percolate_id in percolated_queries
+        ]
+        if matches[resource.id]:
+            document_percolated_actions(resource, matches[resource.id])
+    return matches
+
+
 def add_text_query_to_search(
     search, text, search_params, query_type_query, use_hybrid_search
 ):
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, Mock
 import pytest
 from freezegun import freeze_time
 from opensearch_dsl import response
+from opensearchpy.exceptions import NotFoundError
 
 from learning_resources.constants import OCW_CONTENT_CATEGORY_OPEN_TEXTBOOKS
 from learning_resources.factories import LearningResourceFactory
@@ -23,6 +24,7 @@ from learning_resources_search.api import (
     get_similar_topics,
     get_similar_topics_qdrant,
     percolate_matches_for_document,
+    percolate_matches_for_documents,
     relevant_indexes,
 )
 from learning_resources_search.connection import get_default_alias_name
@@ -4401,6 +4403,118 @@ def test_document_percolation(opensearch, mocker):
     )
 
 
+@pytest.mark.django_db
+def test_percolate_matches_for_documents(mocker, settings):
+    """
+    Documents should be percolated together, one search per type and chunk,
+    and matches mapped back to their resources by document slot
+    """
+    settings.OPENSEARCH_PERCOLATE_CHUNK_SIZE = 2
+    courses = LearningResourceFactory.create_batch(3, is_course=True)
+    program = LearningResourceFactory.create(is_program=True)
+    missing = LearningResourceFactory.create(is_course=True)
+    queries = PercolateQueryFactory.create_batch(2)
+    mock_conn = mocker.patch(
+        "learning_resources_search.api.get_conn", autospec=True
+    ).return_value
+
+    def mget(index, body):
+        return {
+            "docs": [
+                {"_id": doc_id, "found": True, "_source": {"id": int(doc_id)}}
+                if int(doc_id) != missing.id
+                else {"_id": doc_id, "found": False}
+                for doc_id in body["ids"]
+            ]
+        }
+
+    mock_conn.mget.side_effect = mget
+    percolated = []
+
+    def mock_scan(search_self):
+        documents = search_self.to_dict()["query"]["percolate"]["documents"]
+        percolated.append([doc["id"] for doc in documents])
+        # the first query matches every document, the second only the first one
+        yield response.Hit(
+            {
+                "_id": str(queries[0].id),
+                "_source": {"id": queries[0].id},
+                "fields": {"_percolator_document_slot": list(range(len(documents)))},
+            }
+        )
+        yield response.Hit(
+            {
+                "_id": str(queries[1].id),
+                "_source": {"id": queries[1].id},
+                "fields": {"_percolator_document_slot": [0]},
+            }
+        )
+
+    mocker.patch.object(Search, "scan", autospec=True, side_effect=mock_scan)
+    mock_percolated_actions = mocker.patch(
+        "learning_resources_search.api.document_percolated_actions"
+    )
+
+    matches = percolate_matches_for_documents([*courses, missing, program])
+
+    assert percolated == [
+        [courses[0].id, courses[1].id],
+        [courses[2].id],
+        [program.id],
+    ]
+    assert matches == {
+        courses[0].id: queries,
+        courses[1].id: [queries[0]],
+        courses[2].id: queries,
+        missing.id: [],
+        program.id: queries,
+    }
+    assert mock_percolated_actions.call_count == 4
+
+
+@pytest.mark.django_db
+def test_percolate_matches_for_documents_missing_index(mocker):
+    """A missing index should only skip percolating the resources of its type"""
+    course = LearningResourceFactory.create(is_course=True)
+    program = LearningResourceFactory.create(is_program=True)
+    query = PercolateQueryFactory.create()
+    mock_conn = mocker.patch(
+        "learning_resources_search.api.get_conn", autospec=True
+    ).return_value
+
+    def mget(index, body):
+        if index == get_default_alias_name(course.resource_type):
+            raise NotFoundError(404, "index_not_found_exception")
+        return {
+            "docs": [
+                {"_id": doc_id, "found": True, "_source": {"id": int(doc_id)}}
+                for doc_id in body["ids"]
+            ]
+        }
+
+    mock_conn.mget.side_effect = mget
+    mocker.patch.object(
+        Search,
+        "scan",
+        autospec=True,
+        return_value=[
+            response.Hit(
+                {
+                    "_id": str(query.id),
+                    "_source": {"id": query.id},
+                    "fields": {"_percolator_document_slot": [0]},
+                }
+            )
+        ],
+    )
+    mocker.patch("learning_resources_search.api.document_percolated_actions")
+
+    assert percolate_matches_for_documents([course, program]) == {
+        course.id: [],
+        program.id: [query],
+    }
+
+
 @pytest.mark.parametrize(
     ("sortby", "q", "result"),
     [
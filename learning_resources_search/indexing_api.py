@@ -2,14 +2,18 @@
 Functions and constants for OpenSearch indexing
 """
 
-import json
 import logging
-from math import ceil
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from resource import RUSAGE_SELF, getrusage
+from time import perf_counter
 
+import rapidjson
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from opensearchpy.exceptions import ConflictError, NotFoundError
 from opensearchpy.helpers import BulkIndexError, bulk
+from opensearchpy.helpers.actions import expand_action
+from opensearchpy.serializer import JSONSerializer
 
 from learning_resources.models import ContentFile, LearningResourceRun
 from learning_resources_search.connection import (
@@ -45,11 +49,18 @@ from learning_resources_search.serializers import (
     serialize_content_file_for_bulk_deletion,
 )
 from main.utils import chunks
-from vector_search.utils import dense_encoder, retrieve_points_matching_params
+from vector_search.utils import (
+    dense_encoder,
+    retrieve_resource_vectors,
+    vector_point_id,
+    vector_point_key,
+)
 
 log = logging.getLogger(__name__)
 User = get_user_model()
 
+_bulk_serializer = JSONSerializer()
+
 
 def clear_featured_rank(rank, clear_all_greater_than):
     """
@@ -279,60 +290,174 @@ def deindex_items(documents, object_type, index_types, **kwargs):
                 raise ReindexError(msg) from error
 
 
-def index_items(documents, object_type, index_types, **kwargs):
+def _encode_bulk_value(value):
+    """
+    Serialize one line of a bulk request body. Strings are assumed to already be
+    serialized, matching opensearch-py.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return rapidjson.dumps(value, default=_bulk_serializer.default)
+
+
+def _encode_bulk_action(document):
+    """
+    Serialize a bulk action and its source, once, so that the same encoded lines
+    can be sent to every active alias
+
+    Args:
+        document (dict): An opensearch document or bulk action
+
+    Returns:
+        tuple: ((action line, source line or None), size of both lines in bytes)
+    """
+    action, data = expand_action(document)
+    action = _encode_bulk_value(action)
+    data = _encode_bulk_value(data)
+    # rapidjson escapes non-ascii characters by default, so str length is byte length
+    size = len(action) + 1
+    if data is not None:
+        size += len(data) + 1
+    return (action, data), size
+
+
+def _expand_encoded_action(encoded_action):
+    """expand_action_callback for actions already encoded by _encode_bulk_action"""
+    return encoded_action
+
+
+def _pack_bulk_actions(documents, object_type):
+    """
+    Serialize documents and pack them into chunks which respect both
+    OPENSEARCH_INDEXING_CHUNK_SIZE and OPENSEARCH_MAX_REQUEST_SIZE
+
+    Args:
+        documents (iterable of dict): An iterable with opensearch documents to index
+        object_type (str): the ES object type
+
+    Yields:
+        tuple: (list of encoded actions, size of the chunk in bytes)
+    """
+    chunk = []
+    chunk_size = 0
+    for document in documents:
+        encoded_action, size = _encode_bulk_action(document)
+        if size > settings.OPENSEARCH_MAX_REQUEST_SIZE:
+            log.error(
+                "Document id %s for object_type %s exceeds max size %d: %d",
+                document.get("_id") if isinstance(document, dict) else document,
+                object_type,
+                settings.OPENSEARCH_MAX_REQUEST_SIZE,
+                size,
+            )
+            continue
+        if chunk and (
+            len(chunk) >= settings.OPENSEARCH_INDEXING_CHUNK_SIZE
+            or chunk_size + size > settings.OPENSEARCH_MAX_REQUEST_SIZE
+        ):
+            yield chunk, chunk_size
+            chunk = []
+            chunk_size = 0
+        chunk.append(encoded_action)
+        chunk_size += size
+    if chunk:
+        yield chunk, chunk_size
+
+
+def _bulk_index_chunk(conn, chunk, alias, object_type, **kwargs):
+    """
+    Send one encoded chunk of bulk actions to an alias
+
+    Actions rejected with a 429 are retried with exponential backoff by the
+    bulk helper, which also throttles the thread sending the chunk.
+
+    Args:
+        conn (OpenSearch): The opensearch connection
+        chunk (list of tuple): Actions encoded by _encode_bulk_action
+        alias (str): The alias to send the chunk to
+        object_type (str): the ES object type
+    """
+    _, errors = bulk(
+        conn,
+        chunk,
+        index=alias,
+        chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        max_chunk_bytes=settings.OPENSEARCH_MAX_REQUEST_SIZE,
+        expand_action_callback=_expand_encoded_action,
+        max_retries=settings.OPENSEARCH_BULK_MAX_RETRIES,
+        initial_backoff=settings.OPENSEARCH_BULK_INITIAL_BACKOFF,
+        **kwargs,
+    )
+    if len(errors) > 0:
+        log.error(errors)
+        msg = f"Error during bulk {object_type} insert: {errors}"
+        raise ReindexError(msg)
+
+
+def index_items(documents, object_type, index_types, *, max_in_flight=1, **kwargs):
     """
     Index items based on list of item ids
 
+    Each document is serialized once and packed into request bodies as the
+    documents stream in; the encoded chunk is then sent to every active alias.
+    With max_in_flight > 1, up to that many bulk requests are sent from worker
+    threads while the next chunk is serialized, and serialization blocks once
+    that many requests are outstanding.
+
     Args:
         documents (iterable of dict): An iterable with opensearch documents to index
         object_type (str): the ES object type
         index_types (string): one of the values IndexestoUpdate. Whether the default
             index, the reindexing index or both need to be updated
+        max_in_flight (int): The maximum number of concurrent bulk requests
     """
     conn = get_conn()
-    # bulk will also break an iterable into chunks. However we should do this here so
-    # that we can use the same documents when indexing to multiple aliases.
-    for chunk in chunks(documents, chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE):
-        documents_size = len(json.dumps(chunk, default=str))
-        # Keep chunking the chunks until either the size is acceptable or there's
-        # nothing left to chunk
-        if documents_size > settings.OPENSEARCH_MAX_REQUEST_SIZE:
-            if len(chunk) == 1:
-                log.error(
-                    "Document id %s for object_type %s exceeds max size %d: %d",
-                    chunk[0]["_id"],
-                    object_type,
-                    settings.OPENSEARCH_MAX_REQUEST_SIZE,
-                    documents_size,
-                )
-                continue
-            num_chunks = min(
-                ceil(
-                    len(chunk)
-                    / ceil(documents_size / settings.OPENSEARCH_MAX_REQUEST_SIZE)
-                ),
-                len(chunk) - 1,
-            )
-            for smaller_chunk in chunks(chunk, chunk_size=num_chunks):
-                index_items(smaller_chunk, object_type, index_types, **kwargs)
-        else:
+    start = perf_counter()
+    total_documents = 0
+    total_bytes = 0
+    executor = (
+        ThreadPoolExecutor(max_workers=max_in_flight) if max_in_flight > 1 else None
+    )
+    in_flight = set()
+    try:
+        for chunk, chunk_size in _pack_bulk_actions(documents, object_type):
+            total_documents += len(chunk)
+            total_bytes += chunk_size
             for alias in get_active_aliases(
                 conn, object_types=[object_type], index_types=index_types
             ):
-                _, errors = bulk(
-                    conn,
-                    chunk,
-                    index=alias,
-                    chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
-                    **kwargs,
+                if executor is None:
+                    _bulk_index_chunk(conn, chunk, alias, object_type, **kwargs)
+                    continue
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                in_flight.add(
+                    executor.submit(
+                        _bulk_index_chunk, conn, chunk, alias, object_type, **kwargs
+                    )
                 )
-                if len(errors) > 0:
-                    log.error(errors)
-                    msg = f"Error during bulk {object_type} insert: {errors}"
-                    raise ReindexError(msg)
+        for future in wait(in_flight).done:
+            future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    if total_documents:
+        elapsed = perf_counter() - start
+        log.info(
+            "Bulk indexed %d %s documents (%d bytes) in %.2fs (%.1f docs/s), "
+            "peak worker memory %d KB",
+            total_documents,
+            object_type,
+            total_bytes,
+            elapsed,
+            total_documents / elapsed if elapsed else 0,
+            getrusage(RUSAGE_SELF).ru_maxrss,
+        )
 
 
-def index_learning_resources(ids, base_index_name, index_types):
+def index_learning_resources(ids, base_index_name, index_types, *, max_in_flight=1):
     """
     Index a list of learning resources by id
 
@@ -341,6 +466,7 @@ def index_learning_resources(ids, base_index_name, index_types):
         base_index_name: The resource type of the resources or HYBRID_COMBINED_INDEX
         index_types (string): one of the values IndexestoUpdate. Whether the default
             index, the reindexing index or both need to be updated
+        max_in_flight (int): The maximum number of concurrent bulk requests
 
     """
     if base_index_name == HYBRID_COMBINED_INDEX:
@@ -348,35 +474,47 @@ def index_learning_resources(ids, base_index_name, index_types):
             serialize_bulk_learning_resources_with_embeddings(ids),
             HYBRID_COMBINED_INDEX,
             index_types,
+            max_in_flight=max_in_flight,
         )
     else:
         index_items(
-            serialize_bulk_learning_resources(ids), base_index_name, index_types
+            serialize_bulk_learning_resources(ids),
+            base_index_name,
+            index_types,
+            max_in_flight=max_in_flight,
         )
 
 
 def serialize_bulk_learning_resources_with_embeddings(ids):
     """
-    Serialize learning resources including vector embeddings for bulk indexing
+    Serialize learning resources including vector embeddings for bulk indexing.
+
+    Vectors are fetched from Qdrant one chunk at a time with a single retrieve
+    call per chunk rather than one scroll per resource.
 
     Args:
         ids(list of int): List of learning resource id's
     """
-    serialized_resources = serialize_bulk_learning_resources(ids)
-    for resource in serialized_resources:
-        vector_result = list(
-            retrieve_points_matching_params(
-                {"readable_id": resource["readable_id"]}, with_vectors=True
-            )
+    total = 0
+    missing = 0
+    for chunk in chunks(
+        serialize_bulk_learning_resources(ids),
+        chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+    ):
+        vectors = retrieve_resource_vectors(chunk)
+        for resource in chunk:
+            total += 1
+            vector = vectors.get(vector_point_id(vector_point_key(resource)))
+            if vector is None:
+                missing += 1
+            else:
+                resource["vector_embedding"] = vector
+            yield resource
+    if missing:
+        log.warning(
+            "%d of %d learning resources had no vector in Qdrant", missing, total
         )
 
-        if len(vector_result) > 0:
-            resource["vector_embedding"] = vector_result[0].vector.get(
-                dense_encoder().model_short_name()
-            )
-
-        yield resource
-
 
 def deindex_learning_resources(ids, base_index_name):
     """
@@ -458,7 +596,12 @@ def index_run_content_files(run_id, index_types):
 
 
 def index_content_files(
-    content_file_ids, learning_resource_id, index_types, resource_type=COURSE_TYPE
+    content_file_ids,
+    learning_resource_id,
+    index_types,
+    resource_type=COURSE_TYPE,
+    *,
+    max_in_flight=1,
 ):
     """
     Index a list of content files
@@ -469,6 +612,7 @@ def index_content_files(
         index_types (string): one of the values IndexestoUpdate. Whether the default
             index, the reindexing index or both need to be updated
         resource_type (string): The resource type of the parent learning resource
+        max_in_flight (int): The maximum number of concurrent bulk requests
     """
 
     documents = (
@@ -482,6 +626,7 @@ def index_content_files(
         documents,
         resource_type,
         index_types=index_types,
+        max_in_flight=max_in_flight,
         routing=learning_resource_id,
     )
 
@@ -49,10 +49,22 @@ from learning_resources_search.indexing_api import (
 )
 from learning_resources_search.models import PercolateQuery
 from learning_resources_search.utils import remove_child_queries
+from main.test_utils import ConcurrencyProbe
 from main.utils import chunks
+from vector_search.utils import vector_point_id, vector_point_key
 
 pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("mocked_es")]
 
+_expand_encoded_action = indexing_api._expand_encoded_action  # noqa: SLF001
+
+
+def _encoded_chunk(documents):
+    """Encode documents the way index_items passes them to bulk"""
+    return [
+        indexing_api._encode_bulk_action(document)[0]  # noqa: SLF001
+        for document in documents
+    ]
+
 
 @pytest.fixture
 def mocked_es(mocker, settings):
@@ -260,9 +272,13 @@ def test_index_learning_resources(
             ):
                 bulk_mock.assert_any_call(
                     mocked_es.conn,
-                    chunk,
+                    _encoded_chunk(chunk),
                     index=alias,
                     chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+                    max_chunk_bytes=settings.OPENSEARCH_MAX_REQUEST_SIZE,
+                    expand_action_callback=_expand_encoded_action,
+                    max_retries=settings.OPENSEARCH_BULK_MAX_RETRIES,
+                    initial_backoff=settings.OPENSEARCH_BULK_INITIAL_BACKOFF,
                 )
 
 
@@ -306,17 +322,12 @@ def test_index_learning_resources_for_hybrid_index(
         return_value=(doc for doc in documents),
     )
 
-    mock_encoder = mocker.patch(
-        "learning_resources_search.indexing_api.dense_encoder"
-    )()
-    mock_encoder.model_short_name.return_value = "test-encoder-model"
-
-    qdrant_point = mocker.Mock()
-    qdrant_point.vector = {"test-encoder-model": [2, 3]}
-
-    mocker.patch(
-        "learning_resources_search.indexing_api.retrieve_points_matching_params",
-        return_value=[qdrant_point],
+    mock_retrieve = mocker.patch(
+        "learning_resources_search.indexing_api.retrieve_resource_vectors",
+        side_effect=lambda resources: {
+            vector_point_id(vector_point_key(resource)): [2, 3]
+            for resource in resources
+        },
     )
     bulk_mock = mocker.patch(
         "learning_resources_search.indexing_api.bulk",
@@ -329,6 +340,10 @@ def test_index_learning_resources_for_hybrid_index(
             index_learning_resources([1, 2, 3], HYBRID_COMBINED_INDEX, index_types)
     else:
         index_learning_resources([1, 2, 3], HYBRID_COMBINED_INDEX, index_types)
+        # one Qdrant request per chunk rather than one per resource
+        assert mock_retrieve.call_count == ceil(
+            len(documents) / settings.OPENSEARCH_INDEXING_CHUNK_SIZE
+        )
         mock_get_aliases.assert_called_with(
             mocked_es.conn,
             object_types=[HYBRID_COMBINED_INDEX],
@@ -342,9 +357,13 @@ def test_index_learning_resources_for_hybrid_index(
             ):
                 bulk_mock.assert_any_call(
                     mocked_es.conn,
-                    chunk,
+                    _encoded_chunk(chunk),
                     index=alias,
                     chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+                    max_chunk_bytes=settings.OPENSEARCH_MAX_REQUEST_SIZE,
+                    expand_action_callback=_expand_encoded_action,
+                    max_retries=settings.OPENSEARCH_BULK_MAX_RETRIES,
+                    initial_backoff=settings.OPENSEARCH_BULK_INITIAL_BACKOFF,
                 )
 
 
@@ -388,9 +407,13 @@ def test_deindex_learning_resources(mocked_es, mocker, settings, errors):
             ):
                 bulk_mock.assert_any_call(
                     mocked_es.conn,
-                    chunk,
+                    _encoded_chunk(chunk),
                     index=alias,
                     chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+                    max_chunk_bytes=settings.OPENSEARCH_MAX_REQUEST_SIZE,
+                    expand_action_callback=_expand_encoded_action,
+                    max_retries=settings.OPENSEARCH_BULK_MAX_RETRIES,
+                    initial_backoff=settings.OPENSEARCH_BULK_INITIAL_BACKOFF,
                 )
 
 
@@ -445,6 +468,80 @@ def test_index_items_size_limits(settings, mocker, max_size, chunks, exceeds_siz
     assert mock_log.call_count == (10 if exceeds_size else 0)
 
 
+def test_index_items_serializes_once(settings, mocker, mocked_es):
+    """
+    Each document should be serialized once and the encoded chunk reused for
+    every active alias
+    """
+    settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 2
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a", "b"],
+    )
+    bulk_mock = mocker.patch(
+        "learning_resources_search.indexing_api.bulk",
+        autospec=True,
+        return_value=(0, []),
+    )
+    dumps_spy = mocker.spy(indexing_api.rapidjson, "dumps")
+    documents = [{"_id": idx, "title": f"title {idx}"} for idx in range(5)]
+
+    index_items(documents, "course", index_types=IndexestoUpdate.all_indexes.value)
+
+    # one call for each action line and one for each source line
+    assert dumps_spy.call_count == 2 * len(documents)
+    assert bulk_mock.call_count == 6
+    for first_call, second_call in zip(
+        bulk_mock.call_args_list[::2], bulk_mock.call_args_list[1::2]
+    ):
+        assert first_call.args[1] is second_call.args[1]
+    assert bulk_mock.call_args_list[0].args[1] == [
+        ('{"index":{"_id":0}}', '{"title":"title 0"}'),
+        ('{"index":{"_id":1}}', '{"title":"title 1"}'),
+    ]
+
+
+@pytest.mark.parametrize("errors", [[], ["error"]])
+def test_index_items_max_in_flight(settings, mocker, mocked_es, errors):
+    """
+    With max_in_flight > 1 bulk requests should be sent concurrently, up to
+    the limit, and errors should still be raised
+    """
+    settings.OPENSEARCH_INDEXING_CHUNK_SIZE = 1
+    max_in_flight = 2
+    mocker.patch(
+        "learning_resources_search.indexing_api.get_active_aliases",
+        autospec=True,
+        return_value=["a", "b"],
+    )
+    probe = ConcurrencyProbe(max_in_flight)
+    bulk_mock = mocker.patch(
+        "learning_resources_search.indexing_api.bulk",
+        autospec=True,
+        side_effect=probe(lambda *_args, **_kwargs: (0, errors)),
+    )
+    documents = [{"_id": idx} for idx in range(5)]
+
+    if errors:
+        with pytest.raises(ReindexError):
+            index_items(
+                documents,
+                "course",
+                index_types=IndexestoUpdate.all_indexes.value,
+                max_in_flight=max_in_flight,
+            )
+    else:
+        index_items(
+            documents,
+            "course",
+            index_types=IndexestoUpdate.all_indexes.value,
+            max_in_flight=max_in_flight,
+        )
+        assert bulk_mock.call_count == 10
+    assert probe.peak == max_in_flight
+
+
 @pytest.mark.parametrize("delete_reindexing_tags", [True, False])
 def test_delete_orphaned_indexes(mocker, mocked_es, delete_reindexing_tags):
     """
@@ -790,9 +887,13 @@ def test_bulk_index_content_files(  # noqa: PLR0913
             for chunk in chunks([doc for _ in content_files], chunk_size=chunk_size):
                 bulk_mock.assert_any_call(
                     mocked_es.conn,
-                    chunk,
+                    _encoded_chunk(chunk),
                     index=alias,
                     chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+                    max_chunk_bytes=settings.OPENSEARCH_MAX_REQUEST_SIZE,
+                    expand_action_callback=_expand_encoded_action,
+                    max_retries=settings.OPENSEARCH_BULK_MAX_RETRIES,
+                    initial_backoff=settings.OPENSEARCH_BULK_INITIAL_BACKOFF,
                     routing=course.learning_resource_id,
                 )
 
@@ -870,9 +971,13 @@ def test_index_content_files(  # noqa: PLR0913
         for alias in mock_get_aliases.return_value:
             bulk_mock.assert_any_call(
                 mocked_es.conn,
-                [doc for _ in content_files],
+                _encoded_chunk([doc for _ in content_files]),
                 index=alias,
                 chunk_size=6,
+                max_chunk_bytes=settings.OPENSEARCH_MAX_REQUEST_SIZE,
+                expand_action_callback=_expand_encoded_action,
+                max_retries=settings.OPENSEARCH_BULK_MAX_RETRIES,
+                initial_backoff=settings.OPENSEARCH_BULK_INITIAL_BACKOFF,
                 routing=course.learning_resource_id,
             )
 
@@ -0,0 +1,78 @@
+"""Management command to compare Qdrant vector fetch strategies for the hybrid index"""
+
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from learning_resources.models import LearningResource
+from learning_resources_search.serializers import serialize_bulk_learning_resources
+from main.utils import chunks
+from vector_search.utils import (
+    retrieve_points_matching_params,
+    retrieve_resource_vectors,
+)
+
+
+class Command(BaseCommand):
+    """
+    Time per-document vs batched retrieval of resource vectors from Qdrant.
+
+    Serialization is done up front so that only the Qdrant round trips are timed.
+    """
+
+    help = "Benchmark per-document vs batched Qdrant vector retrieval"
+
+    def add_arguments(self, parser):
+        """Configure arguments for this command"""
+        parser.add_argument(
+            "--count",
+            dest="count",
+            type=int,
+            default=500,
+            help="Number of published learning resources to sample",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            dest="chunk_size",
+            type=int,
+            default=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+            help="Number of resources per batched retrieve call",
+        )
+        super().add_arguments(parser)
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Run both retrieval strategies over the same resources"""
+        ids = list(
+            LearningResource.objects.filter(published=True)
+            .order_by("id")
+            .values_list("id", flat=True)[: options["count"]]
+        )
+        resources = list(serialize_bulk_learning_resources(ids))
+
+        start = perf_counter()
+        per_document_found = 0
+        for resource in resources:
+            points = list(
+                retrieve_points_matching_params(
+                    {"readable_id": resource["readable_id"]}, with_vectors=True
+                )
+            )
+            per_document_found += 1 if points else 0
+        per_document_seconds = perf_counter() - start
+
+        start = perf_counter()
+        batched_found = 0
+        for chunk in chunks(resources, chunk_size=options["chunk_size"]):
+            batched_found += len(retrieve_resource_vectors(chunk))
+        batched_seconds = perf_counter() - start
+
+        self.stdout.write(f"resources: {len(resources)}")
+        self.stdout.write(
+            f"per-document: {per_document_seconds:.2f}s, "
+            f"{len(resources) - per_document_found} without a vector"
+        )
+        self.stdout.write(
+            f"batched (chunk size {options['chunk_size']}): {batched_seconds:.2f}s, "
+            f"{len(resources) - batched_found} without a vector"
+        )
@@ -13,6 +13,7 @@ from learning_resources_search.api import get_similar_topics_qdrant
 from learning_resources_search.constants import (
     COURSE_TYPE,
     PERCOLATE_INDEX_TYPE,
+    IndexestoUpdate,
 )
 from main import settings
 from main.utils import chunks
@@ -88,6 +89,36 @@ class SearchIndexPlugin:
 
         try_with_retry_as_task(chain(*upsert_tasks))
 
+    @hookimpl
+    def bulk_resources_upserted(self, resource_ids, resource_type, generate_embeddings):
+        """
+        Upsert multiple created/modified resources to the search index
+
+        Args:
+            resource_ids(list): The Learning Resource ids that were upserted
+            resource_type(str): The Learning Resource type that was upserted
+            generate_embeddings(bool): Whether to regenerate the embeddings
+        """
+        for ids in chunks(
+            resource_ids,
+            chunk_size=settings.OPENSEARCH_INDEXING_CHUNK_SIZE,
+        ):
+            upsert_tasks = [
+                tasks.index_learning_resources.si(
+                    ids, resource_type, IndexestoUpdate.all_indexes.value
+                ),
+            ]
+            if (
+                django_settings.QDRANT_ENABLE_INDEXING_PLUGIN_HOOKS
+                and generate_embeddings
+            ):
+                upsert_tasks.append(
+                    vector_tasks.generate_embeddings.si(
+                        ids, resource_type, overwrite=True
+                    )
+                )
+            try_with_retry_as_task(chain(*upsert_tasks))
+
     @hookimpl
     def resource_unpublished(self, resource):
         """
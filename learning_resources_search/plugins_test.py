@@ -11,7 +11,11 @@ from learning_resources.factories import (
     LearningResourceRunFactory,
 )
 from learning_resources.models import LearningResourceRun
-from learning_resources_search.constants import COURSE_TYPE, PROGRAM_TYPE
+from learning_resources_search.constants import (
+    COURSE_TYPE,
+    PROGRAM_TYPE,
+    IndexestoUpdate,
+)
 from learning_resources_search.plugins import SearchIndexPlugin
 
 
@@ -87,6 +91,38 @@ def test_search_index_plugin_resource_upserted(
     )
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize("generate_embeddings", [True, False])
+def test_search_index_plugin_bulk_resources_upserted(
+    mocker, mock_search_index_helpers, settings, generate_embeddings
+):
+    """bulk_resources_upserted should index the resources in chunks"""
+    settings.QDRANT_ENABLE_INDEXING_PLUGIN_HOOKS = True
+    mocker.patch("main.settings.OPENSEARCH_INDEXING_CHUNK_SIZE", 2)
+    mock_index = mocker.patch(
+        "learning_resources_search.plugins.tasks.index_learning_resources.si"
+    )
+    resource_ids = [1, 2, 3]
+    SearchIndexPlugin().bulk_resources_upserted(
+        resource_ids, COURSE_TYPE, generate_embeddings=generate_embeddings
+    )
+    assert mock_index.call_args_list == [
+        mocker.call([1, 2], COURSE_TYPE, IndexestoUpdate.all_indexes.value),
+        mocker.call([3], COURSE_TYPE, IndexestoUpdate.all_indexes.value),
+    ]
+    if generate_embeddings:
+        assert (
+            mock_search_index_helpers.mock_generate_embeddings_immutable_signature.call_args_list
+            == [
+                mocker.call([1, 2], COURSE_TYPE, overwrite=True),
+                mocker.call([3], COURSE_TYPE, overwrite=True),
+            ]
+        )
+    else:
+        mock_search_index_helpers.mock_generate_embeddings_immutable_signature.assert_not_called()
+    mock_search_index_helpers.mock_upsert_learning_resource_immutable_signature.assert_not_called()
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize("resource_type", [COURSE_TYPE, PROGRAM_TYPE])
 @pytest.mark.parametrize("has_content_files", [True, False])
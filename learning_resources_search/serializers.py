@@ -3,10 +3,12 @@
 import logging
 from collections import OrderedDict, defaultdict
 from datetime import UTC, datetime
+from functools import cache
 from random import random
 from typing import TypedDict
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
 from drf_spectacular.plumbing import build_choice_description_list
 from drf_spectacular.utils import extend_schema_field
@@ -25,9 +27,7 @@ from learning_resources.constants import (
 )
 from learning_resources.models import (
     ContentFile,
-    Course,
     LearningResource,
-    LearningResourceRelationship,
 )
 from learning_resources.serializers import (
     ContentFileSerializer,
@@ -81,7 +81,10 @@ def get_resource_age_date(learning_resource_obj, resource_type_group):
         learning_resource_obj.resource_type == LearningResourceType.course.name
         and not learning_resource_obj.next_start_date
     ):
-        last_run = learning_resource_obj.runs.public().order_by("start_date").last()
+        # published_runs is ordered by start_date with nulls last, matching
+        # runs.public().order_by("start_date").last() without another query
+        published_runs = learning_resource_obj.published_runs
+        last_run = published_runs[-1] if published_runs else None
 
         if last_run:
             if (
@@ -103,6 +106,15 @@ def get_resource_age_date(learning_resource_obj, resource_type_group):
     return resource_age_date
 
 
+@cache
+def _search_resource_serializer():
+    """
+    Return a LearningResourceSerializer shared across search serialization calls,
+    so its field tree is only built once per process
+    """
+    return LearningResourceSerializer()
+
+
 def serialize_learning_resource_for_update(
     learning_resource_obj: LearningResource,
 ) -> dict:
@@ -120,19 +132,20 @@ def serialize_learning_resource_for_update(
     STALENESS_CUTOFF = 2010
     COMPLETENESS_CUTOFF = 0.5
 
-    serialized_data = LearningResourceSerializer(instance=learning_resource_obj).data
+    serialized_data = _search_resource_serializer().to_representation(
+        learning_resource_obj
+    )
 
     if not (serialized_data.get("description") or "").strip():
         serialized_data["description"] = None
 
     if (
         learning_resource_obj.resource_type == LearningResourceType.course.name
-        and Course.objects.filter(learning_resource=learning_resource_obj).exists()
+        and hasattr(learning_resource_obj, "course")
     ):
-        serialized_data["course"]["course_numbers"] = [
-            SearchCourseNumberSerializer(instance=num).data
-            for num in learning_resource_obj.course.course_numbers
-        ]
+        serialized_data["course"]["course_numbers"] = SearchCourseNumberSerializer(
+            learning_resource_obj.course.course_numbers, many=True
+        ).data
 
     if (
         learning_resource_obj.resource_type == LearningResourceType.video.name
@@ -144,25 +157,9 @@ def serialize_learning_resource_for_update(
         # The API serializer omits full text; re-serialize with the full
         # serializer for nested search. Serializes content_files twice, which
         # is acceptable in this celery-only indexing path.
-        serialized_data["content_files"] = [
-            ContentFileSerializer(content_file).data
-            for content_file in (
-                learning_resource_obj.direct_content_files_for_serialization()
-            )
-        ]
-
-    if learning_resource_obj.in_featured_lists > 0:
-        featured_rank = (
-            LearningResourceRelationship.objects.filter(
-                child_id=learning_resource_obj.id, parent__channel__isnull=False
-            )
-            .order_by("position")
-            .first()
-            .position
-            + random()  # noqa: S311
-        )
-    else:
-        featured_rank = None
+        serialized_data["content_files"] = ContentFileSerializer(
+            learning_resource_obj.direct_content_files_for_serialization(), many=True
+        ).data
 
     resource_age_date = get_resource_age_date(
         learning_resource_obj, serialized_data["resource_type_group"]
@@ -178,9 +175,34 @@ def serialize_learning_resource_for_update(
         "is_learning_material": serialized_data["resource_type_group"]
         == LEARNING_MATERIAL_RESOURCE_TYPE_GROUP,
         "resource_age_date": resource_age_date,
-        "featured_rank": featured_rank,
         "is_incomplete_or_stale": is_incomplete_or_stale,
         **serialized_data,
+        **serialize_learning_resource_time_dependent_fields(learning_resource_obj),
+    }
+
+
+def serialize_learning_resource_time_dependent_fields(learning_resource_obj):
+    """
+    Serialize the search document fields of a learning resource that change
+    without any of its rows changing: the best run depends on the current
+    time, and the featured rank is jittered on every serialization
+
+    Args:
+        learning_resource_obj (LearningResource): A learning_resource object
+    """
+    best_run = learning_resource_obj.best_run
+    featured_position = (
+        learning_resource_obj.featured_list_position_for_serialization()
+        if learning_resource_obj.in_featured_lists > 0
+        else None
+    )
+    if featured_position is not None:
+        featured_rank = featured_position + random()  # noqa: S311
+    else:
+        featured_rank = None
+    return {
+        "best_run_id": best_run.id if best_run else None,
+        "featured_rank": featured_rank,
     }
 
 
@@ -723,13 +745,58 @@ def serialize_bulk_learning_resources(ids):
     """
     Serialize learning resource for bulk indexing
 
+    Serialized documents are cached by resource id and fingerprint (see
+    LearningResourceQuerySet.search_fingerprints), so only resources that
+    changed since they were last serialized go through the serializer. The
+    fields of cached documents that change with time alone are recomputed.
+
     Args:
         ids(list of int): List of learning_resource id's
     """
+    cache = caches["search_documents"]
+    cache_keys = {
+        resource_id: f"search_document:{settings.VERSION}:{resource_id}:{fingerprint}"
+        for resource_id, fingerprint in LearningResource.objects.filter(id__in=ids)
+        .search_fingerprints()
+        .items()
+    }
+    cached_documents = cache.get_many(list(cache_keys.values()))
+    uncached_ids = [
+        resource_id
+        for resource_id, cache_key in cache_keys.items()
+        if cache_key not in cached_documents
+    ]
+    documents = {
+        cache_keys[learning_resource.id]: serialize_learning_resource_for_bulk(
+            learning_resource
+        )
+        for learning_resource in LearningResource.objects.filter(
+            id__in=uncached_ids
+        ).for_search_serialization()
+    }
+    # cache before yielding, since callers may add to the documents
+    if documents:
+        cache.set_many(documents)
+    cached_ids = [
+        resource_id
+        for resource_id, cache_key in cache_keys.items()
+        if cache_key in cached_documents
+    ]
     for learning_resource in LearningResource.objects.filter(
-        id__in=ids
-    ).for_search_serialization():
-        yield serialize_learning_resource_for_bulk(learning_resource)
+        id__in=cached_ids
+    ).for_search_document_refresh():
+        cached_documents[cache_keys[learning_resource.id]].update(
+            serialize_learning_resource_time_dependent_fields(learning_resource)
+        )
+    log.debug(
+        "Serialized %d learning resources, %d from cache",
+        len(cache_keys),
+        len(cached_documents),
+    )
+    for cache_key in cache_keys.values():
+        document = cached_documents.get(cache_key) or documents.get(cache_key)
+        if document is not None:
+            yield document
 
 
 def serialize_bulk_content_files(ids):
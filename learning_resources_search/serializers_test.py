@@ -6,8 +6,11 @@ from types import SimpleNamespace
 
 import factory
 import pytest
+from django.db import connection
 from django.db.models import signals
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from freezegun import freeze_time
 from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
@@ -27,7 +30,11 @@ from learning_resources.factories import (
     LearningResourcePriceFactory,
     LearningResourceRunFactory,
 )
-from learning_resources.models import LearningResource
+from learning_resources.models import (
+    LearningResource,
+    LearningResourceDepartment,
+    LearningResourceTopic,
+)
 from learning_resources.serializers import (
     LearningResourceSerializer,
 )
@@ -633,6 +640,223 @@ def test_serialize_bulk_learning_resources(mocker):
         assert result == exp
 
 
+@pytest.mark.django_db
+def test_serialize_bulk_learning_resources_cached(mocker, settings):
+    """
+    serialize_bulk_learning_resources should reuse cached documents until a
+    resource or one of its related rows changes
+    """
+    settings.CACHES = {
+        **settings.CACHES,
+        "search_documents": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "search-documents-test",
+        },
+    }
+    serialize_spy = mocker.spy(serializers, "serialize_learning_resource_for_bulk")
+    resources = factories.LearningResourceFactory.create_batch(3, is_course=True)
+    ids = [resource.id for resource in resources]
+
+    first = sorted(
+        serializers.serialize_bulk_learning_resources(ids), key=lambda x: x["id"]
+    )
+    assert serialize_spy.call_count == 3
+
+    second = sorted(
+        serializers.serialize_bulk_learning_resources(ids), key=lambda x: x["id"]
+    )
+    assert serialize_spy.call_count == 3
+    assert second == first
+
+    resources[0].title = "A new title"
+    resources[0].save()
+    resources[1].topics.add(factories.LearningResourceTopicFactory.create())
+    third = sorted(
+        serializers.serialize_bulk_learning_resources(ids), key=lambda x: x["id"]
+    )
+    assert serialize_spy.call_count == 5
+    assert third[0]["title"] == "A new title"
+    assert third[2] == first[2]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "change",
+    [
+        "view_count",
+        "view_event",
+        "topic_name",
+        "department_name",
+        "instructor",
+        "run_price",
+    ],
+)
+def test_serialize_bulk_learning_resources_cache_invalidation(mocker, settings, change):
+    """
+    Cached documents should be replaced when an input of the search document
+    changes without bumping the resource's updated_on
+    """
+    settings.CACHES = {
+        **settings.CACHES,
+        "search_documents": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": f"search-documents-{change}",
+        },
+    }
+    serialize_spy = mocker.spy(serializers, "serialize_learning_resource_for_bulk")
+    resource = factories.LearningResourceFactory.create(is_course=True)
+    list(serializers.serialize_bulk_learning_resources([resource.id]))
+    assert serialize_spy.call_count == 1
+
+    run = resource.runs.first()
+    if change == "view_count":
+        resource.view_count = 100
+        LearningResource.objects.bulk_update([resource], ["view_count"])
+    elif change == "view_event":
+        factories.LearningResourceViewEventFactory.create(learning_resource=resource)
+    elif change == "topic_name":
+        topic = factories.LearningResourceTopicFactory.create()
+        resource.topics.add(topic)
+        list(serializers.serialize_bulk_learning_resources([resource.id]))
+        LearningResourceTopic.objects.filter(pk=topic.pk).update(name="Renamed")
+    elif change == "department_name":
+        department = factories.LearningResourceDepartmentFactory.create()
+        resource.departments.add(department)
+        list(serializers.serialize_bulk_learning_resources([resource.id]))
+        LearningResourceDepartment.objects.filter(pk=department.pk).update(
+            name="Renamed"
+        )
+    elif change == "instructor":
+        run.instructors.add(factories.LearningResourceInstructorFactory.create())
+    else:
+        run.resource_prices.add(factories.LearningResourcePriceFactory.create())
+    calls_before = serialize_spy.call_count
+
+    list(serializers.serialize_bulk_learning_resources([resource.id]))
+    assert serialize_spy.call_count == calls_before + 1
+
+
+@pytest.mark.django_db
+def test_serialize_bulk_learning_resources_cached_time_dependent_fields(
+    mocker, settings
+):
+    """
+    Cached documents should get a fresh best_run_id and featured_rank, since
+    those change without the resource changing
+    """
+    settings.CACHES = {
+        **settings.CACHES,
+        "search_documents": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "search-documents-time-dependent",
+        },
+    }
+    serialize_spy = mocker.spy(serializers, "serialize_learning_resource_for_bulk")
+    mock_random = mocker.patch(
+        "learning_resources_search.serializers.random", return_value=0.1
+    )
+    resource = factories.LearningResourceFactory.create(is_course=True, runs=[])
+    current_run, next_run = (
+        LearningResourceRunFactory.create(
+            learning_resource=resource,
+            published=True,
+            enrollment_start=None,
+            enrollment_end=None,
+            start_date=start_date,
+            end_date=start_date + timedelta(days=90),
+        )
+        for start_date in (
+            datetime(2024, 1, 1, tzinfo=UTC),
+            datetime(2024, 9, 1, tzinfo=UTC),
+        )
+    )
+    featured_path = LearningPathFactory.create(resources=[]).learning_resource
+    featured_path.resources.add(
+        resource,
+        through_defaults={
+            "relation_type": LearningResourceRelationTypes.LEARNING_PATH_ITEMS,
+            "position": 2,
+        },
+    )
+    channel = ChannelUnitDetailFactory.create(unit=resource.offered_by).channel
+    channel.featured_list = featured_path
+    channel.save()
+
+    with freeze_time("2024-02-01"):
+        (first,) = serializers.serialize_bulk_learning_resources([resource.id])
+    mock_random.return_value = 0.7
+    with freeze_time("2024-07-20"):
+        (second,) = serializers.serialize_bulk_learning_resources([resource.id])
+
+    assert serialize_spy.call_count == 1
+    assert (first["best_run_id"], first["featured_rank"]) == (current_run.id, 2.1)
+    assert (second["best_run_id"], second["featured_rank"]) == (next_run.id, 2.7)
+
+
+@pytest.mark.django_db
+def test_serialize_bulk_learning_resources_cached_order(settings):
+    """Cached and freshly serialized documents should keep the query order"""
+    settings.CACHES = {
+        **settings.CACHES,
+        "search_documents": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "search-documents-order",
+        },
+    }
+    resources = factories.LearningResourceFactory.create_batch(4, is_course=True)
+    ids = [resource.id for resource in resources]
+    list(serializers.serialize_bulk_learning_resources(ids[1::2]))
+
+    expected = list(
+        LearningResource.objects.filter(id__in=ids).values_list("id", flat=True)
+    )
+    assert [
+        document["id"]
+        for document in serializers.serialize_bulk_learning_resources(ids)
+    ] == expected
+
+
+@pytest.mark.django_db
+def test_serialize_bulk_learning_resources_query_count():
+    """
+    The number of queries run by serialize_bulk_learning_resources should not
+    depend on how many resources are in the chunk
+    """
+    featured_path = LearningPathFactory.create(resources=[]).learning_resource
+    offeror = factories.LearningResourceOfferorFactory.create()
+    channel = ChannelUnitDetailFactory.create(unit=offeror).channel
+    channel.featured_list = featured_path
+    channel.save()
+    resource_types = ["is_course", "is_program", "is_video", "is_podcast_episode"]
+
+    query_counts = []
+    for count in (10, 100):
+        resources = [
+            factories.LearningResourceFactory.create(
+                offered_by=offeror, **{resource_types[i % len(resource_types)]: True}
+            )
+            for i in range(count)
+        ]
+        for position, resource in enumerate(resources[::5]):
+            featured_path.resources.add(
+                resource,
+                through_defaults={
+                    "relation_type": LearningResourceRelationTypes.LEARNING_PATH_ITEMS,
+                    "position": position,
+                },
+            )
+        with CaptureQueriesContext(connection) as context:
+            documents = list(
+                serializers.serialize_bulk_learning_resources(
+                    [resource.id for resource in resources]
+                )
+            )
+        assert len(documents) == count
+        query_counts.append(len(context.captured_queries))
+
+    assert query_counts[0] == query_counts[1]
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "resource_type",
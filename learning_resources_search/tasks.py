@@ -3,11 +3,13 @@
 import datetime
 import itertools
 import logging
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from hashlib import md5
 from http import HTTPStatus
 from itertools import groupby
-from random import random
+from random import choice, random
 from urllib.parse import urlencode
 
 import celery
@@ -15,6 +17,7 @@ import requests
 from celery.exceptions import Ignore
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from django.db.models import Q
 from django.template.defaultfilters import pluralize
 from opensearchpy.exceptions import NotFoundError, RequestError
@@ -35,6 +38,7 @@ from learning_resources_search import indexing_api as api
 from learning_resources_search.api import (
     gen_content_file_id,
     percolate_matches_for_document,
+    percolate_matches_for_documents,
 )
 from learning_resources_search.constants import (
     CONTENT_FILE_TYPE,
@@ -72,6 +76,9 @@ log = logging.getLogger(__name__)
 
 # Timeout for the digest email's image liveness check
 IMAGE_CHECK_TIMEOUT_SECONDS = 5
+# Concurrent image liveness checks, and how long their results are cached
+IMAGE_CHECK_WORKERS = 8
+IMAGE_CHECK_CACHE_TIMEOUT = 60 * 60 * 24
 
 
 # For our tasks that attempt to partially update a document, there's a chance that
@@ -249,66 +256,126 @@ def _image_url_is_reachable(url):
     return HTTPStatus.OK <= response.status_code < HTTPStatus.MULTIPLE_CHOICES
 
 
-def _validated_resource_image_url(resource):
+def _validated_resource_image_urls(resources):
     """
-    Return the resource's image URL if it is reachable, otherwise the default
+    Return each resource's image URL if it is reachable, otherwise the default
     resource image. Email clients can't fall back on their own, so a dead URL
     would render as a broken image icon.
+
+    Distinct URLs are checked concurrently, and the results are cached so
+    consecutive digests don't check the same images again.
+    """
+    image_urls = {
+        resource.image.url
+        for resource in resources
+        if resource.image and resource.image.url
+    }
+    cache = caches["redis"]
+    cache_keys = {
+        url: f"image_url_reachable.{md5(url.encode('utf-8')).hexdigest()}"  # noqa: S324
+        for url in image_urls
+    }
+    cached = cache.get_many(cache_keys.values())
+    reachable = {url: cached[key] for url, key in cache_keys.items() if key in cached}
+    unchecked = [url for url in image_urls if url not in reachable]
+    if unchecked:
+        with ThreadPoolExecutor(
+            max_workers=min(IMAGE_CHECK_WORKERS, len(unchecked))
+        ) as executor:
+            reachable.update(
+                zip(unchecked, executor.map(_image_url_is_reachable, unchecked))
+            )
+        cache.set_many(
+            {cache_keys[url]: reachable[url] for url in unchecked},
+            timeout=IMAGE_CHECK_CACHE_TIMEOUT,
+        )
+    default_image_url = frontend_absolute_url("/images/default_resource.jpg")
+    return {
+        resource.id: resource.image.url
+        if resource.image and reachable.get(resource.image.url)
+        else default_image_url
+        for resource in resources
+    }
+
+
+def _validated_resource_image_url(resource):
     """
-    if (
-        resource.image
-        and resource.image.url
-        and _image_url_is_reachable(resource.image.url)
-    ):
-        return resource.image.url
-    return frontend_absolute_url("/images/default_resource.jpg")
+    Return the resource's image URL if it is reachable, otherwise the default
+    resource image.
+    """
+    return _validated_resource_image_urls([resource])[resource.id]
+
+
+def _percolate_query_context(query):
+    """
+    Get the digest email fields that depend only on the percolate query
+    """
+    search_url = _infer_percolate_group_url(query)
+    source_channel = query.source_channel()
+    return {
+        "source_label": query.source_label(),
+        "source_channel_type": source_channel.channel_type
+        if source_channel
+        else "saved_search",
+        "group": _infer_percolate_group(query),
+        "search_url": search_url,
+    }
 
 
 def _get_percolated_rows(resources, subscription_type):
     """
     Get percolated rows for a list of learning resources and subscription type
+
+    All resources are percolated together, the users of every matched query are
+    fetched in one query, and each matched query's email fields are computed
+    once, so the work grows with the number of matches.
     """
+    resources = list(resources)
+    matches = {
+        resource_id: [
+            query for query in queries if query.source_type == subscription_type
+        ]
+        for resource_id, queries in percolate_matches_for_documents(resources).items()
+    }
+    matched_resources = [resource for resource in resources if matches[resource.id]]
+    if not matched_resources:
+        return []
+
+    matched_query_ids = {
+        query.id for resource in matched_resources for query in matches[resource.id]
+    }
+    users_by_query = defaultdict(set)
+    for query_id, user_id in PercolateQuery.objects.filter(
+        id__in=matched_query_ids, users__isnull=False
+    ).values_list("id", "users"):
+        users_by_query[query_id].add(user_id)
+    image_urls = _validated_resource_image_urls(matched_resources)
+    query_contexts = {}
+
     rows = []
-    all_users = set()
-    # percolate each new learning resource to get matching queries
-    for resource in resources:
-        percolated = percolate_matches_for_document(resource.id).filter(
-            source_type=subscription_type
-        )
-        if percolated.count() > 0:
-            resource_image_url = _validated_resource_image_url(resource)
-            percolated_users = set(percolated.values_list("users", flat=True))
-            all_users.update(percolated_users)
-            for user in percolated_users:
-                if not user:
-                    continue
-                user_instance = User.objects.get(id=user)
-                user_queries = user_instance.percolate_queries.values_list(
-                    "id", flat=True
-                )
-                query = percolated.filter(id__in=user_queries).order_by("?").first()
-                search_url = _infer_percolate_group_url(query)
-                req = PreparedRequest()
-                req.prepare_url(search_url, {"resource": resource.id})
-                resource_url = req.url
-                source_channel = query.source_channel()
-                rows.append(
-                    {
-                        "resource_url": resource_url,
-                        "resource_title": resource.title,
-                        "resource_image_url": resource_image_url,
-                        "resource_type": LearningResourceType[
-                            resource.resource_type
-                        ].value,
-                        "user_id": user,
-                        "source_label": query.source_label(),
-                        "source_channel_type": source_channel.channel_type
-                        if source_channel
-                        else "saved_search",
-                        "group": _infer_percolate_group(query),
-                        "search_url": search_url,
-                    }
-                )
+    for resource in matched_resources:
+        # the matched queries of each user, to pick the one that shows in the email
+        user_queries = defaultdict(list)
+        for query in matches[resource.id]:
+            for user_id in users_by_query[query.id]:
+                user_queries[user_id].append(query)
+        for user_id, queries in user_queries.items():
+            query = choice(queries)  # noqa: S311
+            if query.id not in query_contexts:
+                query_contexts[query.id] = _percolate_query_context(query)
+            query_context = query_contexts[query.id]
+            req = PreparedRequest()
+            req.prepare_url(query_context["search_url"], {"resource": resource.id})
+            rows.append(
+                {
+                    "resource_url": req.url,
+                    "resource_title": resource.title,
+                    "resource_image_url": image_urls[resource.id],
+                    "resource_type": LearningResourceType[resource.resource_type].value,
+                    "user_id": user_id,
+                    **query_context,
+                }
+            )
     return rows
 
 
@@ -324,7 +391,7 @@ def send_subscription_emails(self, subscription_type, period="daily"):
     since = now_in_utc() - delta
     new_learning_resources = LearningResource.objects.filter(
         published=True, created_on__gt=since
-    )
+    ).select_related("image")
     rows = _get_percolated_rows(new_learning_resources, subscription_type)
     template_data = _group_percolated_rows(rows)
     email_tasks = celery.group(
@@ -818,11 +885,13 @@ def _execute_reindex_batch(batch):
         batch (TaskBatch): the batch to execute
     """
     params = batch.params
+    max_in_flight = settings.OPENSEARCH_REINDEX_MAX_IN_FLIGHT
     if batch.kind == ReindexBatchKind.learning_resources.value:
         api.index_learning_resources(
             params["ids"],
             params["index_name"],
             IndexestoUpdate.reindexing_index.value,
+            max_in_flight=max_in_flight,
         )
     elif batch.kind == ReindexBatchKind.content_files.value:
         api.index_content_files(
@@ -830,12 +899,14 @@ def _execute_reindex_batch(batch):
             params["learning_resource_id"],
             index_types=IndexestoUpdate.reindexing_index.value,
             resource_type=params["resource_type"],
+            max_in_flight=max_in_flight,
         )
     elif batch.kind == ReindexBatchKind.percolate.value:
         api.index_items(
             serialize_bulk_percolators(params["ids"]),
             PERCOLATE_INDEX_TYPE,
             IndexestoUpdate.reindexing_index.value,
+            max_in_flight=max_in_flight,
         )
     elif batch.kind == ReindexBatchKind.dispatch_content_files.value:
         _dispatch_content_file_batches(batch)
@@ -8,6 +8,9 @@ import responses
 from celery.exceptions import Ignore, Retry
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from opensearchpy.exceptions import ConnectionError as ESConnectionError
 from opensearchpy.exceptions import ConnectionTimeout, RequestError
 
@@ -50,6 +53,7 @@ from learning_resources_search.tasks import (
     _infer_percolate_group,
     _maybe_finish_reindex_job,
     _validated_resource_image_url,
+    _validated_resource_image_urls,
     bulk_deindex_learning_resources,
     deindex_document,
     deindex_run_content_files,
@@ -91,6 +95,21 @@ def mocked_api(mocker):
     return mocker.patch("learning_resources_search.tasks.api")
 
 
+def _matches_by_document(matches_for_document):
+    """
+    Build a percolate_matches_for_documents side effect from a function
+    returning the matching queries for one document id
+    """
+
+    def matches_for_documents(resources):
+        return {
+            resource.id: list(matches_for_document(resource.id))
+            for resource in resources
+        }
+
+    return matches_for_documents
+
+
 @pytest.fixture(autouse=True)
 def mock_image_url_is_reachable(mocker, request):
     """
@@ -716,7 +735,10 @@ def test_run_reindex_batch_learning_resources(mocker, mocked_api):
     run_reindex_batch.delay(batch.id)
 
     mocked_api.index_learning_resources.assert_called_once_with(
-        [1, 2], COURSE_TYPE, IndexestoUpdate.reindexing_index.value
+        [1, 2],
+        COURSE_TYPE,
+        IndexestoUpdate.reindexing_index.value,
+        max_in_flight=settings.OPENSEARCH_REINDEX_MAX_IN_FLIGHT,
     )
     batch.refresh_from_db()
     assert batch.status == TaskBatch.Status.SUCCEEDED
@@ -749,6 +771,7 @@ def test_run_reindex_batch_content_files(mocker, mocked_api):
         7,
         index_types=IndexestoUpdate.reindexing_index.value,
         resource_type=PROGRAM_TYPE,
+        max_in_flight=settings.OPENSEARCH_REINDEX_MAX_IN_FLIGHT,
     )
     batch.refresh_from_db()
     assert batch.status == TaskBatch.Status.SUCCEEDED
@@ -777,6 +800,7 @@ def test_run_reindex_batch_percolate(mocker, mocked_api):
         ["serialized"],
         PERCOLATE_INDEX_TYPE,
         IndexestoUpdate.reindexing_index.value,
+        max_in_flight=settings.OPENSEARCH_REINDEX_MAX_IN_FLIGHT,
     )
     batch.refresh_from_db()
     assert batch.status == TaskBatch.Status.SUCCEEDED
@@ -1415,8 +1439,8 @@ def test_send_subscription_emails(mocked_api, mocker, mocked_celery):
         queries.append(query)
         query_ids.append(query.id)
 
-    percolate_matches_for_document_mock = mocker.patch(
-        "learning_resources_search.tasks.percolate_matches_for_document",
+    percolate_matches_for_documents_mock = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
     )
 
     def get_percolator(res):
@@ -1427,7 +1451,9 @@ def test_send_subscription_emails(mocked_api, mocker, mocked_celery):
         user_documents[ptopic].append(LearningResource.objects.get(id=res))
         return PercolateQuery.objects.filter(id=query_id)
 
-    percolate_matches_for_document_mock.side_effect = get_percolator
+    percolate_matches_for_documents_mock.side_effect = _matches_by_document(
+        get_percolator
+    )
     with pytest.raises(mocked_celery.replace_exception_class):
         send_subscription_emails(PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE)
 
@@ -1467,8 +1493,8 @@ def test_send_multiple_subscription_emails(mocked_api, mocker, mocked_celery):
         queries.append(query)
         query_ids.append(query.id)
 
-    percolate_matches_for_document_mock = mocker.patch(
-        "learning_resources_search.tasks.percolate_matches_for_document",
+    percolate_matches_for_documents_mock = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
     )
 
     def get_percolator(res):
@@ -1479,7 +1505,9 @@ def test_send_multiple_subscription_emails(mocked_api, mocker, mocked_celery):
         user_documents[ptopic].append(LearningResource.objects.get(id=res))
         return PercolateQuery.objects.filter(id=query_id)
 
-    percolate_matches_for_document_mock.side_effect = get_percolator
+    percolate_matches_for_documents_mock.side_effect = _matches_by_document(
+        get_percolator
+    )
     with pytest.raises(mocked_celery.replace_exception_class):
         send_subscription_emails.apply((PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE,))
 
@@ -1598,8 +1626,8 @@ def test_percolate_user_grouping(mocked_api, mocker):
         query.source_type = PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE
         query.save()
 
-    percolate_matches_for_document_mock = mocker.patch(
-        "learning_resources_search.tasks.percolate_matches_for_document",
+    percolate_matches_for_documents_mock = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
     )
 
     def _matches_for_document(resource_id):
@@ -1630,7 +1658,9 @@ def test_percolate_user_grouping(mocked_api, mocker):
         else:
             return PercolateQuery.objects.none()
 
-    percolate_matches_for_document_mock.side_effect = _matches_for_document
+    percolate_matches_for_documents_mock.side_effect = _matches_by_document(
+        _matches_for_document
+    )
 
     rows = _get_percolated_rows(
         [resource_a, resource_b, resource_c], "channel_subscription_type"
@@ -1678,8 +1708,8 @@ def test_email_grouping_function(mocked_api, mocker):
         queries.append(query)
         query_ids.append(query.id)
 
-    percolate_matches_for_document_mock = mocker.patch(
-        "learning_resources_search.tasks.percolate_matches_for_document",
+    percolate_matches_for_documents_mock = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
     )
 
     def get_percolator(res):
@@ -1690,7 +1720,9 @@ def test_email_grouping_function(mocked_api, mocker):
         user_documents[ptopic].append(LearningResource.objects.get(id=res))
         return PercolateQuery.objects.filter(id=query_id)
 
-    percolate_matches_for_document_mock.side_effect = get_percolator
+    percolate_matches_for_documents_mock.side_effect = _matches_by_document(
+        get_percolator
+    )
     rows = _get_percolated_rows(new_resources, PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE)
     template_data = _group_percolated_rows(rows)
     assert len(template_data) == len(topics)
@@ -1717,8 +1749,8 @@ def test_digest_email_template(mocked_api, mocker, mocked_celery):
 
     user = UserFactory.create()
 
-    percolate_matches_for_document_mock = mocker.patch(
-        "learning_resources_search.tasks.percolate_matches_for_document",
+    percolate_matches_for_documents_mock = mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
     )
 
     def get_percolator(res):
@@ -1731,7 +1763,9 @@ def test_digest_email_template(mocked_api, mocker, mocked_celery):
         query_ids.append(query.id)
         return PercolateQuery.objects.filter(id=query.id)
 
-    percolate_matches_for_document_mock.side_effect = get_percolator
+    percolate_matches_for_documents_mock.side_effect = _matches_by_document(
+        get_percolator
+    )
     with pytest.raises(mocked_celery.replace_exception_class):
         send_subscription_emails.apply([PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE])
     task_args = mocked_celery.group.call_args[0][0][0]["args"][0][0]
@@ -1800,6 +1834,70 @@ def test_validated_resource_image_url(mock_image_url_is_reachable, reachable):
     mock_image_url_is_reachable.assert_called_once_with(resource.image.url)
 
 
+def test_validated_resource_image_urls_checked_once(
+    mocker, mock_image_url_is_reachable
+):
+    """Each distinct image URL should be checked once, then served from the cache"""
+    mocker.patch(
+        "learning_resources_search.tasks.caches",
+        {"redis": LocMemCache("image-checks", {})},
+    )
+    mock_image_url_is_reachable.side_effect = lambda url: url.endswith("good.jpg")
+    good, dead = LearningResourceFactory.create_batch(2, is_course=True)
+    good.image.url = "http://example.com/good.jpg"
+    dead.image.url = "http://example.com/dead.jpg"
+    same_image = LearningResourceFactory.create(is_course=True, image=good.image)
+    default_url = frontend_absolute_url("/images/default_resource.jpg")
+
+    for _ in range(2):
+        assert _validated_resource_image_urls([good, dead, same_image]) == {
+            good.id: good.image.url,
+            dead.id: default_url,
+            same_image.id: good.image.url,
+        }
+
+    assert sorted(
+        call.args[0] for call in mock_image_url_is_reachable.call_args_list
+    ) == [dead.image.url, good.image.url]
+
+
+def test_get_percolated_rows_query_count(mocker):
+    """Digest rows should not need more queries for more resources or users"""
+    topic_query = PercolateQueryFactory.create(
+        source_type=PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE
+    )
+    topic_query.original_query["topic"] = ["Mechanical Engineering"]
+    topic_query.save()
+    mocker.patch(
+        "learning_resources_search.tasks.percolate_matches_for_documents",
+        side_effect=lambda resources: {
+            resource.id: [topic_query] for resource in resources
+        },
+    )
+
+    def percolated_rows(resource_count, user_count):
+        LearningResource.objects.all().delete()
+        topic_query.users.set(UserFactory.create_batch(user_count))
+        resources = list(
+            LearningResource.objects.filter(
+                id__in=[
+                    resource.id
+                    for resource in LearningResourceFactory.create_batch(
+                        resource_count, is_course=True
+                    )
+                ]
+            ).select_related("image")
+        )
+        with CaptureQueriesContext(connection) as context:
+            rows = _get_percolated_rows(
+                resources, PercolateQuery.CHANNEL_SUBSCRIPTION_TYPE
+            )
+        assert len(rows) == resource_count * user_count
+        return len(context.captured_queries)
+
+    assert percolated_rows(1, 1) == percolated_rows(5, 4)
+
+
 def test_validated_resource_image_url_no_image(mock_image_url_is_reachable):
     """The digest email should use the default image if the resource has none"""
     resource = LearningResourceFactory.create(is_course=True, no_image=True)
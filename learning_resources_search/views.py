@@ -68,7 +68,10 @@ class LearningResourcesSearchView(ESView):
 
     @method_decorator(
         cache_page_for_all_users(
-            settings.REDIS_VIEW_CACHE_DURATION, cache="redis", key_prefix="search"
+            settings.REDIS_VIEW_CACHE_DURATION,
+            cache="redis",
+            key_prefix="search",
+            soft_timeout=settings.REDIS_VIEW_CACHE_SOFT_DURATION,
         )
     )
     @extend_schema(summary="Search")
@@ -1,3 +1,8 @@
+import pickle
+import time
+from collections import OrderedDict
+from threading import Lock
+
 from django.core.cache import caches
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
 
@@ -74,3 +79,208 @@ class FallbackCache(BaseCache):
                 timeout=timeout,
                 version=version,
             )
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """
+        Add a value to the last (most durable) cache only
+
+        That cache is the one shared between processes, so it is the only place
+        add() can be relied on to be atomic (e.g. for locks). Later reads
+        backfill the value into the other caches.
+        """
+        return caches[self._cache_names[-1]].add(
+            key, value, timeout=self.get_backend_timeout(timeout), version=version
+        )
+
+    def delete(self, key, version=None):
+        """Delete a value from the caches"""
+        deleted = False
+        for cache_name in self._cache_names:
+            deleted = caches[cache_name].delete(key, version=version) or deleted
+        return deleted
+
+    def get_many(self, keys, version=None):
+        """Get values for many keys from the caches in order"""
+        results = {}
+        remaining = list(keys)
+        checked_caches = []
+
+        for cache_name in self._cache_names:
+            if not remaining:
+                break
+            cache = caches[cache_name]
+            hits = {
+                key: value
+                for key, value in cache.get_many(remaining, version=version).items()
+                if value is not None
+            }
+            # these keys missed in every cache checked so far, so set them there
+            # for the same reason get() does
+            if hits:
+                for missed_cache in checked_caches:
+                    missed_cache.set_many(
+                        hits, timeout=self.get_backend_timeout(), version=version
+                    )
+            results.update(hits)
+            remaining = [key for key in remaining if key not in hits]
+            checked_caches.append(cache)
+
+        return results
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        """Set many values in the caches"""
+        for cache_name in self._cache_names:
+            cache = caches[cache_name]
+            cache.set_many(
+                data,
+                timeout=self.get_backend_timeout(timeout),
+                version=version,
+            )
+        return []
+
+
+class _BoundedStore:
+    """Entries of a BoundedMemoryCache, shared by its per-thread instances"""
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = Lock()
+
+    def discard(self, key):
+        """Remove an entry, returning whether it existed. Caller holds the lock."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        self.size -= len(entry[0])
+        return True
+
+
+_bounded_stores: dict[str, _BoundedStore] = {}
+_bounded_stores_lock = Lock()
+
+
+class BoundedMemoryCache(BaseCache):
+    """
+    In-process LRU cache bounded by the total size of its entries
+
+    Unlike LocMemCache, which caps the number of entries, this caps the bytes
+    they take up, so it can hold a handful of large values (e.g. rendered view
+    responses) without an unbounded memory footprint. bytes values (e.g.
+    rendered JSON) are immutable, so they are stored and returned as-is and
+    hits skip deserialization; any other value is stored pickled so callers
+    can't mutate the cached copy. The stored size is what gets counted. Least
+    recently used
+    entries are evicted to stay within MAX_BYTES; a value larger than
+    MAX_ENTRY_BYTES is not cached at all.
+
+    For example in settings.py:
+
+    CACHES = {
+        "in-memory": {
+            "BACKEND": "main.cache.backends.BoundedMemoryCache",
+            "LOCATION": "in-memory",
+            "OPTIONS": {"MAX_BYTES": 64 * 1024 * 1024},
+        },
+        ...
+    }
+    """
+
+    def __init__(self, name, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._max_bytes = options.get("MAX_BYTES", 64 * 1024 * 1024)
+        self._max_entry_bytes = options.get("MAX_ENTRY_BYTES", self._max_bytes // 8)
+        with _bounded_stores_lock:
+            self._store = _bounded_stores.setdefault(name, _BoundedStore())
+
+    @property
+    def size(self):
+        """Total bytes currently held by the cache"""
+        return self._store.size
+
+    def _live_entry(self, key):
+        """Return the unexpired entry for a key, if any. Caller holds the lock."""
+        entry = self._store.entries.get(key)
+        if entry is None:
+            return None
+        expires_at = entry[1]
+        if expires_at is not None and expires_at <= time.time():
+            self._store.discard(key)
+            return None
+        self._store.entries.move_to_end(key)
+        return entry
+
+    def _set(self, key, value, timeout):
+        """Store a value, evicting as needed. Caller holds the lock."""
+        is_pickled = not isinstance(value, bytes)
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL) if is_pickled else value
+        self._store.discard(key)
+        if len(data) > self._max_entry_bytes:
+            return False
+        self._store.entries[key] = (
+            data,
+            self.get_backend_timeout(timeout),
+            is_pickled,
+        )
+        self._store.size += len(data)
+        while self._store.size > self._max_bytes:
+            self._store.discard(next(iter(self._store.entries)))
+        return True
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """Set a value if the key isn't already cached"""
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            if self._live_entry(key) is not None:
+                return False
+            return self._set(key, value, timeout)
+
+    def get(self, key, default=None, version=None):
+        """Get a value, marking it as recently used"""
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            entry = self._live_entry(key)
+        if entry is None:
+            return default
+        data, _, is_pickled = entry
+        return pickle.loads(data) if is_pickled else data  # noqa: S301
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """Set a value"""
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            self._set(key, value, timeout)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        """Update the timeout of a cached value"""
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                return False
+            data, _, is_pickled = entry
+            self._store.entries[key] = (
+                data,
+                self.get_backend_timeout(timeout),
+                is_pickled,
+            )
+            return True
+
+    def delete(self, key, version=None):
+        """Delete a value"""
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            return self._store.discard(key)
+
+    def has_key(self, key, version=None):
+        """Return whether an unexpired value is cached for the key"""
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            return self._live_entry(key) is not None
+
+    def clear(self):
+        """Remove every value"""
+        with self._store.lock:
+            self._store.entries.clear()
+            self._store.size = 0
@@ -1,9 +1,10 @@
+import pickle
 from dataclasses import dataclass
 
 import pytest
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
 
-from main.cache.backends import FallbackCache
+from main.cache.backends import BoundedMemoryCache, FallbackCache
 
 
 @dataclass
@@ -85,3 +86,136 @@ def test_fallback_cache_set(mock_caches, settings, cache_timeout, kwargs):
         mock_cache.set.assert_called_once_with(
             "key", "value", timeout=expected_timeout, version=expected_version
         )
+
+
+def test_fallback_cache_get_many(mock_caches: MockCaches):
+    """get_many() should read through the caches and backfill earlier misses"""
+    first, second, third = mock_caches.caches
+    first.get_many.return_value = {"a": "a-0"}
+    second.get_many.return_value = {"b": "b-1"}
+    third.get_many.return_value = {}
+
+    cache = FallbackCache(mock_caches.cache_names, {"TIMEOUT": 600})
+
+    assert cache.get_many(["a", "b", "c"], version=1) == {"a": "a-0", "b": "b-1"}
+
+    first.get_many.assert_called_once_with(["a", "b", "c"], version=1)
+    second.get_many.assert_called_once_with(["b", "c"], version=1)
+    third.get_many.assert_called_once_with(["c"], version=1)
+    first.set_many.assert_called_once_with({"b": "b-1"}, timeout=600, version=1)
+    second.set_many.assert_not_called()
+    third.set_many.assert_not_called()
+
+
+@pytest.mark.parametrize("cache_timeout", [DEFAULT_TIMEOUT, None, 1000])
+def test_fallback_cache_set_many(mock_caches, cache_timeout):
+    """set_many() should set the values in every cache"""
+    cache = FallbackCache(mock_caches.cache_names, {"TIMEOUT": cache_timeout})
+    cache.set_many({"a": 1, "b": 2}, version=1)
+
+    for mock_cache in mock_caches.caches:
+        mock_cache.set_many.assert_called_once_with(
+            {"a": 1, "b": 2}, timeout=cache_timeout, version=1
+        )
+
+
+def test_fallback_cache_add(mock_caches):
+    """add() should only go to the last, shared cache"""
+    first, second, third = mock_caches.caches
+    third.add.return_value = True
+    cache = FallbackCache(mock_caches.cache_names, {"TIMEOUT": 600})
+
+    assert cache.add("key", "value", version=1) is True
+
+    third.add.assert_called_once_with("key", "value", timeout=600, version=1)
+    first.add.assert_not_called()
+    second.add.assert_not_called()
+
+
+def test_fallback_cache_delete(mock_caches):
+    """delete() should delete the key from every cache"""
+    for mock_cache in mock_caches.caches:
+        mock_cache.delete.return_value = False
+    mock_caches.caches[1].delete.return_value = True
+    cache = FallbackCache(mock_caches.cache_names, {})
+
+    assert cache.delete("key", version=1) is True
+
+    for mock_cache in mock_caches.caches:
+        mock_cache.delete.assert_called_once_with("key", version=1)
+
+
+@pytest.fixture
+def bounded_cache(request):
+    """Create a BoundedMemoryCache with room for three small entries"""
+    cache = BoundedMemoryCache(
+        request.node.name, {"OPTIONS": {"MAX_BYTES": 350, "MAX_ENTRY_BYTES": 150}}
+    )
+    yield cache
+    cache.clear()
+
+
+def test_bounded_memory_cache_evicts_least_recently_used(bounded_cache):
+    """Entries are evicted least recently used first to stay within MAX_BYTES"""
+    value = b"x" * 90
+    for key in ["a", "b", "c"]:
+        bounded_cache.set(key, value)
+    assert bounded_cache.get("a") == value
+
+    bounded_cache.set("d", value)
+
+    assert bounded_cache.get("b") is None
+    assert bounded_cache.get_many(["a", "c", "d"]) == dict.fromkeys(
+        ["a", "c", "d"], value
+    )
+    assert bounded_cache.size <= 350
+
+
+def test_bounded_memory_cache_skips_oversized_entries(bounded_cache):
+    """A value larger than MAX_ENTRY_BYTES replaces nothing and isn't cached"""
+    bounded_cache.set("a", b"small")
+    bounded_cache.set("a", b"x" * 200)
+
+    assert bounded_cache.get("a") is None
+    assert bounded_cache.size == 0
+
+
+def test_bounded_memory_cache_expiry_and_add(mocker, bounded_cache):
+    """Expired entries are dropped, and add() only sets missing keys"""
+    mock_time = mocker.patch("main.cache.backends.time.time", return_value=1000)
+
+    assert bounded_cache.add("a", 1, timeout=10) is True
+    assert bounded_cache.add("a", 2, timeout=10) is False
+    assert bounded_cache.get("a") == 1
+
+    mock_time.return_value = 1011
+    assert bounded_cache.get("a") is None
+    assert bounded_cache.add("a", 2, timeout=10) is True
+    assert bounded_cache.get("a") == 2
+
+
+def test_bounded_memory_cache_shared_by_name(bounded_cache, request):
+    """Instances with the same name share entries, like LocMemCache"""
+    other = BoundedMemoryCache(request.node.name, {})
+    bounded_cache.set("a", 1)
+
+    assert other.get("a") == 1
+    assert other.delete("a") is True
+    assert bounded_cache.has_key("a") is False
+
+
+def test_bounded_memory_cache_stores_bytes_as_is(mocker, bounded_cache):
+    """Bytes are served without unpickling; other values are stored as copies"""
+    loads = mocker.spy(pickle, "loads")
+    rendered = b'{"results": []}'
+    value = {"results": []}
+    bounded_cache.set("bytes", rendered)
+    bounded_cache.set("dict", value)
+    value["results"].append(1)
+
+    assert bounded_cache.get("bytes") is rendered
+    assert bounded_cache.size == len(rendered) + len(
+        pickle.dumps({"results": []}, pickle.HIGHEST_PROTOCOL)
+    )
+    loads.assert_not_called()
+    assert bounded_cache.get("dict") == {"results": []}
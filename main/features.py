@@ -3,18 +3,30 @@
 import hashlib
 import json
 import logging
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
 from enum import StrEnum
 from functools import wraps
+from time import monotonic
+from types import MappingProxyType
 
 import posthog
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import caches
+from posthog import request as posthog_request
+from posthog.feature_flags import (
+    InconclusiveMatchError,
+    match_feature_flag_properties,
+)
 
 log = logging.getLogger()
 User = get_user_model()
 durable_cache = caches["durable"]
 
+LOCAL_EVALUATION_PATH = "/api/feature_flag/local_evaluation/?token={token}&send_cohorts"
+
 
 class Features(StrEnum):
     """Enum for feature flags"""
@@ -75,6 +87,142 @@ def generate_cache_key(key: str, unique_id: str, person_properties: dict) -> str
     )
 
 
+@dataclass(frozen=True)
+class FlagDefinitions:
+    """
+    A snapshot of the PostHog flag definitions to evaluate flags against.
+
+    Snapshots are never mutated: a refresh builds a new one and swaps it in,
+    so a flag check always sees one consistent set of flags and cohorts.
+    flags is None if the definitions could not be loaded.
+    """
+
+    flags: Mapping[str, dict] | None
+    cohorts: Mapping[str, dict]
+    expires_at: float
+
+
+_flag_definitions: FlagDefinitions | None = None
+_flag_definitions_lock = threading.Lock()
+
+
+def _load_flag_definitions() -> FlagDefinitions:
+    """Fetch the flag definitions for local evaluation from PostHog"""
+    expires_at = monotonic() + settings.POSTHOG_FLAG_DEFINITIONS_REFRESH_SECONDS
+    try:
+        response = posthog_request.get(
+            settings.POSTHOG_PERSONAL_API_KEY,
+            LOCAL_EVALUATION_PATH.format(token=settings.POSTHOG_PROJECT_API_KEY),
+            settings.POSTHOG_API_HOST,
+            timeout=settings.POSTHOG_TIMEOUT_MS / 1000,
+        )
+    except Exception:
+        log.exception("Unable to load feature flag definitions from Posthog")
+        return FlagDefinitions(
+            flags=None, cohorts=MappingProxyType({}), expires_at=expires_at
+        )
+    return FlagDefinitions(
+        flags=MappingProxyType(
+            {
+                flag["key"]: flag
+                for flag in response.get("flags") or []
+                if flag.get("key") is not None
+            }
+        ),
+        cohorts=MappingProxyType(response.get("cohorts") or {}),
+        expires_at=expires_at,
+    )
+
+
+def get_flag_definitions() -> FlagDefinitions | None:
+    """
+    Return the current flag definitions, refreshing them if they are stale.
+
+    Definitions are refreshed on demand rather than by a background poller, so
+    that no thread has to survive forking web and celery workers. One thread
+    refreshes while the others keep using the snapshot they already have; only
+    the very first load in a process blocks. If a refresh fails, the previous
+    snapshot is kept until the next refresh.
+    """
+    global _flag_definitions  # noqa: PLW0603
+
+    if not (
+        settings.POSTHOG_FLAG_DEFINITIONS_REFRESH_SECONDS
+        and settings.POSTHOG_PERSONAL_API_KEY
+        and settings.POSTHOG_PROJECT_API_KEY
+    ):
+        return None
+
+    definitions = _flag_definitions
+    if definitions is not None and definitions.expires_at > monotonic():
+        return definitions
+    if not _flag_definitions_lock.acquire(blocking=definitions is None):
+        return definitions
+    try:
+        if _flag_definitions is definitions:
+            refreshed = _load_flag_definitions()
+            if refreshed.flags is None and definitions is not None:
+                refreshed = replace(definitions, expires_at=refreshed.expires_at)
+            _flag_definitions = refreshed
+        return _flag_definitions
+    finally:
+        _flag_definitions_lock.release()
+
+
+def _evaluate_flag_locally(
+    definitions: FlagDefinitions,
+    name: str,
+    unique_id: str,
+    person_properties: dict,
+):
+    """
+    Evaluate a feature flag against the flag definitions.
+
+    Returns None if the flag is not defined in PostHog, and raises
+    InconclusiveMatchError if it has to be evaluated by the PostHog API.
+    """
+    if definitions.flags is None:
+        msg = "Flag definitions are unavailable"
+        raise InconclusiveMatchError(msg)
+    flag = definitions.flags.get(name)
+    if flag is None:
+        return None
+    if flag.get("ensure_experience_continuity", False):
+        msg = "Flag has experience continuity enabled"
+        raise InconclusiveMatchError(msg)
+    if not flag.get("active"):
+        return False
+    if (flag.get("filters") or {}).get("aggregation_group_type_index") is not None:
+        # We never pass groups, so PostHog cannot match a group flag either
+        return False
+    return match_feature_flag_properties(
+        flag,
+        unique_id,
+        {"distinct_id": unique_id, **person_properties},
+        definitions.cohorts,
+    )
+
+
+def _get_all_flags_locally(unique_id: str, person_properties: dict) -> dict | None:
+    """
+    Evaluate every defined feature flag locally.
+
+    Returns None if any of them has to be evaluated by the PostHog API.
+    """
+    definitions = get_flag_definitions()
+    if definitions is None or definitions.flags is None:
+        return None
+    try:
+        return {
+            name: _evaluate_flag_locally(
+                definitions, name, unique_id, person_properties
+            )
+            for name in definitions.flags
+        }
+    except InconclusiveMatchError:
+        return None
+
+
 def get_all_feature_flags(opt_unique_id: str | None = None):
     """
     Get the set of all feature flags
@@ -82,6 +230,10 @@ def get_all_feature_flags(opt_unique_id: str | None = None):
     unique_id = opt_unique_id or default_unique_id()
     person_properties = _get_person_properties(unique_id)
 
+    local_flag_data = _get_all_flags_locally(unique_id, person_properties)
+    if local_flag_data is not None:
+        return local_flag_data
+
     flag_data = posthog.get_all_flags(
         unique_id,
         person_properties=person_properties,
@@ -121,6 +273,18 @@ def is_enabled(
     unique_id = opt_unique_id or default_unique_id()
     person_properties = _get_person_properties(unique_id)
 
+    definitions = get_flag_definitions()
+    if definitions is not None:
+        try:
+            value = _evaluate_flag_locally(
+                definitions, name, unique_id, person_properties
+            )
+        except InconclusiveMatchError:
+            log.debug("Unable to evaluate %s locally", name)
+        else:
+            log.debug("Evaluated %s locally", name)
+            return _value_or_default(name, value, default=default)
+
     cache_key = generate_cache_key(name, unique_id, person_properties)
     cached_value = durable_cache.get(cache_key)
 
@@ -143,6 +307,11 @@ def is_enabled(
 
     durable_cache.set(cache_key, value) if value is not None else None
 
+    return _value_or_default(name, value, default=default)
+
+
+def _value_or_default(name: str, value, *, default: bool | None):
+    """Return the flag value, or its default from settings if it has none"""
     return (
         value
         if value is not None
@@ -183,3 +183,95 @@ def test_posthog_flag_cache_timeout(mocker, settings):
     assert features.is_enabled("test_function")
     get_feature_flag_mock.assert_called()
     time_freezer.stop()
+
+
+def _flag_definitions_response(*flags):
+    """Return a Posthog local evaluation response for the given flags"""
+    return {"flags": list(flags), "group_type_mapping": {}, "cohorts": {}}
+
+
+def _rollout_flag(key, *, active=True, **kwargs):
+    """Return a flag definition rolled out to everyone"""
+    return {
+        "key": key,
+        "active": active,
+        "filters": {"groups": [{"properties": [], "rollout_percentage": 100}]},
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def local_evaluation(mocker, settings):
+    """Enable local evaluation against a fresh set of flag definitions"""
+    settings.POSTHOG_FLAG_DEFINITIONS_REFRESH_SECONDS = 30
+    settings.POSTHOG_PERSONAL_API_KEY = "fake key"  # pragma: allowlist secret
+    settings.POSTHOG_PROJECT_API_KEY = "fake key"  # pragma: allowlist secret
+    mocker.patch.object(features, "_flag_definitions", None)
+    return mocker.patch(
+        "main.features.posthog_request.get",
+        return_value=_flag_definitions_response(
+            _rollout_flag("local_flag"), _rollout_flag("inactive_flag", active=False)
+        ),
+    )
+
+
+def test_is_enabled_evaluates_locally(
+    mocker, settings, local_evaluation, django_assert_num_queries
+):
+    """Flags are evaluated in-process, without the durable cache or Posthog API"""
+    get_feature_flag_mock = mocker.patch("posthog.get_feature_flag", autospec=True)
+    settings.FEATURES["undefined_flag"] = True
+
+    with django_assert_num_queries(0):
+        assert features.is_enabled("local_flag") is True
+        assert features.is_enabled("inactive_flag") is False
+        assert features.is_enabled("undefined_flag") is True
+
+    local_evaluation.assert_called_once()
+    get_feature_flag_mock.assert_not_called()
+
+
+def test_is_enabled_falls_back_to_posthog(mocker, local_evaluation):
+    """Flags that can't be evaluated locally are fetched from the Posthog API"""
+    local_evaluation.return_value = _flag_definitions_response(
+        _rollout_flag("continuity_flag", ensure_experience_continuity=True)
+    )
+    get_feature_flag_mock = mocker.patch(
+        "posthog.get_feature_flag", autospec=True, return_value=True
+    )
+    caches["durable"].clear()
+
+    assert features.is_enabled("continuity_flag") is True
+    get_feature_flag_mock.assert_called_once()
+
+
+def test_flag_definitions_refresh(mocker, local_evaluation):
+    """Stale definitions are replaced, and kept if the refresh fails"""
+    monotonic_mock = mocker.patch("main.features.monotonic", return_value=0)
+    definitions = features.get_flag_definitions()
+    assert features.get_flag_definitions() is definitions
+    local_evaluation.assert_called_once()
+
+    monotonic_mock.return_value = 31
+    local_evaluation.side_effect = ConnectionError
+    refreshed = features.get_flag_definitions()
+    assert refreshed is not definitions
+    assert refreshed.flags == definitions.flags
+    assert refreshed.expires_at == 61
+
+    monotonic_mock.return_value = 62
+    local_evaluation.side_effect = None
+    local_evaluation.return_value = _flag_definitions_response()
+    assert features.get_flag_definitions().flags == {}
+    assert features.is_enabled("local_flag") is False
+
+
+def test_get_all_feature_flags_evaluates_locally(mocker, local_evaluation):
+    """All flags are evaluated locally when every one of them can be"""
+    get_all_flags_mock = mocker.patch("posthog.get_all_flags", autospec=True)
+
+    assert features.get_all_feature_flags() == {
+        "local_flag": True,
+        "inactive_flag": False,
+    }
+    get_all_flags_mock.assert_not_called()
@@ -2,7 +2,7 @@
 
 from django.core.management.base import BaseCommand
 
-from main.utils import clear_views_cache
+from main.utils import clear_views_cache, purge_views_cache
 
 
 class Command(BaseCommand):
@@ -16,6 +16,20 @@ class Command(BaseCommand):
 
     help = "Command to clear the cache"
 
+    def add_arguments(self, parser):
+        """Configure arguments for this command"""
+        parser.add_argument(
+            "--purge",
+            dest="purge",
+            action="store_true",
+            help="Also delete cached responses from Redis instead of letting "
+            "them expire (scans the whole keyspace)",
+        )
+        super().add_arguments(parser)
+
     def handle(self, *args, **options):  # noqa: ARG002
-        cache_items = clear_views_cache()
-        self.stdout.write(f"cleared {cache_items} items from cache")
+        generation = clear_views_cache()
+        self.stdout.write(f"invalidated cached views, now at generation {generation}")
+        if options["purge"]:
+            cache_items = purge_views_cache()
+            self.stdout.write(f"cleared {cache_items} items from cache")
@@ -494,6 +494,10 @@ IMAGEKIT_CACHE_BACKEND = "imagekit"
 
 
 # django cache back-ends
+# Redis for serialized search documents; they aren't cached without one
+SEARCH_DOCUMENT_CACHE_REDIS_URL = get_string("SEARCH_DOCUMENT_CACHE_REDIS_URL", None)
+# Redis for dense chunk embeddings, required by QDRANT_EMBEDDING_CACHE_ENABLED
+EMBEDDING_CACHE_REDIS_URL = get_string("EMBEDDING_CACHE_REDIS_URL", None)
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
@@ -533,11 +537,49 @@ CACHES = {
         ],
         "TIMEOUT": 60 * 60,
     },
+    # serialized search documents, keyed by resource fingerprint. They are
+    # large, so they are only cached on a Redis of their own, never the Celery
+    # broker's
+    "search_documents": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": SEARCH_DOCUMENT_CACHE_REDIS_URL,
+        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        "TIMEOUT": get_int("SEARCH_DOCUMENT_CACHE_TIMEOUT", 60 * 60 * 24),
+    }
+    if SEARCH_DOCUMENT_CACHE_REDIS_URL
+    else {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
     "imagekit_db": {
         "BACKEND": "django.core.cache.backends.db.DatabaseCache",
         "LOCATION": "imagekit_cache",
         "TIMEOUT": None,
     },
+    # dense chunk embeddings, kept apart from the Celery broker's Redis so they
+    # can live on an instance that evicts under memory pressure
+    "embeddings": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": EMBEDDING_CACHE_REDIS_URL,
+        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+    }
+    if EMBEDDING_CACHE_REDIS_URL
+    else {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    # hot view responses: an in-process tier in front of redis. Generation
+    # counters read through it are kept in process for TIMEOUT seconds, which
+    # bounds how long a pod keeps serving responses after clear_views_cache.
+    "views": {
+        "BACKEND": "main.cache.backends.FallbackCache",
+        "LOCATION": [
+            "views_local",
+            "redis",
+        ],
+        "TIMEOUT": get_int("VIEW_CACHE_LOCAL_TIMEOUT", 30),
+    },
+    "views_local": {
+        "BACKEND": "main.cache.backends.BoundedMemoryCache",
+        "LOCATION": "views_local",
+        "OPTIONS": {
+            "MAX_BYTES": get_int("VIEW_CACHE_LOCAL_MAX_BYTES", 64 * 1024 * 1024),
+        },
+    },
 }
 
 # OpenSearch
@@ -557,6 +599,7 @@ OPENSEARCH_HTTP_AUTH = get_string("OPENSEARCH_HTTP_AUTH", None)
 OPENSEARCH_CONNECTIONS_PER_NODE = get_int("OPENSEARCH_CONNECTIONS_PER_NODE", 10)
 OPENSEARCH_DEFAULT_TIMEOUT = get_int("OPENSEARCH_DEFAULT_TIMEOUT", 10)
 OPENSEARCH_INDEXING_CHUNK_SIZE = get_int("OPENSEARCH_INDEXING_CHUNK_SIZE", 100)
+OPENSEARCH_PERCOLATE_CHUNK_SIZE = get_int("OPENSEARCH_PERCOLATE_CHUNK_SIZE", 100)
 OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE = get_int(
     "OPENSEARCH_DOCUMENT_INDEXING_CHUNK_SIZE",
     get_int("OPENSEARCH_INDEXING_CHUNK_SIZE", 100),
@@ -573,6 +616,11 @@ OPENSEARCH_MAX_SUGGEST_RESULTS = get_int("OPENSEARCH_MAX_SUGGEST_RESULTS", 1)
 OPENSEARCH_SHARD_COUNT = get_int("OPENSEARCH_SHARD_COUNT", 2)
 OPENSEARCH_REPLICA_COUNT = get_int("OPENSEARCH_REPLICA_COUNT", 2)
 OPENSEARCH_MAX_REQUEST_SIZE = get_int("OPENSEARCH_MAX_REQUEST_SIZE", 10485760)
+# bulk requests a reindex batch keeps in flight while serializing the next chunk
+OPENSEARCH_REINDEX_MAX_IN_FLIGHT = get_int("OPENSEARCH_REINDEX_MAX_IN_FLIGHT", 4)
+# retries (with exponential backoff) for bulk actions rejected with a 429
+OPENSEARCH_BULK_MAX_RETRIES = get_int("OPENSEARCH_BULK_MAX_RETRIES", 3)
+OPENSEARCH_BULK_INITIAL_BACKOFF = get_int("OPENSEARCH_BULK_INITIAL_BACKOFF", 2)
 INDEXING_ERROR_RETRIES = get_int("INDEXING_ERROR_RETRIES", 1)
 CONTENT_FILE_RETENTION_DAYS = get_int("CONTENT_FILE_RETENTION_DAYS", 14)
 CONTENT_FILE_CLEANUP_CHUNK_SIZE = get_int("CONTENT_FILE_CLEANUP_CHUNK_SIZE", 1000)
@@ -640,6 +688,15 @@ MIDDLEWARE_FEATURE_FLAG_COOKIE_MAX_AGE_SECONDS = get_int(
     "MIDDLEWARE_FEATURE_FLAG_COOKIE_MAX_AGE_SECONDS", 60 * 60
 )
 REDIS_VIEW_CACHE_DURATION = get_int("REDIS_VIEW_CACHE_DURATION", 60 * 60 * 24)
+# Single-flight lock for cached views: how long one request may hold it while
+# computing a response, and how long other requests for the same key wait. The
+# wait ties up a worker, so keep it to a few hundred ms
+REDIS_VIEW_CACHE_LOCK_TIMEOUT = get_int("REDIS_VIEW_CACHE_LOCK_TIMEOUT", 30)
+REDIS_VIEW_CACHE_LOCK_WAIT_MS = get_int("REDIS_VIEW_CACHE_LOCK_WAIT_MS", 250)
+# Views cached with stale-while-revalidate stay fresh this long, then are
+# served stale (up to REDIS_VIEW_CACHE_DURATION) while refreshed in the background
+REDIS_VIEW_CACHE_SOFT_DURATION = get_int("REDIS_VIEW_CACHE_SOFT_DURATION", 60 * 15)
+REDIS_VIEW_CACHE_REFRESH_WORKERS = get_int("REDIS_VIEW_CACHE_REFRESH_WORKERS", 4)
 
 
 if MIDDLEWARE_FEATURE_FLAG_QS_PREFIX:
@@ -758,6 +815,13 @@ POSTHOG_PROJECT_ID = get_int(
     name="POSTHOG_PROJECT_ID",
     default=None,
 )
+# seconds between refreshes of the PostHog flag definitions that feature flags are
+# evaluated against in-process. 0 disables local evaluation, so every flag check
+# goes through the durable cache and the PostHog API.
+POSTHOG_FLAG_DEFINITIONS_REFRESH_SECONDS = get_int(
+    name="POSTHOG_FLAG_DEFINITIONS_REFRESH_SECONDS",
+    default=30,
+)
 POSTHOG_EVENT_S3_BUCKET = get_string(name="POSTHOG_EVENT_S3_BUCKET", default="None")
 POSTHOG_EVENT_S3_PREFIX = get_string(name="POSTHOG_EVENT_S3_PREFIX", default="None")
 
@@ -850,6 +914,25 @@ QDRANT_CONTENT_FILE_SERIALIZATION_CHUNK_SIZE = get_int(
     name="QDRANT_CONTENT_FILE_SERIALIZATION_CHUNK_SIZE", default=5
 )
 
+# dense embedding requests kept in flight while embedding content files
+QDRANT_EMBEDDING_MAX_IN_FLIGHT = get_int(
+    name="QDRANT_EMBEDDING_MAX_IN_FLIGHT", default=4
+)
+
+# content-addressed cache of dense content file chunk embeddings, stored in the
+# "embeddings" cache. EMBEDDING_CACHE_REDIS_URL should point at a Redis with a
+# maxmemory eviction policy, not the Celery broker's.
+QDRANT_EMBEDDING_CACHE_ENABLED = get_bool(
+    name="QDRANT_EMBEDDING_CACHE_ENABLED", default=False
+)
+if QDRANT_EMBEDDING_CACHE_ENABLED and not EMBEDDING_CACHE_REDIS_URL:
+    msg = "QDRANT_EMBEDDING_CACHE_ENABLED requires EMBEDDING_CACHE_REDIS_URL"
+    raise ImproperlyConfigured(msg)
+# 7 days default chunk embedding cache ttl, capped at EMBEDDING_CACHE_MAX_TTL
+QDRANT_EMBEDDING_CACHE_TTL = get_int(
+    name="QDRANT_EMBEDDING_CACHE_TTL", default=60 * 60 * 24 * 7
+)
+
 QDRANT_CLIENT_TIMEOUT = get_int(name="QDRANT_CLIENT_TIMEOUT", default=10)
 
 VECTOR_HYBRID_SEARCH_PREFETCH_MULTIPLIER = get_int(
@@ -873,6 +956,12 @@ HYBRID_VECTOR_SEARCH_MIN_SCORE = get_float(
 # hard limit for special cases where we need to return all results without pagination
 VECTOR_SEARCH_PAGE_MAX_LIMIT = get_int("VECTOR_SEARCH_PAGE_MAX_LIMIT", 200)
 
+# seconds to cache the ranked point ids and facet counts of score cutoff searches,
+# so paging through the same search does not re-run it. 0 disables the cache.
+VECTOR_SEARCH_RANKED_RESULTS_CACHE_DURATION = get_int(
+    "VECTOR_SEARCH_RANKED_RESULTS_CACHE_DURATION", 300
+)
+
 # serve learning resource search hits from the Qdrant payload instead of
 # re-hydrating them from the database. Set to False to fall back to database
 # hydration without a deploy.
@@ -880,6 +969,14 @@ VECTOR_SEARCH_RESOURCES_FROM_PAYLOAD = get_bool(
     name="VECTOR_SEARCH_RESOURCES_FROM_PAYLOAD", default=True
 )
 
+# serve content file search hits from the Qdrant payload instead of re-hydrating
+# them from the database. Points indexed before the payload carried every response
+# field are incomplete, so only enable this once generate_embeddings has refreshed
+# the content file payloads.
+VECTOR_SEARCH_CONTENT_FILES_FROM_PAYLOAD = get_bool(
+    name="VECTOR_SEARCH_CONTENT_FILES_FROM_PAYLOAD", default=False
+)
+
 # toggle to use requests (default for local) or webdriver which renders js elements
 EMBEDDINGS_EXTERNAL_FETCH_USE_WEBDRIVER = get_bool(
     "EMBEDDINGS_EXTERNAL_FETCH_USE_WEBDRIVER", default=False
@@ -905,6 +1002,14 @@ CONTENT_FILE_EMBEDDING_CHUNK_OVERLAP = get_int(
 )
 
 CONTENT_FILE_SUMMARIZER_BATCH_SIZE = get_int("CONTENT_FILE_SUMMARIZER_BATCH_SIZE", 20)
+# threads issuing summary/flashcards requests, and the cap on concurrent
+# requests to any one LLM model across them
+CONTENT_SUMMARIZER_MAX_WORKERS = get_int("CONTENT_SUMMARIZER_MAX_WORKERS", 8)
+CONTENT_SUMMARIZER_MAX_REQUESTS_PER_MODEL = get_int(
+    "CONTENT_SUMMARIZER_MAX_REQUESTS_PER_MODEL", 4
+)
+# number of generated summaries/flashcards saved per transaction
+CONTENT_SUMMARIZER_SAVE_BATCH_SIZE = get_int("CONTENT_SUMMARIZER_SAVE_BATCH_SIZE", 10)
 # number of flashcards to generate
 CONTENT_SUMMARIZER_FLASHCARD_QUANTITY = get_int(
     "CONTENT_SUMMARIZER_FLASHCARD_QUANTITY", 10
@@ -17,6 +17,8 @@ EDX_COURSE_BUCKET_PREFIX = get_string(
 # OCW settings
 OCW_LIVE_BUCKET = get_string("OCW_LIVE_BUCKET", None)
 OCW_ITERATOR_CHUNK_SIZE = get_int("OCW_ITERATOR_CHUNK_SIZE", 1000)
+# Threads reading a course's data.json and content files from S3 during a sync
+OCW_CONTENT_FILE_FETCH_WORKERS = get_int("OCW_CONTENT_FILE_FETCH_WORKERS", 8)
 OCW_SKIP_CONTENT_FILES = get_bool("OCW_SKIP_CONTENT_FILES", default=False)
 OCW_WEBHOOK_KEY = get_string("OCW_WEBHOOK_KEY", None)
 OCW_OFFLINE_DELIVERY = get_bool("OCW_OFFLINE_DELIVERY", default=False)
@@ -138,6 +140,15 @@ TIKA_ACCESS_TOKEN = get_string("TIKA_ACCESS_TOKEN", None)
 TIKA_TIMEOUT = get_int("TIKA_TIMEOUT", 60)
 TIKA_OCR_STRATEGY = get_string("TIKA_OCR_STRATEGY", "no_ocr")
 SKIP_TIKA = get_bool("SKIP_TIKA", default=False)
+# Number of course archive files extracted with Tika/OCR concurrently
+CONTENT_FILE_EXTRACTION_WORKERS = get_int("CONTENT_FILE_EXTRACTION_WORKERS", 4)
+# Number of content files upserted per bulk write
+CONTENT_FILE_LOAD_BATCH_SIZE = get_int("CONTENT_FILE_LOAD_BATCH_SIZE", 100)
+# Read course archives as a stream instead of extracting them to disk first
+CONTENT_FILE_STREAM_ARCHIVES = get_bool("CONTENT_FILE_STREAM_ARCHIVES", default=False)
+# Resolve topics/departments/platforms/offerors from per-run lookup maps and
+# send course/program search and embedding updates in bulk after each load
+ETL_BULK_LOAD_RESOURCES = get_bool("ETL_BULK_LOAD_RESOURCES", default=False)
 
 
 # Base content URLs for different sources
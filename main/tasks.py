@@ -49,8 +49,18 @@ def delete_old_task_jobs():
 @app.task
 def clear_views_cache():
     """
-    Drop cached view responses
+    Invalidate cached view responses
     """
-    cleared = utils.clear_views_cache()
-    log.info("Cleared %d cached view responses", cleared)
-    return cleared
+    generation = utils.clear_views_cache()
+    log.info("Invalidated cached view responses, now at generation %d", generation)
+    return generation
+
+
+@app.task
+def purge_views_cache():
+    """
+    Delete cached view responses, including those left by old generations
+    """
+    purged = utils.purge_views_cache()
+    log.info("Purged %d cached view responses", purged)
+    return purged
@@ -1,8 +1,10 @@
 """Testing utils"""
 
 import json
+import threading
 import traceback
 from contextlib import contextmanager
+from functools import wraps
 from unittest.mock import Mock
 
 import pytest
@@ -139,3 +141,41 @@ class PickleableMock(Mock):
     def __reduce__(self):
         """Required method for being pickleable"""  # noqa: D401
         return (Mock, ())
+
+
+class ConcurrencyProbe:
+    """
+    Wrap a fake to record how many calls to it run at once
+
+    Each call holds its slot until `expected` calls are in flight together (or
+    `timeout` seconds pass), so the peak doesn't depend on how fast the calls
+    happen to be. Check `peak` once the code under test has run.
+    """
+
+    def __init__(self, expected, timeout=5):
+        """Create a probe expecting `expected` calls in flight at once"""
+        self.expected = expected
+        self.timeout = timeout
+        self.peak = 0
+        self._running = 0
+        self._lock = threading.Lock()
+        self._all_in_flight = threading.Event()
+
+    def __call__(self, func):
+        """Return func wrapped to be counted while it runs"""
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self._lock:
+                self._running += 1
+                self.peak = max(self.peak, self._running)
+                if self._running >= self.expected:
+                    self._all_in_flight.set()
+            try:
+                self._all_in_flight.wait(self.timeout)
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+        return wrapper
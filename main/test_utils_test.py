@@ -1,10 +1,12 @@
 """Tests for test utils"""
 
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from main.test_utils import (
+    ConcurrencyProbe,
     MockResponse,
     PickleableMock,
     any_instance_of,
@@ -66,3 +68,17 @@ def test_assert_json_equal():
     assert_json_equal({"a": 1}, {"a": 1})
     assert_json_equal(2, 2)
     assert_json_equal([2], [2])
+
+
+def test_concurrency_probe():
+    """ConcurrencyProbe records the peak number of calls running at once"""
+    probe = ConcurrencyProbe(3)
+    double = probe(lambda value: value * 2)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        assert list(executor.map(double, range(6))) == [0, 2, 4, 6, 8, 10]
+    assert probe.peak == 3
+
+    serial_probe = ConcurrencyProbe(2, timeout=0)
+    serial_probe(lambda: None)()
+    assert serial_probe.peak == 1
@@ -1,12 +1,16 @@
 """main utilities"""
 
+import asyncio
 import datetime
 import json
 import logging
 import os
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Flag, auto
-from functools import wraps
+from functools import cache, wraps
 from hashlib import md5
 from itertools import islice
 from urllib.parse import urljoin
@@ -15,10 +19,13 @@ import markdown2
 import requests
 from bs4 import BeautifulSoup
 from django.conf import settings
-from django.core.cache import caches
-from django.http import HttpResponse
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import BaseCache, caches
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
 from django.views.decorators.cache import cache_page
 from nh3 import nh3
+from opentelemetry import metrics
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
@@ -29,6 +36,27 @@ log = logging.getLogger(__name__)
 # This is the Django ImageField max path size
 IMAGE_PATH_MAX_LENGTH = 100
 
+# Counters folded into cached view keys; bumping one invalidates its entries
+VIEW_CACHE_GENERATION_KEY = "views.cache_generation.{key_prefix}"
+ALL_VIEWS_CACHE_GENERATION = "*"
+# Seconds between checks for a response another request is computing
+VIEW_CACHE_LOCK_POLL_INTERVAL = 0.05
+# Request headers a background view refresh keeps, so built URLs stay the same
+VIEW_CACHE_REFRESH_META = (
+    "HTTP_HOST",
+    "HTTP_X_FORWARDED_HOST",
+    "HTTP_X_FORWARDED_PORT",
+    "SERVER_NAME",
+    "SERVER_PORT",
+)
+
+_view_cache_lookups = metrics.get_meter(__name__).create_counter(
+    "view_cache.lookups",
+    description="Cached view lookups, by key_prefix and outcome (hit, stale, miss)",
+)
+# Background refreshes of stale async views still in flight
+_view_cache_refresh_tasks = set()
+
 
 def _sorted_query_string(query_dict):
     """Build a sorted query string for consistent cache keys."""
@@ -67,13 +95,86 @@ def _cached_response(request, cached_data):
     return HttpResponse(cached_data, content_type="application/json")
 
 
-def _cache_response_json(cache_backend, cache_key, cache_timeout, response):
+class _ViewCacheRefreshRequest(HttpRequest):
+    """
+    Anonymous GET copy of a request whose cached response went stale, holding
+    only what the response is cached by (path and query string).
+
+    The refresh runs after the original request has finished, so it must not
+    share that request's user, session or cookies.
+    """
+
+    def __init__(self, request):
+        super().__init__()
+        self.method = "GET"
+        self.path = request.path
+        self.path_info = request.path_info
+        self.GET = request.GET.copy()
+        self.META = {
+            key: request.META[key]
+            for key in VIEW_CACHE_REFRESH_META
+            if key in request.META
+        }
+        self.META["QUERY_STRING"] = self.GET.urlencode()
+        self.resolver_match = request.resolver_match
+        self.user = AnonymousUser()
+        self._scheme = request.scheme
+
+    def _get_scheme(self):
+        return self._scheme
+
+
+def _is_view_cache_refresh(request) -> bool:
+    """
+    Whether a request is a background refresh, which the cache decorators run
+    uncached. DRF views get it wrapped in a rest_framework Request.
+    """
+    return isinstance(getattr(request, "_request", request), _ViewCacheRefreshRequest)
+
+
+@dataclass(frozen=True)
+class _ViewCacheEntry:
+    """Where and for how long a cached view response is stored."""
+
+    backend: BaseCache
+    key: str
+    timeout: int
+    # Seconds the response stays fresh, for stale-while-revalidate
+    soft_timeout: int | None = None
+
+    @property
+    def lock_key(self) -> str:
+        """Key of the single-flight lock for this response."""
+        return f"{self.key}.lock"
+
+    @property
+    def fresh_key(self) -> str:
+        """Key of the marker that this response is within its soft TTL."""
+        return f"{self.key}.fresh"
+
+
+def _store_view_cache(entry, content, lock_key=None):
+    """
+    Store rendered JSON bytes for a view and release the single-flight lock.
+
+    With a soft_timeout, a marker key records how long the entry stays fresh;
+    after it expires the entry is served stale (until the hard timeout) while a
+    background refresh runs.
+    """
+    if entry.soft_timeout is not None:
+        entry.backend.set(entry.fresh_key, 1, entry.soft_timeout)
+    entry.backend.set(entry.key, content, entry.timeout)
+    _release_view_cache_lock(entry, lock_key)
+
+
+def _cache_response_json(entry, response, lock_key=None):
     """
     Cache the response's rendered JSON bytes.
 
     Piggybacks on the response's own render pass so a cache miss doesn't render
     the payload twice. Only a non-JSON renderer (the browsable API) needs a
-    separate JSON render.
+    separate JSON render. If lock_key is given, the single-flight lock is
+    released once the bytes are stored.
     """
 
     def store(rendered):
@@ -82,16 +183,232 @@ def _cache_response_json(cache_backend, cache_key, cache_timeout, response):
             if rendered.accepted_renderer.format == "json"
             else JSONRenderer().render(rendered.data)
         )
-        cache_backend.set(cache_key, content, cache_timeout)
+        _store_view_cache(entry, content, lock_key)
 
     if hasattr(response, "add_post_render_callback"):
         response.add_post_render_callback(store)
     else:
-        cache_backend.set(
-            cache_key, JSONRenderer().render(response.data), cache_timeout
+        _store_view_cache(entry, JSONRenderer().render(response.data), lock_key)
+
+
+def _release_view_cache_lock(entry, lock_key):
+    """Release a single-flight lock, if one is held."""
+    if lock_key is not None:
+        entry.backend.delete(lock_key)
+
+
+def _cache_or_release(entry, response, lock_key):
+    """
+    Cache a successful response, releasing the single-flight lock once it is
+    stored. Other responses are not cached and release the lock right away.
+    """
+    if response.status_code == 200:  # noqa: PLR2004
+        # Cache rendered JSON bytes so cache hits skip DRF serialization entirely
+        _cache_response_json(entry, response, lock_key)
+    else:
+        _release_view_cache_lock(entry, lock_key)
+
+
+def _acquire_view_cache_lock(entry):
+    """
+    Take the single-flight lock for a cache key, or wait for whoever has it.
+
+    Only the request holding the lock runs the view; the rest wait briefly for
+    its response instead of stampeding the backing query, then give up and run
+    the view themselves. Only misses get here: a stale response is served
+    before the lock is tried, so nobody waits while one exists. Any response
+    stored since the miss is returned without sleeping.
+
+    Returns:
+        tuple: (lock_key, None) if the lock was taken, otherwise
+            (None, cached_data) where cached_data is None if the response
+            didn't show up within settings.REDIS_VIEW_CACHE_LOCK_WAIT_MS
+    """
+    if entry.backend.add(entry.lock_key, 1, settings.REDIS_VIEW_CACHE_LOCK_TIMEOUT):
+        return entry.lock_key, None
+    deadline = time.monotonic() + settings.REDIS_VIEW_CACHE_LOCK_WAIT_MS / 1000
+    while True:
+        cached_data = entry.backend.get(entry.key)
+        if cached_data is not None or time.monotonic() >= deadline:
+            return None, cached_data
+        time.sleep(VIEW_CACHE_LOCK_POLL_INTERVAL)
+
+
+async def _aacquire_view_cache_lock(entry):
+    """Async version of _acquire_view_cache_lock"""
+    if await entry.backend.aadd(
+        entry.lock_key, 1, settings.REDIS_VIEW_CACHE_LOCK_TIMEOUT
+    ):
+        return entry.lock_key, None
+    deadline = time.monotonic() + settings.REDIS_VIEW_CACHE_LOCK_WAIT_MS / 1000
+    while True:
+        cached_data = await entry.backend.aget(entry.key)
+        if cached_data is not None or time.monotonic() >= deadline:
+            return None, cached_data
+        await asyncio.sleep(VIEW_CACHE_LOCK_POLL_INTERVAL)
+
+
+def _get_cached_view(entry):
+    """
+    Look up a cached view response.
+
+    Returns:
+        tuple: (cached_data, is_fresh). Without a soft_timeout every cached
+            response is fresh.
+    """
+    if entry.soft_timeout is None:
+        return entry.backend.get(entry.key), True
+    cached = entry.backend.get_many([entry.key, entry.fresh_key])
+    return cached.get(entry.key), entry.fresh_key in cached
+
+
+async def _aget_cached_view(entry):
+    """Async version of _get_cached_view"""
+    if entry.soft_timeout is None:
+        return await entry.backend.aget(entry.key), True
+    cached = await entry.backend.aget_many([entry.key, entry.fresh_key])
+    return cached.get(entry.key), entry.fresh_key in cached
+
+
+def _record_view_cache_lookup(key_prefix, cached_data, *, is_fresh):
+    """Count a cached view lookup as a hit, a stale hit or a miss."""
+    if cached_data is None:
+        outcome = "miss"
+    elif is_fresh:
+        outcome = "hit"
+    else:
+        outcome = "stale"
+    _view_cache_lookups.add(1, {"key_prefix": key_prefix, "outcome": outcome})
+
+
+@cache
+def _view_cache_refresh_executor():
+    """Thread pool running background refreshes of stale sync views."""
+    return ThreadPoolExecutor(
+        max_workers=settings.REDIS_VIEW_CACHE_REFRESH_WORKERS,
+        thread_name_prefix="view-cache-refresh",
+    )
+
+
+def _refresh_view_cache(entry, request, lock_key):
+    """
+    Re-run a view whose cached response went stale and store the result.
+
+    The view is dispatched afresh with the detached refresh request. Runs on a
+    refresh thread, so it closes the database connections it opened.
+    """
+    try:
+        match = request.resolver_match
+        response = match.func(request, *match.args, **match.kwargs)
+        if response.status_code == 200:  # noqa: PLR2004
+            _store_view_cache(entry, JSONRenderer().render(response.data))
+    except Exception:
+        log.exception("Failed to refresh stale cached view %s", entry.key)
+    finally:
+        _release_view_cache_lock(entry, lock_key)
+        connections.close_all()
+
+
+async def _arefresh_view_cache(entry, request, lock_key):
+    """Async version of _refresh_view_cache"""
+    try:
+        match = request.resolver_match
+        response = await match.func(request, *match.args, **match.kwargs)
+        if response.status_code == 200:  # noqa: PLR2004
+            _store_view_cache(entry, JSONRenderer().render(response.data))
+    except Exception:
+        log.exception("Failed to refresh stale cached view %s", entry.key)
+    finally:
+        _release_view_cache_lock(entry, lock_key)
+
+
+def _revalidate_in_background(entry, request):
+    """
+    Refresh a stale cached response off the request path, unless another
+    request already holds the single-flight lock (and so is refreshing it).
+
+    Requests that weren't routed through the URLconf can't be re-dispatched,
+    so their stale responses are served until they expire.
+    """
+    if request.resolver_match is None:
+        return
+    if entry.backend.add(entry.lock_key, 1, settings.REDIS_VIEW_CACHE_LOCK_TIMEOUT):
+        _view_cache_refresh_executor().submit(
+            _refresh_view_cache,
+            entry,
+            _ViewCacheRefreshRequest(request),
+            entry.lock_key,
         )
 
 
+async def _arevalidate_in_background(entry, request):
+    """Async version of _revalidate_in_background, refreshing in an asyncio task"""
+    if request.resolver_match is None:
+        return
+    if await entry.backend.aadd(
+        entry.lock_key, 1, settings.REDIS_VIEW_CACHE_LOCK_TIMEOUT
+    ):
+        task = asyncio.create_task(
+            _arefresh_view_cache(
+                entry, _ViewCacheRefreshRequest(request), entry.lock_key
+            )
+        )
+        # The event loop only keeps weak references to tasks
+        _view_cache_refresh_tasks.add(task)
+        task.add_done_callback(_view_cache_refresh_tasks.discard)
+
+
+def _view_cache_generation_keys(key_prefix: str) -> list[str]:
+    """Keys of the global and per-prefix generation counters for cached views."""
+    return [
+        VIEW_CACHE_GENERATION_KEY.format(key_prefix=ALL_VIEWS_CACHE_GENERATION),
+        VIEW_CACHE_GENERATION_KEY.format(key_prefix=key_prefix),
+    ]
+
+
+def _view_cache_generations(cache_backend, key_prefix: str) -> dict:
+    """
+    Read the generation counters for a key_prefix.
+
+    Counters that don't exist yet are created at 0 (what a missing counter
+    reads as), so that a cache tier in front of Redis can keep them instead of
+    missing on every request.
+    """
+    keys = _view_cache_generation_keys(key_prefix)
+    generations = cache_backend.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache_backend.add(key, 0, timeout=None)
+    return generations
+
+
+async def _aview_cache_generations(cache_backend, key_prefix: str) -> dict:
+    """Async version of _view_cache_generations"""
+    keys = _view_cache_generation_keys(key_prefix)
+    generations = await cache_backend.aget_many(keys)
+    for key in keys:
+        if key not in generations:
+            await cache_backend.aadd(key, 0, timeout=None)
+    return generations
+
+
+def _view_cache_key(request, key_prefix: str, generations: dict) -> str:
+    """
+    Build the cache key for a request from its path, sorted query string and
+    the current cache generations of its key_prefix.
+
+    Folding the generations into the hash means bumping one (clear_views_cache)
+    orphans every entry cached under the old value; those expire on their TTL.
+    """
+    generation = ".".join(
+        str(generations.get(key, 0)) for key in _view_cache_generation_keys(key_prefix)
+    )
+    query_string = _sorted_query_string(request.GET)
+    raw_key = f"{key_prefix}:{generation}:{request.path}:{query_string}"
+    url_hash = md5(raw_key.encode()).hexdigest()  # noqa: S324
+    return f"views.decorators.cache.cache_page.{key_prefix}.GET.{url_hash}"
+
+
 def _resolve_cache_timeout(timeout: int | None) -> int:
     """Resolve a cache timeout, deferring to settings when no timeout is given."""
     if timeout is None:
@@ -99,13 +416,14 @@ def _resolve_cache_timeout(timeout: int | None) -> int:
     return timeout
 
 
-def _cache_page_ignoring_cookies(  # noqa: C901
+def _cache_page_ignoring_cookies(  # noqa: C901, PLR0913
     timeout: int | None = None,
     cache: str = "default",
     key_prefix: str = "",
     *,
     only_anonymous: bool = False,
     bypass: Callable | None = None,
+    soft_timeout: int | None = None,
 ) -> Callable:
     """
     Build cache key from URL path + query params only, so users share the same
@@ -124,6 +442,9 @@ def _cache_page_ignoring_cookies(  # noqa: C901
         bypass: Optional callable(request, *args, **kwargs) -> bool. When it
             returns True the view runs uncached (e.g. for privileged users who
             must see live data).
+        soft_timeout: Optional seconds a cached response stays fresh. After
+            that it is still served (until timeout) but refreshed in the
+            background (stale-while-revalidate).
     """
 
     def inner_decorator(func):  # noqa: C901
@@ -140,30 +461,39 @@ def _cache_page_ignoring_cookies(  # noqa: C901
                 if only_anonymous and request.user.is_authenticated:
                     return await func(request, *args, **kwargs)
 
-                if bypass is not None and bypass(request, *args, **kwargs):
+                if _is_view_cache_refresh(request) or (
+                    bypass is not None and bypass(request, *args, **kwargs)
+                ):
                     return await func(request, *args, **kwargs)
 
-                query_string = _sorted_query_string(request.GET)
-                raw_key = f"{key_prefix}:{request.path}:{query_string}"
-                url_hash = md5(raw_key.encode()).hexdigest()  # noqa: S324
-                cache_key = (
-                    f"views.decorators.cache.cache_page.{key_prefix}.GET.{url_hash}"
+                cache_backend = caches[cache]
+
+                generations = await _aview_cache_generations(cache_backend, key_prefix)
+                entry = _ViewCacheEntry(
+                    cache_backend,
+                    _view_cache_key(request, key_prefix, generations),
+                    cache_timeout,
+                    soft_timeout,
                 )
 
-                cache_backend = caches[cache]
+                cached_data, is_fresh = await _aget_cached_view(entry)
+                _record_view_cache_lookup(key_prefix, cached_data, is_fresh=is_fresh)
+                if cached_data is not None:
+                    if not is_fresh:
+                        await _arevalidate_in_background(entry, request)
+                    return _cached_response(request, cached_data)
 
-                cached_data = await cache_backend.aget(cache_key)
+                lock_key, cached_data = await _aacquire_view_cache_lock(entry)
                 if cached_data is not None:
                     return _cached_response(request, cached_data)
 
-                response = await func(request, *args, **kwargs)
+                try:
+                    response = await func(request, *args, **kwargs)
+                except Exception:
+                    _release_view_cache_lock(entry, lock_key)
+                    raise
 
-                if response.status_code == 200:  # noqa: PLR2004
-                    # Cache rendered JSON bytes so cache hits skip
-                    # DRF serialization entirely
-                    _cache_response_json(
-                        cache_backend, cache_key, cache_timeout, response
-                    )
+                _cache_or_release(entry, response, lock_key)
 
                 return response
 
@@ -180,30 +510,48 @@ def _cache_page_ignoring_cookies(  # noqa: C901
             if only_anonymous and request.user.is_authenticated:
                 return func(request, *args, **kwargs)
 
-            # Skip caching when the bypass predicate opts this request out
-            if bypass is not None and bypass(request, *args, **kwargs):
+            # Skip caching when the bypass predicate opts this request out, and
+            # for background refreshes, which store the response themselves
+            if _is_view_cache_refresh(request) or (
+                bypass is not None and bypass(request, *args, **kwargs)
+            ):
                 return func(request, *args, **kwargs)
 
+            cache_backend = caches[cache]
+
             # Build cache key from path + sorted query string (ignore cookies)
-            query_string = _sorted_query_string(request.GET)
-            raw_key = f"{key_prefix}:{request.path}:{query_string}"
-            url_hash = md5(raw_key.encode()).hexdigest()  # noqa: S324
-            cache_key = f"views.decorators.cache.cache_page.{key_prefix}.GET.{url_hash}"
+            # and the current generations of this key_prefix
+            generations = _view_cache_generations(cache_backend, key_prefix)
+            entry = _ViewCacheEntry(
+                cache_backend,
+                _view_cache_key(request, key_prefix, generations),
+                cache_timeout,
+                soft_timeout,
+            )
 
-            cache_backend = caches[cache]
+            # Try to get from cache. Stale entries are served as-is while one
+            # request refreshes them in the background
+            cached_data, is_fresh = _get_cached_view(entry)
+            _record_view_cache_lookup(key_prefix, cached_data, is_fresh=is_fresh)
+            if cached_data is not None:
+                if not is_fresh:
+                    _revalidate_in_background(entry, request)
+                return _cached_response(request, cached_data)
 
-            # Try to get from cache
-            cached_data = cache_backend.get(cache_key)
+            # Single-flight: only one request per key runs the view at a time
+            lock_key, cached_data = _acquire_view_cache_lock(entry)
             if cached_data is not None:
                 return _cached_response(request, cached_data)
 
             # Execute view
-            response = func(request, *args, **kwargs)
+            try:
+                response = func(request, *args, **kwargs)
+            except Exception:
+                _release_view_cache_lock(entry, lock_key)
+                raise
 
-            # Only cache successful responses. Cache rendered JSON bytes so
-            # cache hits skip DRF serialization entirely
-            if response.status_code == 200:  # noqa: PLR2004
-                _cache_response_json(cache_backend, cache_key, cache_timeout, response)
+            # Only cache successful responses
+            _cache_or_release(entry, response, lock_key)
 
             return response
 
@@ -266,7 +614,10 @@ def call_fastly_purge_api(relative_url, timeout=30, *, soft=False):
 
 
 def cache_page_for_anonymous_users(
-    timeout: int | None = None, cache: str = "default", key_prefix: str = ""
+    timeout: int | None = None,
+    cache: str = "default",
+    key_prefix: str = "",
+    soft_timeout: int | None = None,
 ) -> Callable:
     """
     Cache decorator for anonymous users only, ignoring Vary headers.
@@ -276,9 +627,15 @@ def cache_page_for_anonymous_users(
             is read at request time. If <= 0, caching is skipped entirely.
         cache: Name of the cache backend to use.
         key_prefix: Prefix for the cache key.
+        soft_timeout: Optional seconds a cached response stays fresh before it
+            is served stale and refreshed in the background.
     """
     return _cache_page_ignoring_cookies(
-        timeout, cache=cache, key_prefix=key_prefix, only_anonymous=True
+        timeout,
+        cache=cache,
+        key_prefix=key_prefix,
+        only_anonymous=True,
+        soft_timeout=soft_timeout,
     )
 
 
@@ -304,6 +661,7 @@ def cache_page_for_all_users(
     cache: str = "default",
     key_prefix: str = "",
     bypass: Callable | None = None,
+    soft_timeout: int | None = None,
 ) -> Callable:
     """
     Cache decorator that ignores authentication and Vary headers.
@@ -321,6 +679,8 @@ def cache_page_for_all_users(
         key_prefix: Prefix for the cache key.
         bypass: Optional callable(request, *args, **kwargs) -> bool. When it
             returns True the view runs uncached (e.g. for privileged users).
+        soft_timeout: Optional seconds a cached response stays fresh before it
+            is served stale and refreshed in the background.
     """
     return _cache_page_ignoring_cookies(
         timeout,
@@ -328,6 +688,7 @@ def cache_page_for_all_users(
         key_prefix=key_prefix,
         only_anonymous=False,
         bypass=bypass,
+        soft_timeout=soft_timeout,
     )
 
 
@@ -639,15 +1000,51 @@ def clean_data(data: str, tags=None, attributes=None) -> str:
 
 def clear_views_cache(key_prefix: str | None = None) -> int:
     """
-    Clear cached view responses from Redis.
+    Invalidate cached view responses by bumping their cache generation.
+
+    This is a single INCR rather than a SCAN over the Redis keyspace (shared
+    with the Celery broker + result backend). Entries cached under the old
+    generation are never read again and expire on their own TTL; use
+    purge_views_cache to reclaim their memory sooner.
+
+    Args:
+        key_prefix: If given, only invalidate responses cached under this
+            key_prefix (as passed to the cache_page_* decorators). Otherwise
+            invalidate all.
+
+    Returns:
+        int: the new generation
+    """
+    cache = caches["redis"]
+    key = VIEW_CACHE_GENERATION_KEY.format(
+        key_prefix=key_prefix if key_prefix else ALL_VIEWS_CACHE_GENERATION
+    )
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # The counter was never bumped or has been evicted. Seed it from the
+        # clock so it can't land on a generation that still has live entries.
+        generation = int(time.time())
+        cache.set(key, generation, timeout=None)
+        return generation
+
+
+def purge_views_cache(key_prefix: str | None = None) -> int:
+    """
+    Delete cached view responses from Redis.
+
+    clear_views_cache is enough to invalidate responses; this is an opt-in
+    garbage collection of entries left behind by old generations.
 
     Args:
-        key_prefix: If given, only clear responses cached under this key_prefix
-            (as passed to the cache_page_* decorators). Otherwise clear all.
+        key_prefix: If given, only delete responses cached under this key_prefix
+            (as passed to the cache_page_* decorators). Otherwise delete all.
     """
     cache = caches["redis"]
     pattern = (
-        f"views.decorators.cache.cache_page.{key_prefix}.*" if key_prefix else "views.*"
+        f"views.decorators.cache.cache_page.{key_prefix}.*"
+        if key_prefix
+        else "views.decorators.cache.cache_page.*"
     )
 
     if hasattr(cache, "delete_pattern"):
@@ -3,6 +3,8 @@
 import asyncio
 import datetime
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil
 from tempfile import NamedTemporaryFile
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -11,6 +13,7 @@ import pytest
 from django.contrib.auth import get_user_model
 from django.core.cache import caches
 from django.http import QueryDict
+from django.urls import ResolverMatch
 from django.utils.decorators import method_decorator
 from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
 from rest_framework.response import Response
@@ -23,6 +26,7 @@ from main.constants import (
 )
 from main.factories import UserFactory
 from main.utils import (
+    _refresh_view_cache,
     _sorted_query_string,
     cache_page_for_all_users,
     cache_page_for_anonymous_users,
@@ -41,6 +45,7 @@ from main.utils import (
     normalize_to_start_of_day,
     now_in_utc,
     prefetched_iterator,
+    purge_views_cache,
     write_to_file,
 )
 
@@ -349,7 +354,7 @@ def view_cache(settings):
     return caches["default"]
 
 
-def _decorated_api_view(decorator=None, status=200):
+def _decorated_api_view(decorator=None, status=200, delay=0):
     """Build a real DRF view with a cache decorator applied to its handler."""
     calls = {"count": 0}
 
@@ -361,6 +366,7 @@ def _decorated_api_view(decorator=None, status=200):
         @method_decorator(decorator or cache_page_for_all_users())
         def get(self, request):  # noqa: ARG002
             calls["count"] += 1
+            time.sleep(delay)
             return Response({"result": "fresh", "call": calls["count"]}, status=status)
 
     view = CachedView.as_view()
@@ -371,6 +377,8 @@ def _decorated_api_view(decorator=None, status=200):
 def _get(view, path="/test/", user=None):
     """Issue a GET through the full DRF request/render cycle."""
     request = APIRequestFactory().get(path)
+    # as if routed, so stale responses can be refreshed by re-dispatching
+    request.resolver_match = ResolverMatch(view, (), {})
     if user is not None:
         force_authenticate(request, user=user)
     response = view(request)
@@ -476,11 +484,222 @@ def test_cache_only_caches_200_responses(view_cache):
     assert view.calls["count"] == 2
 
 
+def test_cache_single_flight(view_cache, settings):
+    """Concurrent misses for the same key run the view only once."""
+    settings.REDIS_VIEW_CACHE_LOCK_WAIT_MS = 2000
+    view = _decorated_api_view(delay=0.2)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        responses = list(executor.map(lambda _: _get(view), range(5)))
+
+    assert view.calls["count"] == 1
+    assert {response.content for response in responses} == {responses[0].content}
+
+
+@pytest.mark.parametrize("status", [200, 404])
+def test_cache_single_flight_releases_lock(view_cache, status):
+    """The lock is released once the response is cached or turns out uncacheable."""
+    view = _decorated_api_view(status=status)
+
+    _get(view)
+
+    assert not [key for key in view_cache._cache if key.endswith(".lock")]  # noqa: SLF001
+
+
+@patch("main.utils.caches")
+def test_cache_single_flight_wait_times_out(mock_caches, settings):
+    """A request that can't get the lock runs the view if the wait times out."""
+    settings.REDIS_VIEW_CACHE_LOCK_WAIT_MS = 0
+    mock_cache = MagicMock()
+    mock_cache.get.return_value = None
+    mock_cache.add.return_value = False
+    mock_caches.__getitem__.return_value = mock_cache
+
+    view = _create_view()
+    response = cache_page_for_all_users(300)(view)(_create_mock_request())
+
+    assert view.call_count["count"] == 1
+    assert response.data["result"] == "fresh"
+    mock_cache.delete.assert_not_called()
+
+
+@patch("main.utils.time.sleep")
+@patch("main.utils.caches")
+def test_cache_single_flight_no_wait_when_stored(mock_caches, mock_sleep):
+    """A request that loses the lock after the response was stored doesn't sleep."""
+    mock_cache = MagicMock()
+    mock_cache.get.side_effect = [None, b'{"result": "cached"}']
+    mock_cache.add.return_value = False
+    mock_caches.__getitem__.return_value = mock_cache
+
+    view = _create_view()
+    response = cache_page_for_all_users(300)(view)(_create_mock_request())
+
+    assert view.call_count["count"] == 0
+    assert json.loads(response.content) == {"result": "cached"}
+    mock_sleep.assert_not_called()
+
+
+def test_cache_single_flight_serves_stale_without_waiting(mocker, view_cache):
+    """A stale response is served right away while another request holds the lock."""
+    mocker.patch("main.utils._view_cache_refresh_executor")
+    view = _decorated_api_view(cache_page_for_all_users(soft_timeout=30))
+    _get(view)
+    for key in list(view_cache._cache):  # noqa: SLF001
+        if key.endswith(".fresh"):
+            stale_key = key.split(":", 2)[2].removesuffix(".fresh")
+            view_cache.delete(f"{stale_key}.fresh")
+            view_cache.set(f"{stale_key}.lock", 1)
+    mock_sleep = mocker.patch("main.utils.time.sleep")
+
+    assert json.loads(_get(view).content)["call"] == 1
+    assert view.calls["count"] == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("main.utils.caches")
+def test_cache_single_flight_releases_lock_on_error(mock_caches):
+    """The lock is released if the view raises."""
+    mock_cache = MagicMock()
+    mock_cache.get.return_value = None
+    mock_cache.add.return_value = True
+    mock_caches.__getitem__.return_value = mock_cache
+
+    def view(request):
+        raise ValueError
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        cache_page_for_all_users(300)(view)(_create_mock_request())
+
+    lock_key = mock_cache.add.call_args.args[0]
+    assert lock_key.endswith(".lock")
+    mock_cache.delete.assert_called_once_with(lock_key)
+
+
+def test_cache_stale_while_revalidate(mocker, view_cache):
+    """
+    After the soft timeout the stale response is served while it is refreshed
+    in the background, and lookups are counted by outcome.
+    """
+    mocker.patch(
+        "main.utils._view_cache_refresh_executor"
+    ).return_value.submit.side_effect = lambda fn, *args: fn(*args)
+    lookups = mocker.patch("main.utils._view_cache_lookups")
+    view = _decorated_api_view(cache_page_for_all_users(soft_timeout=30))
+
+    assert json.loads(_get(view).content)["call"] == 1
+    assert json.loads(_get(view).content)["call"] == 1
+    assert view.calls["count"] == 1
+
+    # expire the soft timeout
+    for key in list(view_cache._cache):  # noqa: SLF001
+        if key.endswith(".fresh"):
+            view_cache.delete(key.split(":", 2)[2])
+
+    assert json.loads(_get(view).content)["call"] == 1
+    assert view.calls["count"] == 2
+    assert json.loads(_get(view).content)["call"] == 2
+    assert view.calls["count"] == 2
+
+    assert [call.args[1]["outcome"] for call in lookups.add.call_args_list] == [
+        "miss",
+        "hit",
+        "stale",
+        "hit",
+    ]
+
+
+@pytest.mark.django_db
+def test_cache_stale_refresh_uses_detached_request(mocker, view_cache):
+    """
+    A stale response is refreshed by re-dispatching the view with an anonymous
+    copy of the request, not the request that found it stale.
+    """
+    refreshes = []
+    mocker.patch(
+        "main.utils._view_cache_refresh_executor"
+    ).return_value.submit.side_effect = lambda _fn, *args: refreshes.append(args)
+    seen = []
+
+    class CachedView(APIView):
+        permission_classes = ()
+        versioning_class = None
+
+        @method_decorator(cache_page_for_all_users(soft_timeout=30))
+        def get(self, request):
+            seen.append(request)
+            return Response({"q": request.GET.getlist("q"), "call": len(seen)})
+
+    view = CachedView.as_view()
+    user = UserFactory.create()
+    _get(view, path="/test/?q=a&q=b", user=user)
+    for key in list(view_cache._cache):  # noqa: SLF001
+        if key.endswith(".fresh"):
+            view_cache.delete(key.split(":", 2)[2])
+
+    _get(view, path="/test/?q=a&q=b", user=user)
+    entry, refresh_request, lock_key = refreshes[0]
+    _refresh_view_cache(entry, refresh_request, lock_key)
+
+    refreshed = seen[-1]
+    assert len(seen) == 2
+    assert refreshed._request is refresh_request  # noqa: SLF001
+    assert refreshed.user.is_anonymous
+    assert "HTTP_COOKIE" not in refresh_request.META
+    assert json.loads(_get(view, path="/test/?q=b&q=a").content) == {
+        "q": ["a", "b"],
+        "call": 2,
+    }
+
+
+def test_cache_stale_unrouted_request_not_refreshed(mocker, view_cache):
+    """Requests that didn't go through the URLconf serve stale responses as-is."""
+    executor = mocker.patch("main.utils._view_cache_refresh_executor")
+    view = _decorated_api_view(cache_page_for_all_users(soft_timeout=30))
+    _get(view)
+    for key in list(view_cache._cache):  # noqa: SLF001
+        if key.endswith(".fresh"):
+            view_cache.delete(key.split(":", 2)[2])
+
+    request = APIRequestFactory().get("/test/")
+    assert json.loads(view(request).render().content)["call"] == 1
+    executor.assert_not_called()
+    assert view.calls["count"] == 1
+
+
+def test_cache_two_tier(settings):
+    """Responses cached through the views alias are served from process memory"""
+    settings.REDIS_VIEW_CACHE_DURATION = 60
+    settings.CACHES = {
+        **settings.CACHES,
+        "redis": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "view-cache-two-tier-tests",
+        },
+        "views_local": {
+            "BACKEND": "main.cache.backends.BoundedMemoryCache",
+            "LOCATION": "view-cache-two-tier-tests",
+        },
+    }
+    caches["views_local"].clear()
+    view = _decorated_api_view(
+        cache_page_for_all_users(cache="views", key_prefix="platforms")
+    )
+
+    first = _get(view)
+    caches["redis"].clear()
+
+    assert _get(view).content == first.content
+    assert view.calls["count"] == 1
+
+
 @patch("main.utils.caches")
 def test_async_cache_stores_rendered_json_bytes(mock_caches):
     """The async decorator caches the bytes from the response's render pass."""
     mock_cache = MagicMock()
     mock_cache.aget = AsyncMock(return_value=None)
+    mock_cache.aget_many = AsyncMock(return_value={})
+    mock_cache.aadd = AsyncMock(return_value=True)
     mock_caches.__getitem__.return_value = mock_cache
 
     async def view(request):
@@ -663,7 +882,7 @@ def test_cache_key_format(mock_caches):
 
 
 @patch("main.utils.caches")
-def test_clear_views_cache_uses_large_itersize(mock_caches):
+def test_purge_views_cache_uses_large_itersize(mock_caches):
     """
     delete_pattern must be called with a large itersize (SCAN COUNT).
 
@@ -675,12 +894,64 @@ def test_clear_views_cache_uses_large_itersize(mock_caches):
     mock_cache.delete_pattern.return_value = 3
     mock_caches.__getitem__.return_value = mock_cache
 
-    result = clear_views_cache()
+    result = purge_views_cache()
 
-    mock_cache.delete_pattern.assert_called_once_with("views.*", itersize=1000)
+    mock_cache.delete_pattern.assert_called_once_with(
+        "views.decorators.cache.cache_page.*", itersize=1000
+    )
     assert result == 3
 
 
+@patch("main.utils.caches")
+def test_purge_views_cache_only_matches_the_prefix(mock_caches):
+    """A key_prefix should not also purge prefixes that merely start with it"""
+    mock_cache = MagicMock()
+    mock_caches.__getitem__.return_value = mock_cache
+
+    purge_views_cache("search")
+
+    mock_cache.delete_pattern.assert_called_once_with(
+        "views.decorators.cache.cache_page.search.*", itersize=1000
+    )
+
+
+def test_clear_views_cache_bumps_generation(settings):
+    """clear_views_cache invalidates cached responses without deleting them"""
+    settings.REDIS_VIEW_CACHE_DURATION = 60
+    settings.CACHES = {
+        **settings.CACHES,
+        "redis": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "view-cache-generation-tests",
+        },
+    }
+    caches["redis"].clear()
+    view = _decorated_api_view(
+        cache_page_for_all_users(cache="redis", key_prefix="topics")
+    )
+
+    _get(view)
+    _get(view)
+    assert view.calls["count"] == 1
+
+    clear_views_cache("departments")
+    _get(view)
+    assert view.calls["count"] == 1
+
+    first_generation = clear_views_cache("topics")
+    _get(view)
+    _get(view)
+    assert view.calls["count"] == 2
+
+    assert clear_views_cache("topics") == first_generation + 1
+    _get(view)
+    assert view.calls["count"] == 3
+
+    clear_views_cache()
+    _get(view)
+    assert view.calls["count"] == 4
+
+
 @pytest.mark.parametrize("soft", [True, False])
 def test_call_fastly_purge_api_soft_header(mocker, settings, soft):
     """soft=True sends the Fastly-Soft-Purge: 1 header; default sends none"""
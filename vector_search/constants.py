@@ -5,6 +5,12 @@ RESOURCES_COLLECTION_NAME = f"{settings.QDRANT_BASE_COLLECTION_NAME}.resources"
 CONTENT_FILES_COLLECTION_NAME = f"{settings.QDRANT_BASE_COLLECTION_NAME}.content_files"
 TOPICS_COLLECTION_NAME = f"{settings.QDRANT_BASE_COLLECTION_NAME}.topics"
 
+# Dense chunk embeddings cached by encoder, model, dimensions and sha256 of the
+# chunk text
+EMBEDDING_CACHE_KEY = "embeddings.{encoder}.{model_name}.{dimensions}.{digest}"
+# Upper bound on QDRANT_EMBEDDING_CACHE_TTL (30 days)
+EMBEDDING_CACHE_MAX_TTL = 60 * 60 * 24 * 30
+
 # ContentFile columns (beyond checksum, which only covers content) compared by the
 # embed_run_content_files pre-pass to detect stale Qdrant payloads. Every entry MUST
 # be an exact serializer pass-through of a scalar/JSON ContentFile column: a field
@@ -20,6 +26,28 @@ CONTENT_FILE_PREPASS_PAYLOAD_FIELDS = (
     "edx_module_id",
     "summary",
     "flashcards",
+    "direct_learning_resource_id",
+    "uid",
+    "content_title",
+    "content_author",
+    "content_language",
+    "image_src",
+    "source_path",
+    "youtube_id",
+)
+
+# Serialized content file payload fields derived from the file's run and its
+# resource rather than its own columns, so they are the same for every file of a
+# run. The embed_run_content_files pre-pass serializes one file per run and
+# compares a digest of each of these against the stored payloads.
+CONTENT_FILE_PREPASS_RUN_PAYLOAD_FIELDS = (
+    "run_slug",
+    "semester",
+    "year",
+    "resource_id",
+    "require_summaries",
+    "topics",
+    "departments",
 )
 
 QDRANT_CONTENT_FILE_PARAM_MAP = {
@@ -43,6 +71,31 @@ QDRANT_CONTENT_FILE_PARAM_MAP = {
     "checksum": "checksum",
 }
 
+# Serialized content file fields stored on every chunk point on top of the
+# QDRANT_CONTENT_FILE_PARAM_MAP fields, so that content file search hits can be
+# served from the payload alone (VECTOR_SEARCH_CONTENT_FILES_FROM_PAYLOAD). These
+# are not filterable, so they are kept out of the param map. content is left out:
+# every chunk carries its own chunk_content and the response never includes it.
+CONTENT_FILE_RESPONSE_PAYLOAD_FIELDS = (
+    "id",
+    "run_id",
+    "direct_learning_resource_id",
+    "run_slug",
+    "departments",
+    "semester",
+    "year",
+    "topics",
+    "uid",
+    "require_summaries",
+    "content_title",
+    "content_author",
+    "content_language",
+    "image_src",
+    "resource_id",
+    "source_path",
+    "youtube_id",
+)
+
 QDRANT_RESOURCE_PARAM_MAP = {
     "readable_id": "readable_id",
     "resource_type": "resource_type",
@@ -1,3 +1,6 @@
+from itertools import pairwise
+
+import numpy as np
 from qdrant_client import models
 from sklearn.feature_extraction.text import HashingVectorizer
 
@@ -9,11 +12,14 @@ class SparseHashEncoder(BaseEncoder):
     Sparse Hash Encoder
     """
 
+    # values at or below this magnitude are dropped from the sparse vectors
+    prune_threshold = 0.1
+
     def __init__(self, model_name="sklearn/hashing_vectorizer_sparse_model"):
         self.model_name = model_name
         self.vectorizer = HashingVectorizer(stop_words="english")
 
-    def prune_sparse_vector(self, vec, threshold=0.1):
+    def prune_sparse_vector(self, vec, threshold=prune_threshold):
         return {
             "indices": [
                 i for i, v in zip(vec["indices"], vec["values"]) if abs(v) > threshold
@@ -22,15 +28,22 @@ class SparseHashEncoder(BaseEncoder):
         }
 
     def embed_documents(self, documents):
-        return [self.embed(doc) for doc in documents]
-
-    def embed(self, text):
-        tfidf_matrix = self.vectorizer.transform([text])
-        indices = tfidf_matrix.indices.tolist()
-        values = tfidf_matrix.data.tolist()
-        return models.SparseVector(
-            **self.prune_sparse_vector({"indices": indices, "values": values})
-        )
+        """
+        Embed documents as one sparse matrix, pruned with a mask over its
+        CSR arrays rather than per document
+        """
+        if not documents:
+            return []
+        matrix = self.vectorizer.transform(documents)
+        keep = np.abs(matrix.data) > self.prune_threshold
+        indices = matrix.indices[keep].tolist()
+        values = matrix.data[keep].tolist()
+        # each row's start and end offsets within the pruned arrays
+        row_bounds = np.concatenate(([0], np.cumsum(keep)))[matrix.indptr].tolist()
+        return [
+            models.SparseVector(indices=indices[start:end], values=values[start:end])
+            for start, end in pairwise(row_bounds)
+        ]
 
     def dim(self):
         """
@@ -0,0 +1,37 @@
+"""Tests for vector_search.encoders.sparse_hash"""
+
+from qdrant_client import models
+
+from vector_search.encoders.sparse_hash import SparseHashEncoder
+
+
+def _embed_one_at_a_time(encoder, text):
+    """Embed a document on its own, the way the encoder used to"""
+    matrix = encoder.vectorizer.transform([text])
+    return models.SparseVector(
+        **encoder.prune_sparse_vector(
+            {"indices": matrix.indices.tolist(), "values": matrix.data.tolist()}
+        )
+    )
+
+
+def test_sparse_hash_encoder_embed_documents_matches_single():
+    """
+    Embedding a batch as one matrix should give the same vectors as embedding
+    each document on its own
+    """
+    encoder = SparseHashEncoder()
+    documents = [
+        "Introduction to machine learning and neural networks",
+        "",
+        "the and of",
+        "Linear algebra " * 50,
+        "Thermodynamics: heat, work, entropy. Problem set 3 solutions.",
+    ]
+
+    vectors = encoder.embed_documents(documents)
+
+    assert vectors == [_embed_one_at_a_time(encoder, doc) for doc in documents]
+    assert vectors[1] == models.SparseVector(indices=[], values=[])
+    assert encoder.embed(documents[0]) == vectors[0]
+    assert encoder.embed_documents([]) == []
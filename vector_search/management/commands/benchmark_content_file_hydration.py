@@ -0,0 +1,100 @@
+"""Management command to time hydration of content file vector search hits"""
+
+from statistics import median
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from qdrant_client import models
+
+from learning_resources.models import ContentFile
+from learning_resources_search.serializers import serialize_bulk_content_files
+from vector_search.constants import (
+    CONTENT_FILE_RESPONSE_PAYLOAD_FIELDS,
+    QDRANT_CONTENT_FILE_PARAM_MAP,
+)
+from vector_search.utils import (
+    _content_file_payload_hits,
+    _content_file_vector_hits,
+    _with_run_readable_id_fallback,
+)
+
+
+def _chunk_payload(document):
+    """Return the payload a first chunk of the serialized content file gets"""
+    return _with_run_readable_id_fallback(
+        {
+            "chunk_number": 0,
+            "chunk_content": (document.get("content") or "")[:512],
+            **{
+                key: document[key]
+                for key in (
+                    *QDRANT_CONTENT_FILE_PARAM_MAP,
+                    *CONTENT_FILE_RESPONSE_PAYLOAD_FIELDS,
+                )
+                if key in document
+            },
+        }
+    )
+
+
+class Command(BaseCommand):
+    """
+    Time building content file search hits from the database and from the
+    Qdrant payload alone, over points built from existing content files.
+    """
+
+    help = "Benchmark database vs payload hydration of content file search hits"
+
+    def add_arguments(self, parser):
+        """Configure arguments for this command"""
+        parser.add_argument(
+            "--hits",
+            dest="hits",
+            type=int,
+            default=50,
+            help="Number of hits per simulated search",
+        )
+        parser.add_argument(
+            "--iterations",
+            dest="iterations",
+            type=int,
+            default=20,
+            help="Number of simulated searches per hydration mode",
+        )
+        super().add_arguments(parser)
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Hydrate the same hits both ways and compare"""
+        ids = list(
+            ContentFile.objects.filter(published=True)
+            .order_by("id")
+            .values_list("id", flat=True)[: options["hits"]]
+        )
+        if not ids:
+            self.stdout.write("No content files to search")
+            return
+        payloads = [
+            _chunk_payload(document) for document in serialize_bulk_content_files(ids)
+        ]
+
+        for label, hydrate in (
+            ("database", _content_file_vector_hits),
+            ("payload", _content_file_payload_hits),
+        ):
+            timings = []
+            for _ in range(options["iterations"]):
+                # the database path merges into the payloads, so hand each
+                # search fresh copies
+                search_result = [
+                    models.ScoredPoint(
+                        id=idx, version=0, score=1.0, payload=dict(payload)
+                    )
+                    for idx, payload in enumerate(payloads)
+                ]
+                start = perf_counter()
+                hydrate(search_result)
+                timings.append(perf_counter() - start)
+            self.stdout.write(
+                f"{label}: {len(payloads)} hits, median "
+                f"{median(timings) * 1000:.1f}ms, max {max(timings) * 1000:.1f}ms"
+            )
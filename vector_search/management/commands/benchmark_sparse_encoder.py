@@ -0,0 +1,84 @@
+"""Management command to time batched sparse encoding of content file chunks"""
+
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from qdrant_client import models
+
+from learning_resources.models import ContentFile
+from vector_search.encoders.sparse_hash import SparseHashEncoder
+
+
+class Command(BaseCommand):
+    """
+    Time SparseHashEncoder on content file text, one document at a time vs as
+    a single batch.
+    """
+
+    help = "Benchmark per-document vs batched sparse hash encoding"
+
+    def add_arguments(self, parser):
+        """Configure arguments for this command"""
+        parser.add_argument(
+            "--count",
+            dest="count",
+            type=int,
+            default=2000,
+            help="Number of content files to sample",
+        )
+        parser.add_argument(
+            "--chunk-length",
+            dest="chunk_length",
+            type=int,
+            default=2000,
+            help="Characters per chunk, roughly the size of an embedding chunk",
+        )
+        super().add_arguments(parser)
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Encode the same chunks both ways and compare"""
+        chunk_length = options["chunk_length"]
+        chunks = [
+            content[:chunk_length]
+            for content in ContentFile.objects.filter(published=True)
+            .exclude(content__isnull=True)
+            .exclude(content="")
+            .order_by("id")
+            .values_list("content", flat=True)[: options["count"]]
+        ]
+        if not chunks:
+            self.stdout.write("No content files to encode")
+            return
+        encoder = SparseHashEncoder()
+
+        start = perf_counter()
+        single = []
+        for chunk in chunks:
+            matrix = encoder.vectorizer.transform([chunk])
+            single.append(
+                models.SparseVector(
+                    **encoder.prune_sparse_vector(
+                        {
+                            "indices": matrix.indices.tolist(),
+                            "values": matrix.data.tolist(),
+                        }
+                    )
+                )
+            )
+        single_seconds = perf_counter() - start
+
+        start = perf_counter()
+        batched = encoder.embed_documents(chunks)
+        batched_seconds = perf_counter() - start
+
+        self.stdout.write(f"chunks: {len(chunks)}")
+        self.stdout.write(
+            f"per-document: {single_seconds:.3f}s "
+            f"({single_seconds / len(chunks) * 1e6:.0f}us/chunk)"
+        )
+        self.stdout.write(
+            f"batched: {batched_seconds:.3f}s "
+            f"({batched_seconds / len(chunks) * 1e6:.0f}us/chunk, "
+            f"{single_seconds / batched_seconds:.1f}x)"
+        )
+        self.stdout.write(f"identical vectors: {single == batched}")
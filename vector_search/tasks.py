@@ -1,4 +1,5 @@
 import datetime
+import json
 import logging
 from uuid import uuid4
 
@@ -30,16 +31,19 @@ from learning_resources_search.constants import (
 )
 from learning_resources_search.exceptions import RetryError
 from learning_resources_search.serializers import (
+    serialize_bulk_content_files,
     serialize_bulk_learning_resources,
 )
 from learning_resources_search.tasks import wrap_retry_exception
 from main.celery import app
 from main.utils import (
+    checksum_for_content,
     chunks,
     now_in_utc,
 )
 from vector_search.constants import (
     CONTENT_FILE_PREPASS_PAYLOAD_FIELDS,
+    CONTENT_FILE_PREPASS_RUN_PAYLOAD_FIELDS,
     CONTENT_FILES_COLLECTION_NAME,
     RESOURCES_COLLECTION_NAME,
 )
@@ -481,6 +485,11 @@ def embed_new_content_files(self):
     )
 
 
+def _payload_digest(value):
+    """Digest a serialized payload value, so nested ones compare as a whole"""
+    return checksum_for_content(json.dumps(value, sort_keys=True, default=str))
+
+
 @app.task(bind=True, max_retries=3)
 def embed_run_content_files(self, run_id):
     """
@@ -488,9 +497,11 @@ def embed_run_content_files(self, run_id):
     stale (checksum or a payload metadata field differs).
 
     A run-level pre-pass batch-compares each file's DB checksum and payload
-    metadata columns against the stored Qdrant payload, so a fully-unchanged
-    run costs one DB query plus a few batched retrieves instead of serializing
-    every file. A checksum-matching file with drifted metadata (edited title,
+    metadata columns against the stored Qdrant payload, along with digests of
+    the fields derived from the run and its resource (topics, departments,
+    semester, ...), so a fully-unchanged run costs one DB query, one file's
+    serialization and a few batched retrieves instead of serializing every
+    file. A checksum-matching file with drifted metadata (edited title,
     newly generated summary, ...) is dispatched but exits via the payload-only
     update path downstream — no re-embedding. Failed or purged embeds show up
     as missing/stale points, so they self-heal on the next load.
@@ -542,10 +553,25 @@ def embed_run_content_files(self, run_id):
             contentless, run=run, published=True
         ).values_list("id", "key")
     ]
+    # fields derived from the run and resource are the same for every file, so
+    # serialize one file to get them
+    run_digests = (
+        {
+            field: _payload_digest(document.get(field))
+            for document in serialize_bulk_content_files([pid_rows[0][0]])
+            for field in CONTENT_FILE_PREPASS_RUN_PAYLOAD_FIELDS
+        }
+        if pid_rows
+        else {}
+    )
     try:
         stored = _stored_content_payloads(
             [pid for _, pid, _, _ in pid_rows] + [pid for _, pid in contentless_rows],
-            fields=("checksum", *CONTENT_FILE_PREPASS_PAYLOAD_FIELDS),
+            fields=(
+                "checksum",
+                *CONTENT_FILE_PREPASS_PAYLOAD_FIELDS,
+                *CONTENT_FILE_PREPASS_RUN_PAYLOAD_FIELDS,
+            ),
         )
     except grpc.RpcError as err:
         if err.code() in (
@@ -562,6 +588,9 @@ def embed_run_content_files(self, run_id):
         return any(
             payload.get(field) != value
             for field, value in zip(CONTENT_FILE_PREPASS_PAYLOAD_FIELDS, meta)
+        ) or any(
+            _payload_digest(payload.get(field)) != digest
+            for field, digest in run_digests.items()
         )
 
     ids = [
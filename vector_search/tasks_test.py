@@ -19,6 +19,7 @@ from learning_resources.factories import (
     LearningResourceFactory,
     LearningResourcePlatformFactory,
     LearningResourceRunFactory,
+    LearningResourceTopicFactory,
     ProgramFactory,
 )
 from learning_resources.models import ContentFile, LearningResource
@@ -34,7 +35,10 @@ from learning_resources_search.serializers import (
     serialize_bulk_learning_resources,
 )
 from main.utils import now_in_utc
-from vector_search.constants import CONTENT_FILE_PREPASS_PAYLOAD_FIELDS
+from vector_search.constants import (
+    CONTENT_FILE_PREPASS_PAYLOAD_FIELDS,
+    CONTENT_FILE_PREPASS_RUN_PAYLOAD_FIELDS,
+)
 from vector_search.tasks import (
     _healthcheck_alert_count,
     _record_embedding_failure,
@@ -884,12 +888,14 @@ def _serializer_chunk0_pids(content_files):
 
 def _stored_payload_entry(content_file, **overrides):
     """Build a stored-payload map entry matching the file's current DB state"""
+    document = next(iter(serialize_bulk_content_files([content_file.id])))
     return {
         "checksum": content_file.checksum,
         **{
             field: getattr(content_file, field)
             for field in CONTENT_FILE_PREPASS_PAYLOAD_FIELDS
         },
+        **{field: document[field] for field in CONTENT_FILE_PREPASS_RUN_PAYLOAD_FIELDS},
         **overrides,
     }
 
@@ -968,6 +974,51 @@ def test_embed_run_content_files_pre_pass_dispatches_metadata_only_change(
     }
 
 
+@pytest.mark.parametrize("change", ["content_title", "topic_name", "semester"])
+def test_embed_run_content_files_pre_pass_dispatches_response_field_change(
+    mocker, mocked_celery, settings, change
+):
+    """
+    Files whose stored payload response fields drifted from the DB, either a
+    column of the file or a field derived from its run or resource, are
+    dispatched so payload-served search hits don't go stale.
+    """
+    settings.QDRANT_CHUNK_SIZE = 50
+    run = LearningResourceRunFactory.create(semester="Fall")
+    topic = LearningResourceTopicFactory.create(name="Physics")
+    run.learning_resource.topics.set([topic])
+    changed, unchanged = ContentFileFactory.create_batch(
+        2, run=run, published=True, content="aaa"
+    )
+    pids = _serializer_chunk0_pids([changed, unchanged])
+    mocker.patch(
+        "vector_search.tasks._stored_content_payloads",
+        return_value={
+            pids[content_file.id]: _stored_payload_entry(content_file)
+            for content_file in (changed, unchanged)
+        },
+    )
+    if change == "content_title":
+        ContentFile.objects.filter(id=changed.id).update(content_title="Retitled")
+        expected = {changed.id}
+    elif change == "topic_name":
+        topic.name = "Astrophysics"
+        topic.save()
+        expected = {changed.id, unchanged.id}
+    else:
+        run.semester = "Spring"
+        run.save()
+        expected = {changed.id, unchanged.id}
+    generate_embeddings_mock = mocker.patch(
+        "vector_search.tasks.generate_embeddings", autospec=True
+    )
+
+    with pytest.raises(mocked_celery.replace_exception_class):
+        embed_run_content_files.delay(run.id)
+
+    assert _embedded_content_file_ids(generate_embeddings_mock) == expected
+
+
 def test_content_file_prepass_fields_are_serializer_pass_through():
     """
     Every pre-pass-compared field must be an exact serializer pass-through of
@@ -1,14 +1,20 @@
 import asyncio
 import gc
+import hashlib
 import logging
 import uuid
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache
 from textwrap import dedent
 
+import numpy as np
 from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import caches
 from django.db import close_old_connections
 from django.db.models import Prefetch, Q
+from opentelemetry import metrics
 from qdrant_client import AsyncQdrantClient, QdrantClient, models
 
 from learning_resources.constants import (
@@ -42,8 +48,11 @@ from learning_resources_search.serializers import (
 from main.utils import checksum_for_content, chunks
 from vector_search.constants import (
     COLLECTION_PARAM_MAP,
+    CONTENT_FILE_RESPONSE_PAYLOAD_FIELDS,
     CONTENT_FILES_COLLECTION_NAME,
     COURSE_NUMBER_INDEXING_ONLY_FIELDS,
+    EMBEDDING_CACHE_KEY,
+    EMBEDDING_CACHE_MAX_TTL,
     QDRANT_CONTENT_FILE_INDEXES,
     QDRANT_CONTENT_FILE_PARAM_MAP,
     QDRANT_LEARNING_RESOURCE_INDEXES,
@@ -82,6 +91,11 @@ MARKDOWN_HEADERS_TO_SPLIT_ON = [
     ("####", "Header 4"),
 ]
 
+_embedding_cache_lookups = metrics.get_meter(__name__).create_counter(
+    "embedding_cache.lookups",
+    description="Content file chunk embedding cache lookups, by outcome (hit, miss)",
+)
+
 
 @cache
 def qdrant_client():
@@ -612,7 +626,10 @@ def update_content_file_payload(serialized_document):
     _set_payload(
         points,
         _with_run_readable_id_fallback(serialized_document),
-        param_map=QDRANT_CONTENT_FILE_PARAM_MAP,
+        param_map={
+            **QDRANT_CONTENT_FILE_PARAM_MAP,
+            **{field: field for field in CONTENT_FILE_RESPONSE_PAYLOAD_FIELDS},
+        },
         collection_name=CONTENT_FILES_COLLECTION_NAME,
     )
 
@@ -806,17 +823,7 @@ def _embed_course_metadata_as_contentfile(serialized_resources):
         client.upload_points(CONTENT_FILES_COLLECTION_NAME, points=points, wait=False)
 
 
-def _generate_content_file_points(serialized_content, stored_payloads):
-    """
-    Chunk and embed content file documents, yielding PointStructs.
-
-    stored_payloads maps chunk-0 point ids to stored Qdrant payload fields
-    (see _stored_content_payloads); docs whose stored checksum matches get a
-    payload-only refresh instead of re-embedding.
-    """
-    encoder_dense = dense_encoder()
-    encoder_sparse = sparse_encoder()
-
+def _content_file_request_chunk_size():
     """
     Break up requests according to chunk size to stay under openai limits
     300,000 tokens per request
@@ -826,7 +833,7 @@ def _generate_content_file_points(serialized_content, stored_payloads):
     The 0.9 factor leaves headroom: markdown header prefixes are prepended
     after the chunk-size split, so real chunks can exceed the nominal size.
     """
-    request_chunk_size = max(
+    return max(
         1,
         min(
             2048,
@@ -834,6 +841,17 @@ def _generate_content_file_points(serialized_content, stored_payloads):
         ),
     )
 
+
+def _content_file_chunks(serialized_content, stored_payloads):
+    """
+    Chunk content file documents that need embedding.
+
+    Docs whose stored checksum matches get a payload-only refresh instead; the
+    old points of every other doc are removed before its chunks are yielded.
+
+    Yields:
+        tuple: (doc, chunk_number, chunk Document) for each non-empty chunk
+    """
     for doc in serialized_content:
         embedding_context = _content_file_embedding_context(doc)
         if not embedding_context:
@@ -878,59 +896,223 @@ def _generate_content_file_points(serialized_content, stored_payloads):
         else:
             split_docs = _chunk_documents([embedding_context], [doc])
 
-        # Identify non-empty chunks and their original indices
-        valid_chunks = [(i, d) for i, d in enumerate(split_docs) if d.page_content]
+        # Skip empty chunks, keeping the original index as the chunk number
+        for chunk_id, split_doc in enumerate(split_docs):
+            if split_doc.page_content:
+                yield doc, chunk_id, split_doc
 
-        if not valid_chunks:
-            continue
 
-        split_texts = [d.page_content for _, d in valid_chunks]
-        resource_vector_point_id = vector_point_id(vector_point_key(doc))
-
-        for i in range(0, len(split_texts), request_chunk_size):
-            chunk_texts = split_texts[i : i + request_chunk_size]
-            dense_chunk_embeddings = encoder_dense.embed_documents(chunk_texts)
-            sparse_chunk_embeddings = encoder_sparse.embed_documents(chunk_texts)
-
-            for j, dense_embedding in enumerate(dense_chunk_embeddings):
-                # Map back to the original valid_chunk index
-                relative_index = i + j
-                if relative_index >= len(valid_chunks):
-                    break
-                chunk_id, split_doc = valid_chunks[relative_index]
-
-                metadata = _with_run_readable_id_fallback(
-                    {
-                        "resource_point_id": str(resource_vector_point_id),
-                        "chunk_number": chunk_id,
-                        "chunk_content": split_doc.page_content,
-                        **{
-                            key: split_doc.metadata[key]
-                            for key in QDRANT_CONTENT_FILE_PARAM_MAP
-                            if key in split_doc.metadata
-                        },
-                    }
-                )
+_encoder_dimensions = {}
+
+
+def _embedding_dimensions(encoder):
+    """Return the encoder's embedding dimensions, computed once per process"""
+    cache_key = (type(encoder), encoder.model_name)
+    if cache_key not in _encoder_dimensions:
+        _encoder_dimensions[cache_key] = encoder.dim()
+    return _encoder_dimensions[cache_key]
+
+
+def _embedding_cache_key(encoder, text):
+    """Return the embedding cache key for a chunk of text"""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return EMBEDDING_CACHE_KEY.format(
+        encoder=type(encoder).__name__,
+        model_name=encoder.model_name,
+        dimensions=_embedding_dimensions(encoder),
+        digest=digest,
+    )
+
+
+def _use_embedding_cache(encoder):
+    """
+    Whether dense embeddings from this encoder can be cached.
+    Cloud inferencing encoders return documents for Qdrant to embed, not vectors.
+    """
+    return (
+        settings.QDRANT_EMBEDDING_CACHE_ENABLED
+        and not encoder.requires_cloud_inferencing
+    )
+
+
+def _get_cached_embeddings(encoder, texts, cache_stats):
+    """
+    Look up cached dense embeddings for texts with a single multi-get
+
+    Args:
+        encoder (BaseEncoder): the dense encoder
+        texts (list of str): chunk texts
+        cache_stats (Counter): hit/miss counts to update
+
+    Returns:
+        list: the cached embedding for each text, or None where there is none
+    """
+    if not _use_embedding_cache(encoder):
+        return [None] * len(texts)
+    keys = [_embedding_cache_key(encoder, text) for text in texts]
+    cached = caches["embeddings"].get_many(keys)
+    embeddings = [
+        np.frombuffer(cached[key], dtype=np.float32).tolist() if key in cached else None
+        for key in keys
+    ]
+    hits = len(cached)
+    misses = len(keys) - hits
+    cache_stats["hits"] += hits
+    cache_stats["misses"] += misses
+    _embedding_cache_lookups.add(hits, {"outcome": "hit"})
+    _embedding_cache_lookups.add(misses, {"outcome": "miss"})
+    return embeddings
+
+
+def _set_cached_embeddings(encoder, texts, embeddings):
+    """
+    Store dense embeddings for texts as float32 bytes, the precision Qdrant
+    stores vectors at, so cached and fresh embeddings index identically
+    """
+    if not texts or not _use_embedding_cache(encoder):
+        return
+    caches["embeddings"].set_many(
+        {
+            _embedding_cache_key(encoder, text): np.asarray(
+                embedding, dtype=np.float32
+            ).tobytes()
+            for text, embedding in zip(texts, embeddings)
+        },
+        timeout=min(settings.QDRANT_EMBEDDING_CACHE_TTL, EMBEDDING_CACHE_MAX_TTL),
+    )
+
+
+def _merge_cached_embeddings(cached_embeddings, new_embeddings):
+    """
+    Fill the gaps in cached_embeddings with new_embeddings, in order,
+    stopping at the first gap new_embeddings can't fill
+    """
+    new_embeddings = iter(new_embeddings)
+    merged = []
+    for cached_embedding in cached_embeddings:
+        embedding = (
+            next(new_embeddings, None) if cached_embedding is None else cached_embedding
+        )
+        if embedding is None:
+            break
+        merged.append(embedding)
+    return merged
+
 
-                point_id = vector_point_id(
-                    vector_point_key(
-                        doc, chunk_number=chunk_id, document_type="content_file"
+def _content_file_request_points(
+    request, dense_embeddings, sparse_embeddings, encoder_dense, encoder_sparse
+):
+    """Yield a PointStruct for each chunk in an embedding request"""
+    for (doc, chunk_id, split_doc), dense_embedding, sparse_embedding in zip(
+        request, dense_embeddings, sparse_embeddings
+    ):
+        metadata = _with_run_readable_id_fallback(
+            {
+                "resource_point_id": str(vector_point_id(vector_point_key(doc))),
+                "chunk_number": chunk_id,
+                "chunk_content": split_doc.page_content,
+                **{
+                    key: split_doc.metadata[key]
+                    for key in (
+                        *QDRANT_CONTENT_FILE_PARAM_MAP,
+                        *CONTENT_FILE_RESPONSE_PAYLOAD_FIELDS,
                     )
-                )
+                    if key in split_doc.metadata
+                },
+            }
+        )
 
-                yield models.PointStruct(
-                    id=point_id,
-                    payload=metadata,
-                    vector={
-                        encoder_dense.model_short_name(): dense_embedding,
-                        encoder_sparse.model_short_name(): sparse_chunk_embeddings[j],
-                    },
-                )
-            # Explicitly free memory for large chunks
-            del chunk_texts
-            del dense_chunk_embeddings
-            del sparse_chunk_embeddings
-            gc.collect()
+        point_id = vector_point_id(
+            vector_point_key(doc, chunk_number=chunk_id, document_type="content_file")
+        )
+
+        yield models.PointStruct(
+            id=point_id,
+            payload=metadata,
+            vector={
+                encoder_dense.model_short_name(): dense_embedding,
+                encoder_sparse.model_short_name(): sparse_embedding,
+            },
+        )
+
+
+def _generate_content_file_points(
+    serialized_content, stored_payloads, cache_stats=None
+):
+    """
+    Chunk and embed content file documents, yielding PointStructs.
+
+    stored_payloads maps chunk-0 point ids to stored Qdrant payload fields
+    (see _stored_content_payloads); docs whose stored checksum matches get a
+    payload-only refresh instead of re-embedding.
+
+    Dense embedding requests are pipelined: up to
+    settings.QDRANT_EMBEDDING_MAX_IN_FLIGHT of them run on worker threads
+    while this thread chunks upcoming documents, sparse-encodes finished
+    requests and hands their points to the caller for upload. Requests finish
+    in submission order, and the bounded number in flight caps memory.
+
+    Dense embeddings are cached by model and chunk text, so only chunks that
+    have not been embedded before are sent to the provider. Cache hits and
+    misses are counted in cache_stats if it is given.
+    """
+    encoder_dense = dense_encoder()
+    encoder_sparse = sparse_encoder()
+    max_in_flight = max(1, settings.QDRANT_EMBEDDING_MAX_IN_FLIGHT)
+    if cache_stats is None:
+        cache_stats = Counter()
+
+    # Requests are packed with chunks from as many documents as fit, so short
+    # files (transcripts, small pages) don't each cost a round trip.
+    embedding_requests = chunks(
+        _content_file_chunks(serialized_content, stored_payloads),
+        chunk_size=_content_file_request_chunk_size(),
+    )
+    executor = ThreadPoolExecutor(
+        max_workers=max_in_flight, thread_name_prefix="content-file-embedding"
+    )
+    pending = deque()
+
+    def finish_oldest():
+        request, texts, cached_embeddings, missed_texts, dense_future = (
+            pending.popleft()
+        )
+        sparse_embeddings = encoder_sparse.embed_documents(texts)
+        new_embeddings = dense_future.result() if dense_future else []
+        _set_cached_embeddings(encoder_dense, missed_texts, new_embeddings)
+        dense_embeddings = _merge_cached_embeddings(cached_embeddings, new_embeddings)
+        yield from _content_file_request_points(
+            request, dense_embeddings, sparse_embeddings, encoder_dense, encoder_sparse
+        )
+        # Explicitly free memory for large chunks
+        del request, texts, dense_embeddings, sparse_embeddings, new_embeddings
+        gc.collect()
+
+    try:
+        for request in embedding_requests:
+            texts = [split_doc.page_content for _, _, split_doc in request]
+            cached_embeddings = _get_cached_embeddings(
+                encoder_dense, texts, cache_stats
+            )
+            missed_texts = [
+                text
+                for text, embedding in zip(texts, cached_embeddings)
+                if embedding is None
+            ]
+            dense_future = (
+                executor.submit(encoder_dense.embed_documents, missed_texts)
+                if missed_texts
+                else None
+            )
+            pending.append(
+                (request, texts, cached_embeddings, missed_texts, dense_future)
+            )
+            if len(pending) >= max_in_flight:
+                yield from finish_oldest()
+        while pending:
+            yield from finish_oldest()
+    finally:
+        executor.shutdown(cancel_futures=True)
 
 
 def _iter_serialized_content_files(ids):
@@ -1020,6 +1202,7 @@ def embed_learning_resources(ids, resource_type, overwrite):  # noqa: PLR0915, C
         # Batching parameters
         current_batch_docs = []
         current_batch_size = 0
+        embedding_cache_stats = Counter()
 
         collection_name = CONTENT_FILES_COLLECTION_NAME
 
@@ -1083,7 +1266,7 @@ def embed_learning_resources(ids, resource_type, overwrite):  # noqa: PLR0915, C
             )
 
             points_generator_iter = _generate_content_file_points(
-                docs_batch, stored_payloads
+                docs_batch, stored_payloads, cache_stats=embedding_cache_stats
             )
             points_upload_batch = []
 
@@ -1139,6 +1322,15 @@ def embed_learning_resources(ids, resource_type, overwrite):  # noqa: PLR0915, C
             current_batch_docs = []
             gc.collect()
 
+        lookups = embedding_cache_stats.total()
+        if lookups:
+            logger.info(
+                "Chunk embedding cache: %d hits, %d misses (%.1f%% hit rate)",
+                embedding_cache_stats["hits"],
+                embedding_cache_stats["misses"],
+                100 * embedding_cache_stats["hits"] / lookups,
+            )
+
         points = None  # Handled inside the loop
     if points:
         client.batch_update_points(
@@ -1320,6 +1512,17 @@ async def check_missing_content_file_ids(edx_module_ids, collection_name):
     await asyncio.gather(*(_check_index(eid) for eid in present))
 
 
+def _content_file_payload_hits(search_result):
+    """
+    Build content file hits from the Qdrant payloads themselves.
+
+    Chunk payloads carry every field of the serialized content file except its
+    full content (see CONTENT_FILE_RESPONSE_PAYLOAD_FIELDS), so unlike
+    _content_file_vector_hits there is no database lookup to merge in.
+    """
+    return [hit.payload for hit in search_result]
+
+
 def _content_file_vector_hits(search_result):
     run_readable_ids = [hit.payload.get("run_readable_id") for hit in search_result]
     keys = [hit.payload.get("key") for hit in search_result]
@@ -1710,6 +1913,35 @@ def retrieve_points_matching_params(
             break
 
 
+def retrieve_resource_vectors(serialized_resources):
+    """
+    Retrieve the dense vectors for a batch of serialized learning resources
+    with a single Qdrant request.
+
+    Args:
+        serialized_resources (list of dict): serialized learning resources
+    Returns:
+        dict: point id -> dense vector, for points that exist and have a vector
+    """
+    point_ids = [
+        vector_point_id(vector_point_key(resource)) for resource in serialized_resources
+    ]
+    if not point_ids:
+        return {}
+    dense_vector_name = dense_encoder().model_short_name()
+    points = qdrant_client().retrieve(
+        collection_name=RESOURCES_COLLECTION_NAME,
+        ids=point_ids,
+        with_payload=False,
+        with_vectors=[dense_vector_name],
+    )
+    return {
+        str(point.id): point.vector.get(dense_vector_name)
+        for point in points
+        if point.vector and point.vector.get(dense_vector_name)
+    }
+
+
 def custom_score_formula(collection_name: str) -> list[models.MultExpression]:
     """
     Boost scores based on params defined in VECTOR_SEARCH_SCORE_BOOST
@@ -1,12 +1,15 @@
 import asyncio
 import random
+from collections import Counter
 from decimal import Decimal
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from asgiref.sync import async_to_sync
 from django.conf import settings
 from django.contrib.auth.models import Group
+from django.core.cache.backends.locmem import LocMemCache
 from django.urls import reverse
 from langchain_core.documents import Document
 from qdrant_client import models
@@ -37,8 +40,10 @@ from learning_resources_search.serializers import (
     serialize_bulk_content_files,
     serialize_bulk_learning_resources,
 )
+from main.test_utils import ConcurrencyProbe
 from main.utils import checksum_for_content
 from vector_search.constants import (
+    CONTENT_FILE_RESPONSE_PAYLOAD_FIELDS,
     CONTENT_FILES_COLLECTION_NAME,
     QDRANT_CONTENT_FILE_INDEXES,
     QDRANT_CONTENT_FILE_PARAM_MAP,
@@ -64,6 +69,7 @@ from vector_search.encoders.utils import dense_encoder, sparse_encoder
 from vector_search.utils import (
     _chunk_documents,
     _chunk_markdown_documents,
+    _content_file_payload_hits,
     _content_file_vector_hits,
     _embed_course_metadata_as_contentfile,
     _generate_content_file_points,
@@ -83,6 +89,7 @@ from vector_search.utils import (
     qdrant_query_conditions,
     remove_qdrant_records,
     resources_payload_selector,
+    retrieve_resource_vectors,
     should_generate_content_embeddings,
     should_generate_resource_embeddings,
     update_content_file_payload,
@@ -316,6 +323,36 @@ def test_filter_existing_qdrant_points(mocker):
     assert filtered_resources.count() == 7
 
 
+def test_retrieve_resource_vectors(mocker):
+    """
+    retrieve_resource_vectors should fetch a batch of vectors with one request
+    and leave out points that are missing or have no dense vector
+    """
+    mock_qdrant = mocker.patch("qdrant_client.QdrantClient")
+    mocker.patch(
+        "vector_search.utils.qdrant_client",
+        return_value=mock_qdrant,
+    )
+    mock_encoder = mocker.patch("vector_search.utils.dense_encoder")()
+    mock_encoder.model_short_name.return_value = "dense"
+    resources = [
+        {"readable_id": f"r{idx}", "platform": {"code": "ocw"}} for idx in range(3)
+    ]
+    point_ids = [vector_point_id(vector_point_key(doc)) for doc in resources]
+    mock_qdrant.retrieve.return_value = [
+        PointStruct(id=point_ids[0], payload={}, vector={"dense": [0.1, 0.2]}),
+        PointStruct(id=point_ids[1], payload={}, vector={}),
+    ]
+
+    assert retrieve_resource_vectors(resources) == {point_ids[0]: [0.1, 0.2]}
+    mock_qdrant.retrieve.assert_called_once_with(
+        collection_name=RESOURCES_COLLECTION_NAME,
+        ids=point_ids,
+        with_payload=False,
+        with_vectors=["dense"],
+    )
+
+
 @pytest.mark.parametrize(
     ("platform_value", "expected_params"),
     [
@@ -932,6 +969,212 @@ def test_generate_content_points_request_chunk_size_never_zero(mocker):
     assert len(points) == 3
 
 
+def test_generate_content_points_packs_requests_across_documents(mocker):
+    """
+    Chunks from several documents should share embedding requests, with each
+    embedding mapped back to its own document and chunk number
+    """
+    settings.CONTENT_FILE_EMBEDDING_CHUNK_SIZE_OVERRIDE = 500
+    settings.CONTENT_FILE_EMBEDDING_CHUNK_OVERLAP = 50
+    mocker.patch("vector_search.utils._content_file_request_chunk_size", return_value=4)
+    mocker.patch(
+        "vector_search.utils._chunk_documents",
+        side_effect=lambda _texts, docs: [
+            Document(
+                page_content=f"{docs[0]['key']}-{idx}",
+                metadata={"key": docs[0]["key"]},
+            )
+            for idx in range(3)
+        ],
+    )
+    mocker.patch("vector_search.utils.remove_points_matching_params")
+
+    mock_dense = mocker.MagicMock()
+    mock_dense.embed_documents.side_effect = lambda texts: [[0.1] for _ in texts]
+    mock_dense.model_short_name.return_value = "dense"
+    mock_sparse = mocker.MagicMock()
+    mock_sparse.embed_documents.side_effect = lambda texts: [[0.2] for _ in texts]
+    mock_sparse.model_short_name.return_value = "sparse"
+    mocker.patch("vector_search.utils.dense_encoder", return_value=mock_dense)
+    mocker.patch("vector_search.utils.sparse_encoder", return_value=mock_sparse)
+
+    docs = [
+        {
+            "content": "Some plain text content",
+            "file_type": "page",
+            "file_extension": ".html",
+            "platform": {"code": "x"},
+            "resource_readable_id": "r1",
+            "run_readable_id": "run1",
+            "key": f"k{idx}",
+        }
+        for idx in range(6)
+    ]
+
+    points = list(_generate_content_file_points(docs, {}))
+
+    assert [
+        len(call.args[0]) for call in mock_dense.embed_documents.call_args_list
+    ] == [4, 4, 4, 4, 2]
+    assert [
+        (point.payload["key"], point.payload["chunk_number"]) for point in points
+    ] == [(f"k{doc_idx}", chunk) for doc_idx in range(6) for chunk in range(3)]
+    assert all(
+        point.payload["chunk_content"]
+        == f"{point.payload['key']}-{point.payload['chunk_number']}"
+        for point in points
+    )
+    assert all(
+        point.payload["resource_point_id"]
+        == str(vs_utils.vector_point_id(vs_utils.vector_point_key(doc)))
+        for doc in docs
+        for point in points
+        if point.payload["key"] == doc["key"]
+    )
+
+
+def test_generate_content_points_embedding_cache(mocker, settings):
+    """
+    Dense embeddings should be cached by model and chunk text, so only chunks
+    that were never embedded before are sent to the encoder
+    """
+    settings.CONTENT_FILE_EMBEDDING_CHUNK_SIZE_OVERRIDE = 500
+    settings.CONTENT_FILE_EMBEDDING_CHUNK_OVERLAP = 50
+    settings.QDRANT_EMBEDDING_CACHE_ENABLED = True
+    mocker.patch(
+        "vector_search.utils.caches",
+        {"embeddings": LocMemCache("embedding-cache-test", {})},
+    )
+    chunk_texts = {"k1": ["footer", "intro"], "k2": ["footer", "outro"]}
+    mocker.patch(
+        "vector_search.utils._chunk_documents",
+        side_effect=lambda _texts, docs: [
+            Document(page_content=text, metadata={"key": docs[0]["key"]})
+            for text in chunk_texts[docs[0]["key"]]
+        ],
+    )
+    mocker.patch("vector_search.utils.remove_points_matching_params")
+
+    mock_dense = mocker.MagicMock()
+    mock_dense.requires_cloud_inferencing = False
+    mock_dense.model_name = "openai/text-embedding-3-small"
+    mock_dense.embed_documents.side_effect = lambda texts: [
+        [0.5, float(len(text))] for text in texts
+    ]
+    mock_dense.dim.return_value = 2
+    mock_dense.model_short_name.return_value = "dense"
+    mock_sparse = mocker.MagicMock()
+    mock_sparse.embed_documents.side_effect = lambda texts: [[0.2] for _ in texts]
+    mock_sparse.model_short_name.return_value = "sparse"
+    mocker.patch("vector_search.utils.dense_encoder", return_value=mock_dense)
+    mocker.patch("vector_search.utils.sparse_encoder", return_value=mock_sparse)
+
+    def make_doc(key):
+        return {
+            "content": "Some plain text content",
+            "file_type": "page",
+            "file_extension": ".html",
+            "platform": {"code": "x"},
+            "resource_readable_id": "r1",
+            "run_readable_id": "run1",
+            "key": key,
+        }
+
+    first_stats = Counter()
+    first_points = list(
+        _generate_content_file_points([make_doc("k1")], {}, cache_stats=first_stats)
+    )
+    second_stats = Counter()
+    second_points = list(
+        _generate_content_file_points([make_doc("k2")], {}, cache_stats=second_stats)
+    )
+
+    assert [call.args[0] for call in mock_dense.embed_documents.call_args_list] == [
+        ["footer", "intro"],
+        ["outro"],
+    ]
+    assert first_stats == {"hits": 0, "misses": 2}
+    assert second_stats == {"hits": 1, "misses": 1}
+    assert [point.vector["dense"] for point in first_points + second_points] == [
+        [0.5, 6.0],
+        [0.5, 5.0],
+        [0.5, 6.0],
+        [0.5, 5.0],
+    ]
+
+
+def test_embedding_cache_round_trips_float32_per_dimensions(mocker, settings):
+    """
+    Cached embeddings should come back at float32 precision and be keyed by the
+    encoder's dimensions, so a differently sized model never reads them
+    """
+    settings.QDRANT_EMBEDDING_CACHE_ENABLED = True
+    mocker.patch(
+        "vector_search.utils.caches",
+        {"embeddings": LocMemCache("embedding-cache-dims-test", {})},
+    )
+    mocker.patch.dict("vector_search.utils._encoder_dimensions", clear=True)
+    small = mocker.MagicMock(requires_cloud_inferencing=False, model_name="model")
+    small.dim.return_value = 2
+    vector = [0.1234567891, 0.9876543219]
+
+    vs_utils._set_cached_embeddings(small, ["text"], [vector])  # noqa: SLF001
+
+    cached = vs_utils._get_cached_embeddings(small, ["text"], Counter())  # noqa: SLF001
+    assert cached == [np.asarray(vector, dtype=np.float32).tolist()]
+    vs_utils._encoder_dimensions.clear()  # noqa: SLF001
+    small.dim.return_value = 3
+    assert vs_utils._get_cached_embeddings(small, ["text"], Counter()) == [None]  # noqa: SLF001
+
+
+def test_generate_content_points_pipelines_dense_requests(mocker, settings):
+    """
+    Dense embedding requests should run concurrently up to
+    QDRANT_EMBEDDING_MAX_IN_FLIGHT while points are still yielded in order
+    """
+    settings.CONTENT_FILE_EMBEDDING_CHUNK_SIZE_OVERRIDE = 500
+    settings.CONTENT_FILE_EMBEDDING_CHUNK_OVERLAP = 50
+    settings.QDRANT_EMBEDDING_MAX_IN_FLIGHT = 2
+    mocker.patch("vector_search.utils._content_file_request_chunk_size", return_value=1)
+    mocker.patch(
+        "vector_search.utils._chunk_documents",
+        side_effect=lambda _texts, docs: [
+            Document(page_content=f"{docs[0]['key']}-chunk", metadata={})
+        ],
+    )
+    mocker.patch("vector_search.utils.remove_points_matching_params")
+    probe = ConcurrencyProbe(2)
+    mock_dense = mocker.MagicMock()
+    mock_dense.embed_documents.side_effect = probe(lambda texts: [[0.1] for _ in texts])
+    mock_dense.model_short_name.return_value = "dense"
+    mock_sparse = mocker.MagicMock()
+    mock_sparse.embed_documents.side_effect = lambda texts: [[0.2] for _ in texts]
+    mock_sparse.model_short_name.return_value = "sparse"
+    mocker.patch("vector_search.utils.dense_encoder", return_value=mock_dense)
+    mocker.patch("vector_search.utils.sparse_encoder", return_value=mock_sparse)
+
+    docs = [
+        {
+            "content": "Some plain text content",
+            "file_type": "page",
+            "file_extension": ".html",
+            "platform": {"code": "x"},
+            "resource_readable_id": "r1",
+            "run_readable_id": "run1",
+            "key": f"k{idx}",
+        }
+        for idx in range(6)
+    ]
+
+    points = list(_generate_content_file_points(docs, {}))
+
+    assert [point.payload["chunk_content"] for point in points] == [
+        f"k{idx}-chunk" for idx in range(6)
+    ]
+    assert mock_dense.embed_documents.call_count == 6
+    assert probe.peak == 2
+
+
 def test_course_metadata_indexed_with_learning_resources(mocker):
     # test the we embed a metadata document when embedding learning resources
     resources = LearningResourceFactory.create_batch(5)
@@ -1510,6 +1753,55 @@ def test_content_file_vector_hits_hydrates_runless_files():
     assert results[1]["id"] == run_content_file.id
 
 
+def test_content_file_payload_hits_match_hydrated_hits(mocker):
+    """
+    Chunk payloads carry every field the database hydration path merges in, so
+    serving hits from the payload alone returns the same response.
+    """
+    settings.CONTENT_FILE_EMBEDDING_CHUNK_SIZE_OVERRIDE = 500
+    settings.CONTENT_FILE_EMBEDDING_CHUNK_OVERLAP = 50
+    mocker.patch("vector_search.utils.remove_points_matching_params")
+    mock_dense = mocker.MagicMock()
+    mock_dense.embed_documents.side_effect = lambda texts: [[0.1] for _ in texts]
+    mock_dense.model_short_name.return_value = "dense"
+    mock_sparse = mocker.MagicMock()
+    mock_sparse.embed_documents.side_effect = lambda texts: [[0.2] for _ in texts]
+    mock_sparse.model_short_name.return_value = "sparse"
+    mocker.patch("vector_search.utils.dense_encoder", return_value=mock_dense)
+    mocker.patch("vector_search.utils.sparse_encoder", return_value=mock_sparse)
+    content_files = ContentFileFactory.create_batch(2, content="Some file content")
+    serialized = list(serialize_bulk_content_files([cf.id for cf in content_files]))
+
+    points = list(_generate_content_file_points(serialized, {}))
+
+    hydrated = _content_file_vector_hits(
+        [PointStruct(id=1, payload=dict(point.payload), vector=[]) for point in points]
+    )
+    from_payload = _content_file_payload_hits(points)
+    assert from_payload == hydrated
+    assert {hit["id"] for hit in from_payload} == {cf.id for cf in content_files}
+
+
+def test_update_content_file_payload_includes_response_fields(mocker):
+    """Payload refreshes should also write the fields only the response needs"""
+    content_file = ContentFileFactory.create(content="Test content")
+    serialized = next(iter(serialize_bulk_content_files([content_file.id])))
+    mock_qdrant = mocker.MagicMock()
+    mocker.patch("vector_search.utils.qdrant_client", return_value=mock_qdrant)
+    mock_point = mocker.MagicMock()
+    mock_point.id = "test-point-id"
+    mocker.patch(
+        "vector_search.utils.retrieve_points_matching_params", return_value=[mock_point]
+    )
+
+    update_content_file_payload(serialized)
+
+    payload = mock_qdrant.set_payload.call_args[1]["payload"]
+    for field in CONTENT_FILE_RESPONSE_PAYLOAD_FIELDS:
+        assert payload[field] == serialized[field]
+    assert "content" not in payload
+
+
 @pytest.mark.django_db
 def test_embed_learning_resources_summarizes_only_contentfiles_with_summary(mocker):
     """
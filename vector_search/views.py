@@ -1,10 +1,13 @@
 import asyncio
+import json
 import logging
 from collections import Counter
 from functools import wraps
+from hashlib import md5
 from itertools import chain
 
 from django.conf import settings
+from django.core.cache import caches
 from django.utils.decorators import method_decorator
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from qdrant_client import models
@@ -31,7 +34,9 @@ from vector_search.serializers import (
     LearningResourcesVectorSearchResponseSerializer,
 )
 from vector_search.utils import (
+    _content_file_payload_hits,
     _content_file_vector_hits,
+    _embedding_dimensions,
     _merge_dicts,
     _resource_payload_hits,
     _resource_vector_hits,
@@ -49,6 +54,9 @@ from vector_search.utils import (
 
 log = logging.getLogger(__name__)
 
+# request parameters that page through a ranked result set without changing it
+RANKED_RESULTS_UNKEYED_PARAMS = ("q", "offset", "limit", "dev_mode")
+
 
 def _normalize_score_cutoff(value, hybrid_search_enabled):
     try:
@@ -63,6 +71,49 @@ def _normalize_score_cutoff(value, hybrid_search_enabled):
     return max(value, min_score_cutoff)
 
 
+def _retrieve_payload(search_collection):
+    """Return the payload fields search results need from a collection"""
+    if search_collection == RESOURCES_COLLECTION_NAME:
+        return resources_payload_selector()
+    return CONTENT_FILES_RETRIEVE_PAYLOAD
+
+
+def _ranked_results_cache_key(  # noqa: PLR0913
+    query_string, params, search_collection, order_by, score_cutoff, *, hybrid_search
+):
+    """
+    Return the cache key for the ranked results of a score-cutoff search.
+
+    It covers the whitespace-normalized query, the dense encoder model and its
+    dimensions, and every parameter that changes which points match or how
+    they rank, but not offset or limit.
+    """
+    encoder = dense_encoder()
+    filters = {
+        key: value
+        for key, value in params.items()
+        if key not in RANKED_RESULTS_UNKEYED_PARAMS
+    }
+    key_data = json.dumps(
+        [
+            search_collection,
+            [
+                type(encoder).__name__,
+                encoder.model_name,
+                _embedding_dimensions(encoder),
+            ],
+            " ".join(query_string.split()),
+            filters,
+            order_by,
+            score_cutoff,
+            hybrid_search,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return f"vector_search_ranking.{md5(key_data.encode('utf-8')).hexdigest()}"  # noqa: S324
+
+
 def _sort_key(x, field):
     descending = isinstance(field, str) and field.startswith("-")
     field_name = field[1:] if descending else field
@@ -151,9 +202,7 @@ class QdrantView(APIView):
             "collection_name": search_collection,
             "query_filter": search_filter,
             "with_vectors": False,
-            "with_payload": resources_payload_selector()
-            if search_collection == RESOURCES_COLLECTION_NAME
-            else CONTENT_FILES_RETRIEVE_PAYLOAD,
+            "with_payload": _retrieve_payload(search_collection),
             "search_params": models.SearchParams(
                 quantization=models.QuantizationSearchParams(
                     ignore=False,
@@ -279,9 +328,7 @@ class QdrantView(APIView):
             "with_vectors": False,
             # Scroll otherwise defaults to the entire payload, transcripts and
             # all -- ask for the same fields the query path does.
-            "with_payload": resources_payload_selector()
-            if search_collection == RESOURCES_COLLECTION_NAME
-            else CONTENT_FILES_RETRIEVE_PAYLOAD,
+            "with_payload": _retrieve_payload(search_collection),
         }
 
         if order_by:
@@ -333,6 +380,33 @@ class QdrantView(APIView):
         """
         Execute vector search and return hydrated hits
         """
+        search_result = await self._async_vector_points(
+            query_string,
+            params,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            search_collection=search_collection,
+            score_cutoff=score_cutoff,
+            hybrid_search=hybrid_search,
+        )
+        return await self._async_hydrate_hits(search_result, search_collection)
+
+    async def _async_vector_points(  # noqa: PLR0913
+        self,
+        query_string: str,
+        params: dict,
+        order_by: str | None = None,
+        limit: int = 10,
+        offset: int = 0,
+        search_collection=RESOURCES_COLLECTION_NAME,
+        score_cutoff: float | None = None,
+        *,
+        hybrid_search: bool = False,
+    ):
+        """
+        Execute vector search and return the matching points
+        """
         client = async_qdrant_client()
         encoder_dense = dense_encoder()
         encoder_sparse = sparse_encoder()
@@ -393,13 +467,20 @@ class QdrantView(APIView):
                 offset,
                 order_by,
             )
+        return search_result
 
+    async def _async_hydrate_hits(self, search_result, search_collection):
+        """
+        Return the hits for points from a vector search
+        """
         if search_collection == RESOURCES_COLLECTION_NAME:
             if settings.VECTOR_SEARCH_RESOURCES_FROM_PAYLOAD:
                 # Payloads are already the serialized resources -- no database
                 # round trip, so no thread hop either.
                 return _resource_payload_hits(search_result)
             return await db_sync_to_async(_resource_vector_hits)(search_result)
+        elif settings.VECTOR_SEARCH_CONTENT_FILES_FROM_PAYLOAD:
+            return _content_file_payload_hits(search_result)
         else:
             return await db_sync_to_async(_content_file_vector_hits)(search_result)
 
@@ -480,6 +561,88 @@ class QdrantView(APIView):
             "aggregations": aggregations,
         }
 
+    async def _async_retrieve_points(self, point_ids, search_collection):
+        """
+        Fetch points by id, in the order of point_ids
+        """
+        client = async_qdrant_client()
+        records = await client.retrieve(
+            collection_name=search_collection,
+            ids=point_ids,
+            with_payload=_retrieve_payload(search_collection),
+            with_vectors=False,
+        )
+        records_by_id = {record.id: record for record in records}
+        return [
+            records_by_id[point_id]
+            for point_id in point_ids
+            if point_id in records_by_id
+        ]
+
+    async def _async_score_cutoff_results(  # noqa: PLR0913
+        self,
+        query_string: str,
+        params: dict,
+        order_by: str | None,
+        search_collection,
+        score_cutoff: float,
+        *,
+        hybrid_search: bool,
+    ):
+        """
+        Return the hits and counts of a score-cutoff search.
+
+        These searches fetch VECTOR_SEARCH_PAGE_MAX_LIMIT points and count
+        facets over all of them. The ranked point ids and the counts are cached
+        for VECTOR_SEARCH_RANKED_RESULTS_CACHE_DURATION seconds, so another page
+        of the same search only retrieves and hydrates the cached points instead
+        of embedding the query and searching again.
+        """
+        cache = caches["redis"]
+        cache_key = None
+        # grouped hits are keyed by the group value, not a point id
+        if settings.VECTOR_SEARCH_RANKED_RESULTS_CACHE_DURATION and (
+            "group_by" not in params
+        ):
+            # the encoder dimensions may take a request to compute the first time
+            cache_key = await db_sync_to_async(_ranked_results_cache_key)(
+                query_string,
+                params,
+                search_collection,
+                order_by,
+                score_cutoff,
+                hybrid_search=hybrid_search,
+            )
+            cached = await cache.aget(cache_key)
+            if cached is not None:
+                search_result = await self._async_retrieve_points(
+                    cached["ids"], search_collection
+                )
+                hits = await self._async_hydrate_hits(search_result, search_collection)
+                return hits, cached["counts"]
+
+        search_result = await self._async_vector_points(
+            query_string,
+            params,
+            order_by=order_by,
+            limit=settings.VECTOR_SEARCH_PAGE_MAX_LIMIT,
+            offset=0,
+            search_collection=search_collection,
+            score_cutoff=score_cutoff,
+            hybrid_search=hybrid_search,
+        )
+        hits = await self._async_hydrate_hits(search_result, search_collection)
+        counts = await self._async_vector_resource_counts(
+            hits, params, search_collection=search_collection
+        )
+        if cache_key:
+            await cache.aset(
+                cache_key,
+                {"ids": [point.id for point in search_result], "counts": counts},
+                timeout=settings.VECTOR_SEARCH_RANKED_RESULTS_CACHE_DURATION,
+            )
+        return hits, counts
+
     async def _async_vector_counts(
         self,
         params: dict,
@@ -534,14 +697,12 @@ class QdrantView(APIView):
     ):
         normalized_score = _normalize_score_cutoff(score_cutoff, hybrid_search)
         if query_string and normalized_score is not None:
-            hits = await self._async_vector_hits(
+            hits, counts = await self._async_score_cutoff_results(
                 query_string,
                 params,
-                order_by=order_by,
-                limit=settings.VECTOR_SEARCH_PAGE_MAX_LIMIT,
-                offset=0,
-                search_collection=search_collection,
-                score_cutoff=normalized_score,
+                order_by,
+                search_collection,
+                normalized_score,
                 hybrid_search=hybrid_search,
             )
             if order_by:
@@ -555,9 +716,6 @@ class QdrantView(APIView):
                     key=lambda x: _sort_key(x, order_by_field),
                     reverse=descending,
                 )
-            counts = await self._async_vector_resource_counts(
-                hits, params, search_collection=search_collection
-            )
 
             return {
                 "hits": hits,
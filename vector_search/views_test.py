@@ -3,6 +3,7 @@ from datetime import timedelta
 
 import pytest
 from django.contrib.auth.models import Group
+from django.core.cache.backends.locmem import LocMemCache
 from django.urls import reverse
 from django.utils import timezone
 from qdrant_client import models
@@ -21,7 +22,7 @@ from vector_search.constants import (
     RESOURCES_RETRIEVE_PAYLOAD,
 )
 from vector_search.encoders.utils import dense_encoder, sparse_encoder
-from vector_search.views import QdrantView
+from vector_search.views import QdrantView, _ranked_results_cache_key
 
 
 @pytest.fixture
@@ -796,6 +797,67 @@ def test_vector_search_sortby_with_score_cutoff_manually_sorted(mocker, client):
     assert [r["views"] for r in results] == [50, 100, 200]
 
 
+def test_vector_search_score_cutoff_reuses_ranked_results(mocker, client, mock_qdrant):
+    """
+    Another page of the same score-cutoff search should retrieve the cached
+    ranked points instead of running the vector search again
+    """
+    mocker.patch(
+        "vector_search.views.caches",
+        {"redis": LocMemCache("vector-search-ranking", {})},
+    )
+    points = [
+        mocker.MagicMock(
+            id=f"point-{idx}", payload={"readable_id": f"course-{idx}", "views": idx}
+        )
+        for idx in range(3)
+    ]
+    mock_qdrant.query_points.return_value.points = points
+    mock_qdrant.retrieve = mocker.AsyncMock(return_value=points[::-1])
+    params = {
+        "q": "test",
+        "hybrid_search": True,
+        "score_cutoff": 0.6,
+        "sortby": "-views",
+    }
+    url = reverse("vector_search:v0:vector_learning_resources_search")
+
+    first = client.get(url, data={**params, "offset": 0}).json()
+    second = client.get(url, data={**params, "offset": 10, "q": " test "}).json()
+
+    assert mock_qdrant.query_points.call_count == 1
+    mock_qdrant.retrieve.assert_called_once()
+    assert mock_qdrant.retrieve.call_args.kwargs["ids"] == [
+        "point-0",
+        "point-1",
+        "point-2",
+    ]
+    assert [r["views"] for r in first["results"]] == [2, 1, 0]
+    assert second["results"] == first["results"]
+    assert second["count"] == first["count"]
+
+    client.get(url, data={**params, "topic": ["physics"]})
+    assert mock_qdrant.query_points.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("model_name", "dimensions"), [("other-model", 384), ("dense-model", 768)]
+)
+def test_ranked_results_cache_key_dense_model(mocker, model_name, dimensions):
+    """Ranked results should not be shared across dense models or dimensions"""
+    encoder = mocker.MagicMock(model_name="dense-model")
+    mocker.patch("vector_search.views.dense_encoder", return_value=encoder)
+    mock_dimensions = mocker.patch(
+        "vector_search.views._embedding_dimensions", return_value=384
+    )
+    args = ("test", {"topic": ["physics"]}, "resources", "-views", 0.6)
+    key = _ranked_results_cache_key(*args, hybrid_search=True)
+
+    encoder.model_name = model_name
+    mock_dimensions.return_value = dimensions
+    assert _ranked_results_cache_key(*args, hybrid_search=True) != key
+
+
 @pytest.mark.parametrize("hybrid_search", [True, False])
 def test_vector_search_with_score_cutoff_enforces_min_score(
     mocker, client, settings, hybrid_search
@@ -1397,3 +1459,35 @@ def test_vector_search_kill_switch_hydrates_from_database(mocker, client, settin
     assert response.status_code == 200
     assert [result["id"] for result in response.json()["results"]] == [resource.id]
     payload_hits.assert_not_called()
+
+
+@pytest.mark.parametrize("from_payload", [True, False])
+def test_content_file_search_hydration_setting(mocker, client, settings, from_payload):
+    """Content file hits come from the payload only when the setting is on"""
+    settings.VECTOR_SEARCH_CONTENT_FILES_FROM_PAYLOAD = from_payload
+    mock_qdrant = mocker.patch(
+        "qdrant_client.AsyncQdrantClient", return_value=mocker.AsyncMock()
+    )()
+    mock_result = mocker.MagicMock()
+    point = mocker.MagicMock()
+    point.payload = {"key": "key1", "run_readable_id": "run1"}
+    mock_result.points = [point]
+    mock_qdrant.query_points = mocker.AsyncMock(return_value=mock_result)
+    mock_qdrant.scroll = mocker.AsyncMock(return_value=([], None))
+    mock_qdrant.count = mocker.AsyncMock(return_value=CountResult(count=1))
+    mocker.patch("vector_search.views.async_qdrant_client", return_value=mock_qdrant)
+    payload_hits = mocker.patch(
+        "vector_search.views._content_file_payload_hits", return_value=[]
+    )
+    hydrated_hits = mocker.patch(
+        "vector_search.views._content_file_vector_hits", return_value=[]
+    )
+
+    response = client.get(
+        reverse("vector_search:v0:vector_content_files_search"),
+        data={"q": "test"},
+    )
+
+    assert response.status_code == 200
+    assert payload_hits.called is from_payload
+    assert hydrated_hits.called is not from_payload